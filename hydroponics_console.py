@@ -1,28 +1,37 @@
+import copy
 import os
+import posixpath
 import socket
+import ssl
 import sys
 import threading
+import queue
 import logging
+from logging.handlers import MemoryHandler, RotatingFileHandler
+import re
+import shlex
 from zeroconf import ServiceBrowser, Zeroconf
 from cmd2 import Cmd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.connection import HTTPConnection
 import json
+import hashlib
 from apscheduler.schedulers.background import BackgroundScheduler
-from datetime import datetime, timedelta
+from apscheduler.jobstores.base import JobLookupError
+from datetime import date, datetime, timedelta, time as dt_time
 from typing import Optional
 import time
-import math
+import random
 import tkinter as tk
 from tkinter import messagebox, ttk, filedialog
 from tkcalendar import Calendar, DateEntry
 import csv
-from collections import deque
-import matplotlib
-matplotlib.use('TkAgg')  # Use TkAgg backend for embedding in tkinter
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import matplotlib.dates as mdates
+from collections import OrderedDict, deque
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
+import numpy as np
 
 # Add SQLite for persistent historical data storage
 import sqlite3
@@ -86,11 +95,18 @@ NOTES:
 """
 
 # Setup Logging
+LOG_FORMAT = '%(asctime)s [%(levelname)s] %(message)s'
+# The log file rotates at 1 MB and is written in small batches: records are buffered
+# until LOG_BUFFER_RECORDS have piled up, a warning arrives, or the interpreter exits.
+# Kept small so INFO records don't sit in memory for long on a quiet console
+LOG_BUFFER_RECORDS = 10
+log_file_handler = RotatingFileHandler("hydroponics.log", maxBytes=1_000_000, backupCount=3)
+log_file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s',
+    format=LOG_FORMAT,
     handlers=[
-        logging.FileHandler("hydroponics.log"),
+        MemoryHandler(LOG_BUFFER_RECORDS, flushLevel=logging.WARNING, target=log_file_handler),
         logging.StreamHandler(sys.stdout)
     ]
 )
@@ -106,13 +122,344 @@ client_cert = os.path.join(certs_dir, 'client.crt')
 client_key = os.path.join(certs_dir, 'client.key')
 schedules_file = os.path.join(script_dir, 'schedules.json')
 
+# Keep-alive connections per device host; callers block for a free one rather than open more
+HTTP_POOL_SIZE = 4
+
+# Printed by 'led' when called without arguments
+LED_USAGE = """Usage: led <value> [channel]
+  value: 0-100 (PWM percentage)
+  channel: 1-4 (optional, sets specific channel)
+Examples:
+  led 100       - Set all LEDs to 100%
+  led 50 2      - Set channel 2 to 50%"""
+
+# Schedule edits within this many seconds of each other are written to disk together
+SCHEDULES_SAVE_DELAY = 0.25
+
+# Seconds the writer thread backs off after a failed schedules save before retrying
+SCHEDULES_RETRY_DELAY = 5
+
+# HH:MM start times as accepted by strptime("%H:%M") (one- or two-digit fields)
+HHMM_RE = re.compile(r"([01]?\d|2[0-3]):([0-5]?\d)")
+# YYYY-MM-DD plant start dates; days past the 28th still need a month-length check
+DATE_RE = re.compile(r"(\d{4})-(0?[1-9]|1[0-2])-(0?[1-9]|[12]\d|3[01])")
+
+# Weekday names as stored in schedules.json -> APScheduler cron abbreviations
+DAY_ABBREVIATIONS = {
+    'monday': 'mon',
+    'tuesday': 'tue',
+    'wednesday': 'wed',
+    'thursday': 'thu',
+    'friday': 'fri',
+    'saturday': 'sat',
+    'sunday': 'sun'
+}
+
+def parse_hhmm(text):
+    """Return a time for an HH:MM string, or None if it is not one."""
+    match = HHMM_RE.fullmatch(text)
+    if not match:
+        return None
+    return dt_time(int(match.group(1)), int(match.group(2)))
+
+def date_days_ago(days=0):
+    """YYYY-MM-DD string for today minus `days` days, as used by the start-date presets."""
+    return (datetime.now().date() - timedelta(days=days)).isoformat()
+
+def is_valid_date(text):
+    """Return True if text is a real YYYY-MM-DD date."""
+    match = DATE_RE.fullmatch(text)
+    if not match:
+        return False
+    year, month, day = map(int, match.groups())
+    if day <= 28:
+        return year > 0
+    # Only month-length checks (Feb 30, Apr 31, ...) need a real date
+    try:
+        date(year, month, day)
+    except ValueError:
+        return False
+    return True
+
 # Global dictionary to store discovered devices
 devices = {}
-
-# Initialize the scheduler
-scheduler = BackgroundScheduler()
+# Device names in discovery order, so "select <n>" is a list index; both are
+# written by the discovery worker, so take devices_lock to change or iterate them
+device_order = []
+devices_lock = threading.RLock()
+# Set whenever a device is added or removed; the device selector redraws only then
+devices_changed = threading.Event()
+
+# Initialize the scheduler.  Jobs live in memory (rebuilt from schedules.json); a run
+# that was held up briefly still fires, and several missed runs collapse into one
+scheduler = BackgroundScheduler(job_defaults={'coalesce': True, 'misfire_grace_time': 60, 'max_instances': 1})
 scheduler.start()
 
+# Worker threads for blocking device I/O triggered from the GUI
+io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="growpod-io")
+
+# Speculative fetches (filesystem browser prefetch) get a single worker of their own so
+# they never queue ahead of requests the user is waiting for on io_pool
+prefetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="growpod-prefetch")
+
+def when_done(widget, futures, callback, poll_ms=50, on_error=None):
+    """
+    Poll futures from the Tk main thread and call callback(*results) once all are done.
+    Keeps blocking HTTP calls off the Tk thread without touching widgets from workers.
+    If any future raised, the error is logged and on_error(exc) runs instead of callback,
+    so callers can re-enable buttons or clear their in-flight flags.
+    """
+    def poll():
+        try:
+            if not all(future.done() for future in futures):
+                widget.after(poll_ms, poll)
+                return
+            errors = [future.exception() for future in futures if future.exception() is not None]
+            if errors:
+                logger.error(f"Background request failed: {errors[0]}")
+                if on_error:
+                    on_error(errors[0])
+            else:
+                callback(*[future.result() for future in futures])
+        except tk.TclError:
+            pass  # Widget was destroyed while waiting
+    poll()
+
+# Pending debounce timers, keyed by (widget path, caller key)
+debounce_ids = {}
+
+def debounce(widget, key, ms, fn):
+    """
+    Run fn once input has been quiet for `ms`; every call with the same key restarts the timer.
+    Collapses bursts of keystroke/trace callbacks into a single redraw.
+    """
+    full_key = (str(widget), key)
+    after_id = debounce_ids.pop(full_key, None)
+    if after_id is not None:
+        widget.after_cancel(after_id)
+    
+    def run():
+        debounce_ids.pop(full_key, None)
+        fn()
+    
+    debounce_ids[full_key] = widget.after(ms, run)
+
+def sync_listbox(listbox, shown_items, new_items):
+    """
+    Make a Listbox show new_items, touching only the rows between the common prefix and suffix.
+    
+    Args:
+        listbox: tk.Listbox to update
+        shown_items: list mirroring the Listbox contents; updated in place
+        new_items: list of strings the Listbox should show
+    """
+    limit = min(len(shown_items), len(new_items))
+    start = 0
+    while start < limit and shown_items[start] == new_items[start]:
+        start += 1
+    
+    end_old, end_new = len(shown_items), len(new_items)
+    while end_old > start and end_new > start and shown_items[end_old - 1] == new_items[end_new - 1]:
+        end_old -= 1
+        end_new -= 1
+    
+    if end_old > start:
+        listbox.delete(start, end_old - 1)
+    if end_new > start:
+        listbox.insert(start, *new_items[start:end_new])
+    shown_items[start:end_old] = new_items[start:end_new]
+
+def set_label(label, **options):
+    """
+    Configure a Label only with the options whose value actually changed.
+    Saves a configure (and redraw) when a refresh reproduces the same text/colour.
+    """
+    changed = {key: value for key, value in options.items() if str(label.cget(key)) != str(value)}
+    if changed:
+        label.config(**changed)
+
+# Hit/miss counts per device cache, shown by the cache_stats command
+cache_stats = {}
+
+def count_cache(name, hit):
+    """Record a hit or miss for the named cache."""
+    counts = cache_stats.setdefault(name, [0, 0])
+    counts[0 if hit else 1] += 1
+
+# Device fetches currently running, keyed like the caches, so concurrent misses share one request
+inflight_fetches = {}
+inflight_lock = threading.Lock()
+
+def single_flight(key, fn, *args):
+    """
+    Return fn(*args); if another thread is already running the call for `key`,
+    wait for it and share its result instead of sending a duplicate request.
+    """
+    with inflight_lock:
+        future = inflight_fetches.get(key)
+        leader = future is None
+        if leader:
+            future = inflight_fetches[key] = Future()
+    if not leader:
+        return future.result()
+    
+    try:
+        result = fn(*args)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with inflight_lock:
+            del inflight_fetches[key]
+
+# Short-lived cache of saved hourly schedules, keyed by (device_name, schedule_type)
+SAVED_SCHEDULE_TTL = 30  # seconds
+saved_schedule_cache = {}
+
+# Routines that overwrite a saved schedule, mapped to the schedule type they change
+SCHEDULE_ROUTINE_TYPES = {
+    "light_schedule": "light",
+    "planter_pod_schedule": "planter",
+}
+
+def fetch_saved_schedule_cached(console_instance, schedule_type, ttl=SAVED_SCHEDULE_TTL):
+    """
+    Return the device's saved schedule, reusing a fetch from the last `ttl` seconds.
+    Entries are invalidated by HydroponicsConsole._post_routine when a schedule is saved.
+    Returns None if the device could not be read; failures are not cached.
+    """
+    key = (console_instance.selected_device, schedule_type)
+    now = time.monotonic()
+    cached = saved_schedule_cache.get(key)
+    if cached and now - cached[0] < ttl:
+        count_cache("saved_schedule", True)
+        return list(cached[1])
+    count_cache("saved_schedule", False)
+    
+    schedule = single_flight(("saved_schedule",) + key, console_instance._fetch_saved_schedule, schedule_type, False)
+    if schedule is None:
+        return None
+    saved_schedule_cache[key] = (now, schedule)
+    return list(schedule)
+
+# Plant info changes once per grow (days_growing once a day); keyed by device name
+# and dropped by HydroponicsConsole._set_plant_info after a successful save
+PLANT_INFO_TTL = 60  # seconds
+plant_info_cache = {}
+
+def fetch_plant_info_cached(console_instance, ttl=PLANT_INFO_TTL):
+    """
+    Return the device's plant info, reusing a fetch from the last `ttl` seconds.
+    Failed fetches (None) are not cached.
+    """
+    key = console_instance.selected_device
+    now = time.monotonic()
+    cached = plant_info_cache.get(key)
+    if cached and now - cached[0] < ttl:
+        count_cache("plant_info", True)
+        return cached[1]
+    count_cache("plant_info", False)
+    
+    info = single_flight(("plant_info", key), console_instance._get_plant_info)
+    if info:
+        plant_info_cache[key] = (now, info)
+    return info
+
+# Filesystem tab caches: directory listings expire after FS_LISTING_TTL seconds,
+# file contents after FILE_CONTENT_TTL seconds or as soon as the listed size changes
+# (the device reports no modification times, so a same-size edit waits out the TTL)
+FS_LISTING_TTL = 5  # seconds
+FILE_CONTENT_TTL = 10  # seconds
+FILE_CONTENT_CACHE_SIZE = 32
+fs_listing_cache = {}
+file_content_cache = {}
+
+# File viewer limits: skip JSON reformatting above PRETTY_PRINT_MAX characters
+# and insert content into the Text widget CONTENT_CHUNK_SIZE characters at a time
+PRETTY_PRINT_MAX = 64 * 1024
+CONTENT_CHUNK_SIZE = 8192
+# Rows shown in the Filesystem tab before the rest are collapsed into a marker row
+FILE_LIST_MAX_ROWS = 500
+
+# Pretty-printed JSON per (path, content digest), so reopening an unchanged file skips the parse
+PRETTY_JSON_CACHE_SIZE = 16
+pretty_json_cache = OrderedDict()
+
+def is_raw_json_view(path, content):
+    """True for .json files too large to re-indent; the viewers note this in their status line."""
+    return path.endswith('.json') and len(content) >= PRETTY_PRINT_MAX
+
+def format_file_content(path, content):
+    """
+    Return content re-indented if path is a .json file that parses, else content unchanged.
+    Files of PRETTY_PRINT_MAX characters or more are returned as-is.
+    """
+    if not path.endswith('.json') or is_raw_json_view(path, content):
+        return content
+    
+    key = (path, hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest())
+    formatted = pretty_json_cache.get(key)
+    if formatted is not None:
+        pretty_json_cache.move_to_end(key)
+        return formatted
+    
+    try:
+        formatted = json.dumps(json.loads(content), indent=2)
+    except ValueError:
+        formatted = content  # Not valid JSON, display as-is
+    pretty_json_cache[key] = formatted
+    if len(pretty_json_cache) > PRETTY_JSON_CACHE_SIZE:
+        pretty_json_cache.popitem(last=False)
+    return formatted
+
+# Standalone filesystem browser: after a listing loads, the first few subdirectories
+# and the parent are fetched one at a time on prefetch_pool; results are reused for
+# FS_PREFETCH_TTL, and prefetches not yet started are dropped when the user navigates
+FS_PREFETCH_DIRS = 4
+FS_PREFETCH_TTL = 30  # seconds
+FS_PREFETCH_CACHE_SIZE = 64
+
+def fetch_filesystem_listing_cached(console_instance, path, ttl=FS_LISTING_TTL):
+    """
+    Return the device's listing of `path`, reusing a fetch from the last `ttl` seconds.
+    Failed fetches (None) are not cached.
+    """
+    key = (console_instance.selected_device, path)
+    now = time.monotonic()
+    cached = fs_listing_cache.get(key)
+    if cached and now - cached[0] < ttl:
+        count_cache("fs_listing", True)
+        return cached[1]
+    count_cache("fs_listing", False)
+    
+    listing = single_flight(("fs_listing",) + key, console_instance._get_filesystem_listing, path)
+    if listing:
+        fs_listing_cache[key] = (now, listing)
+    return listing
+
+def read_file_content_cached(console_instance, path, size, ttl=FILE_CONTENT_TTL):
+    """
+    Return the device's file content for `path`, reusing a read of the same size
+    from the last `ttl` seconds.
+    """
+    key = (console_instance.selected_device, path, size)
+    now = time.monotonic()
+    cached = file_content_cache.get(key)
+    if cached and now - cached[0] < ttl:
+        count_cache("file_content", True)
+        return cached[1]
+    count_cache("file_content", False)
+    
+    result = console_instance._read_file_content(path)
+    if result and result.get('size') == size:
+        if len(file_content_cache) >= FILE_CONTENT_CACHE_SIZE:
+            file_content_cache.clear()
+        file_content_cache[key] = (now, result)
+    return result
+
 # =============================================================================
 # Sensor Data Storage and Graphing
 # =============================================================================
@@ -124,6 +471,20 @@ os.makedirs(data_dir, exist_ok=True)
 # In-memory data storage for graphing (last N readings)
 MAX_GRAPH_POINTS = 100  # Keep last 100 data points in memory for graphing
 
+# Hourly LED presets for the Light & Planter tab (24 values, 0-100%)
+LIGHT_PRESETS = {
+    "off": (0,) * 24,
+    "full": (100,) * 24,
+    # Sunrise 6am, sunset 8pm
+    "day_night": tuple(100 if 6 <= hour < 20 else 0 for hour in range(24)),
+    # Gradual sunrise/sunset
+    "gradual": (0, 0, 0, 0, 0, 10, 30, 60, 80, 100, 100, 100,
+                100, 100, 100, 100, 100, 100, 80, 60, 30, 10, 0, 0),
+}
+
+# Maximum number of pending reading batches waiting for the database writer thread
+WRITE_QUEUE_SIZE = 64
+
 class SensorDatabase:
     """Handles persistent sensor data storage using SQLite"""
     
@@ -133,6 +494,7 @@ class SensorDatabase:
         self.conn = None
         self._connect()
         self._create_schema()
+        self._start_writer()
     
     def _connect(self):
         """Establish database connection"""
@@ -182,21 +544,82 @@ class SensorDatabase:
         self.conn.commit()
         logging.info(f"Database initialized: {self.db_path}")
     
-    def insert_readings(self, readings):
+    def _start_writer(self):
+        """Start the background thread that serializes all queued writes"""
+        self._write_queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop,
+            name=f"{self.device_name}-db-writer",
+            daemon=True
+        )
+        self._writer_thread.start()
+    
+    def _writer_loop(self):
+        """
+        Writer thread main loop. Uses its own connection (WAL allows the Tk thread
+        to keep reading) and commits everything queued so far in one transaction,
+        then resolves each queued item's future with its write's result (rows
+        inserted for readings). A None item stops the loop after the current batch
+        is written.
+        """
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        try:
+            while True:
+                batch = [self._write_queue.get()]
+                try:
+                    while True:
+                        batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    pass
+                
+                items = [item for item in batch if item is not None]
+                try:
+                    results = [write(conn) for write, _ in items]
+                    conn.commit()
+                except sqlite3.Error as e:
+                    conn.rollback()
+                    logging.error(f"Database writer failed: {e}")
+                    for _, stored in items:
+                        stored.set_exception(e)
+                else:
+                    for (_, stored), result in zip(items, results):
+                        stored.set_result(result)
+                    new_rows = sum(result or 0 for result in results)
+                    if new_rows:
+                        logging.info(f"Database writer stored {new_rows} new entries")
+                finally:
+                    for _ in batch:
+                        self._write_queue.task_done()
+                
+                if None in batch:
+                    break
+        finally:
+            conn.close()
+    
+    def enqueue_readings(self, readings):
         """
-        Insert multiple sensor readings (batch insert)
+        Queue sensor readings for insertion by the writer thread (non-blocking
+        unless the queue is full)
         
         Args:
             readings: List of dicts with keys matching column names
                      Each dict must have 'timestamp' key
         
         Returns:
-            Number of rows inserted (duplicates are ignored)
+            Future resolved with the number of rows inserted (duplicates are ignored)
         """
-        if not readings:
-            return 0
-        
-        cursor = self.conn.cursor()
+        stored = Future()
+        if readings:
+            self._write_queue.put((lambda conn: self._insert_rows(conn, readings), stored))
+        else:
+            stored.set_result(0)
+        return stored
+    
+    @staticmethod
+    def _insert_rows(conn, readings):
+        """Insert readings on the writer's connection without committing, returning rows inserted"""
+        cursor = conn.cursor()
         
         insert_sql = """
             INSERT OR IGNORE INTO sensor_readings 
@@ -221,10 +644,36 @@ class SensorDatabase:
             ))
         
         cursor.executemany(insert_sql, rows)
-        inserted = cursor.rowcount
-        self.conn.commit()
+        return cursor.rowcount
+    
+    def get_metadata(self, key):
+        """
+        Get a value from the sync_metadata table
+        
+        Returns:
+            The stored string, or None if the key was never set
+        """
+        row = self.conn.execute("SELECT value FROM sync_metadata WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    
+    def set_metadata(self, key, value):
+        """
+        Queue a string for the sync_metadata table, replacing any previous value.
+        The writer thread commits it, so this never blocks on the database; if the
+        write queue is full the value is dropped with a warning.
         
-        return inserted
+        Returns:
+            Future resolved once the value is committed
+        """
+        stored = Future()
+        def write(conn):
+            conn.execute("INSERT OR REPLACE INTO sync_metadata (key, value) VALUES (?, ?)", (key, value))
+        try:
+            self._write_queue.put_nowait((write, stored))
+        except queue.Full:
+            logging.warning(f"Database write queue full, not saving metadata '{key}'")
+            stored.set_exception(queue.Full())
+        return stored
     
     def get_latest_timestamp(self):
         """
@@ -276,6 +725,55 @@ class SensorDatabase:
         # Convert to list of dicts
         return [dict(row) for row in rows]
     
+    # Columns returned by get_readings_soa (timestamp first)
+    SERIES_COLUMNS = (
+        'timestamp', 'temperature_c', 'humidity_rh', 'light_lux',
+        'power_mw', 'current_ma', 'water_level_mm'
+    )
+    
+    def get_readings_soa(self, start_timestamp=None, end_timestamp=None, columns=SERIES_COLUMNS):
+        """
+        Query sensor readings as column arrays (struct-of-arrays) for plotting
+        
+        Args:
+            start_timestamp: Unix timestamp (inclusive), None for no lower bound
+            end_timestamp: Unix timestamp (inclusive), None for no upper bound
+            columns: Column names to fetch; must start with 'timestamp'
+        
+        Returns:
+            Dict mapping column name to a NumPy array. 'timestamp' is int64
+            (float32 cannot hold second precision at Unix epoch), sensor
+            columns are float32 with NULL values stored as NaN.
+        """
+        cursor = self.conn.cursor()
+        cursor.row_factory = None  # Plain tuples, no per-row Row objects
+        
+        query = f"SELECT {', '.join(columns)} FROM sensor_readings WHERE 1=1"
+        params = []
+        
+        if start_timestamp is not None:
+            query += " AND timestamp >= ?"
+            params.append(start_timestamp)
+        
+        if end_timestamp is not None:
+            query += " AND timestamp <= ?"
+            params.append(end_timestamp)
+        
+        query += " ORDER BY timestamp ASC"
+        
+        cursor.execute(query, params)
+        rows = cursor.fetchall()
+        
+        # Transpose rows into one sequence per column
+        column_data = list(zip(*rows)) if rows else [()] * len(columns)
+        
+        result = {columns[0]: np.asarray(column_data[0], dtype=np.int64)}
+        for name, values in zip(columns[1:], column_data[1:]):
+            # Sensors report 3-4 significant digits, float32 halves the working set
+            result[name] = np.asarray(values, dtype=np.float32)  # None -> NaN
+        
+        return result
+    
     def get_count(self, start_timestamp=None, end_timestamp=None):
         """Get count of readings in database within optional time range"""
         cursor = self.conn.cursor()
@@ -310,13 +808,19 @@ class SensorDatabase:
         return dict(row) if row else None
     
     def close(self):
-        """Close database connection"""
+        """Drain pending writes, stop the writer thread and close database connection"""
+        if self._writer_thread.is_alive():
+            self._write_queue.put(None)
+            self._writer_thread.join(timeout=10)
         if self.conn:
             self.conn.close()
             self.conn = None
 
 # Legacy CSV logging removed - all data now stored in SQLite database
 
+# Frequency radio choices shared by the schedule prompt dialogs
+FREQUENCY_CHOICES = (("Daily", "daily"), ("Weekly", "weekly"))
+
 def prompt_schedule_24(initial_schedule=None):
     """
     Opens a Tkinter window with 24 horizontal sliders (one for each hour).
@@ -385,9 +889,7 @@ def prompt_schedule_actuators():
         
         # Validate start time
         start_time_str = start_time_entry.get().strip()
-        try:
-            datetime.strptime(start_time_str, "%H:%M")
-        except ValueError:
+        if not HHMM_RE.fullmatch(start_time_str):
             tk.messagebox.showerror("Error", "Invalid start time format. Use HH:MM (e.g., 18:00)")
             return
         
@@ -500,8 +1002,9 @@ def prompt_schedule_actuators():
     frequency_var = tk.StringVar(value="daily")
     freq_frame = tk.Frame(info_frame)
     freq_frame.grid(row=3, column=1, sticky="w", pady=5)
-    tk.Radiobutton(freq_frame, text="Daily", variable=frequency_var, value="daily", command=toggle_day_selector).pack(side="left", padx=5)
-    tk.Radiobutton(freq_frame, text="Weekly", variable=frequency_var, value="weekly", command=toggle_day_selector).pack(side="left", padx=5)
+    for label, value in FREQUENCY_CHOICES:
+        tk.Radiobutton(freq_frame, text=label, variable=frequency_var, value=value,
+                       command=toggle_day_selector).pack(side="left", padx=5)
     
     # Day of Week (for weekly)
     tk.Label(info_frame, text="Day of Week:", anchor="w").grid(row=4, column=0, sticky="w", pady=5)
@@ -763,9 +1266,7 @@ def prompt_unified_schedule_manager(initial_light_schedule=None, initial_planter
             
             # Validate start time
             start_time_str = routine_start_entry.get().strip()
-            try:
-                datetime.strptime(start_time_str, "%H:%M")
-            except ValueError:
+            if not HHMM_RE.fullmatch(start_time_str):
                 tk.messagebox.showerror("Error", "Invalid start time format. Use HH:MM (e.g., 18:00)")
                 return
             
@@ -813,8 +1314,8 @@ def prompt_unified_schedule_manager(initial_light_schedule=None, initial_planter
         state = 'normal' if enable_routine.get() else 'disabled'
         routine_name_entry.config(state=state)
         routine_start_entry.config(state=state)
-        routine_freq_daily.config(state=state)
-        routine_freq_weekly.config(state=state)
+        for rb in routine_freq_buttons:
+            rb.config(state=state)
         routine_command_menu.config(state=state)
         toggle_day_selector()
 
@@ -1011,15 +1512,19 @@ def prompt_unified_schedule_manager(initial_light_schedule=None, initial_planter
             total = int(food_total_entry.get())
             intervals = int(food_intervals_spinbox.get())
             dose_per_interval = total // intervals if intervals > 0 else 0
-            food_dose_label.config(text=f"{dose_per_interval} ms per feeding")
+            text = f"{dose_per_interval} ms per feeding"
         except ValueError:
-            food_dose_label.config(text="Invalid input")
+            text = "Invalid input"
+        if food_dose_label.cget("text") != text:
+            food_dose_label.config(text=text)
+    
+    # Bind calculation updates, debounced so a burst of keystrokes recalculates once
+    def schedule_dose_calculation(*args):
+        debounce(food_dose_label, "dose", 120, update_dose_calculation)
     
-    # Bind calculation updates
-    food_total_entry.bind("<KeyRelease>", update_dose_calculation)
-    food_intervals_spinbox.bind("<<Increment>>", update_dose_calculation)
-    food_intervals_spinbox.bind("<<Decrement>>", update_dose_calculation)
-    food_intervals_spinbox.bind("<KeyRelease>", update_dose_calculation)
+    food_total_entry.bind("<KeyRelease>", schedule_dose_calculation)
+    food_intervals_spinbox.config(command=schedule_dose_calculation)
+    food_intervals_spinbox.bind("<KeyRelease>", schedule_dose_calculation)
     
     # Calibration section (skeleton for future implementation)
     tk.Label(food_frame, text="", anchor="w").grid(row=5, column=0, pady=5)  # Spacer
@@ -1063,12 +1568,12 @@ def prompt_unified_schedule_manager(initial_light_schedule=None, initial_planter
     routine_freq_var = tk.StringVar(value="daily")
     freq_frame = tk.Frame(routine_frame)
     freq_frame.grid(row=3, column=1, sticky="w", pady=5)
-    routine_freq_daily = tk.Radiobutton(freq_frame, text="Daily", variable=routine_freq_var, 
-                                        value="daily", command=toggle_day_selector, state='disabled')
-    routine_freq_daily.pack(side="left", padx=5)
-    routine_freq_weekly = tk.Radiobutton(freq_frame, text="Weekly", variable=routine_freq_var, 
-                                         value="weekly", command=toggle_day_selector, state='disabled')
-    routine_freq_weekly.pack(side="left", padx=5)
+    routine_freq_buttons = []
+    for label, value in FREQUENCY_CHOICES:
+        rb = tk.Radiobutton(freq_frame, text=label, variable=routine_freq_var,
+                            value=value, command=toggle_day_selector, state='disabled')
+        rb.pack(side="left", padx=5)
+        routine_freq_buttons.append(rb)
     
     # Day of Week (for weekly)
     tk.Label(routine_frame, text="Day of Week:", anchor="w").grid(row=4, column=0, sticky="w", pady=5)
@@ -1206,6 +1711,26 @@ def prompt_unified_schedule_manager(initial_light_schedule=None, initial_planter
 # Unified GUI Launcher - Main Application Interface
 # =============================================================================
 
+def device_get(console_instance, path, **kwargs):
+    """
+    GET a path on the selected device through the console's pooled session.
+    
+    Sync and sensor polling both go through here so they share the same
+    keep-alive connection instead of each opening their own.
+    
+    Args:
+        console_instance: HydroponicsConsole instance with session
+        path: API path starting with '/', e.g. '/api/unit-metrics'
+        **kwargs: Extra arguments for session.get (timeout defaults to 10s)
+    
+    Returns:
+        requests.Response
+    """
+    device_info = devices[console_instance.selected_device]
+    url = f"{device_info['base_url']}{path}"
+    timeout = kwargs.pop('timeout', 10)
+    return console_instance.session.get(url, timeout=timeout, **kwargs)
+
 def sync_historical_data(console_instance, database):
     """
     Sync historical sensor data from device to local database.
@@ -1216,13 +1741,15 @@ def sync_historical_data(console_instance, database):
         database: SensorDatabase instance
     
     Returns:
-        Tuple of (success: bool, new_entries: int, message: str)
+        Tuple of (success: bool, stored: Future, message: str). The readings are
+        written by the database writer thread; `stored` resolves with the number
+        of new entries once they are committed (see sync_summary).
     """
     device_name = console_instance.selected_device
     device_info = devices.get(device_name)
     
     if not device_info:
-        return (False, 0, "Device not found")
+        return (False, None, "Device not found")
     
     # Get the latest timestamp we have in our database
     last_timestamp = database.get_latest_timestamp()
@@ -1231,20 +1758,17 @@ def sync_historical_data(console_instance, database):
     logging.info(f"Latest local timestamp: {last_timestamp}")
     
     try:
-        # Build API URL
-        base_url = f"https://{device_info['address']}:{device_info['port']}"
-        
         if last_timestamp > 0:
             # Request only data since our last timestamp
-            url = f"{base_url}/api/sensor-history?start={last_timestamp + 1}"
+            params = {'start': last_timestamp + 1}
             logging.info(f"Requesting data since timestamp {last_timestamp + 1}")
         else:
             # No existing data, get everything the device has
-            url = f"{base_url}/api/sensor-history"
+            params = None
             logging.info("No existing data, requesting full history")
         
         # Make request with timeout
-        response = console_instance.session.get(url, timeout=30, verify=False)
+        response = device_get(console_instance, "/api/sensor-history", params=params, timeout=30)
         response.raise_for_status()
         
         data = response.json()
@@ -1255,36 +1779,39 @@ def sync_historical_data(console_instance, database):
         logging.info(f"Received {len(readings)} readings from device")
         logging.info(f"Device stats: {stats}")
         
+        # Hand readings to the database writer thread (duplicates are automatically ignored)
+        stored = database.enqueue_readings(readings)
         if readings:
-            # Insert readings into database (duplicates are automatically ignored)
-            inserted = database.insert_readings(readings)
-            
-            # Get updated database stats
-            db_stats = database.get_stats()
-            
-            message = f"Sync complete: {inserted} new entries added"
-            if db_stats:
-                total = db_stats['total_entries']
-                oldest = datetime.fromtimestamp(db_stats['oldest_timestamp']).strftime('%Y-%m-%d %H:%M:%S')
-                newest = datetime.fromtimestamp(db_stats['newest_timestamp']).strftime('%Y-%m-%d %H:%M:%S')
-                message += f"\nDatabase now has {total} total entries"
-                message += f"\nTime range: {oldest} to {newest}"
-            
-            logging.info(message)
-            return (True, inserted, message)
+            message = f"Received {len(readings)} readings, storing them"
         else:
             message = "No new data to sync (database is up to date)"
-            logging.info(message)
-            return (True, 0, message)
+        logging.info(message)
+        return (True, stored, message)
     
     except requests.exceptions.RequestException as e:
         error_msg = f"Failed to sync historical data: {e}"
         logging.error(error_msg)
-        return (False, 0, error_msg)
+        return (False, None, error_msg)
     except Exception as e:
         error_msg = f"Unexpected error during sync: {e}"
         logging.error(error_msg)
-        return (False, 0, error_msg)
+        return (False, None, error_msg)
+
+def sync_summary(database, inserted):
+    """
+    Describe a sync whose readings have been committed, with the database stats.
+    Call on the thread that owns database.conn (the Tk thread).
+    """
+    message = f"Sync complete: {inserted} new entries added"
+    db_stats = database.get_stats()
+    if db_stats and db_stats['total_entries']:
+        total = db_stats['total_entries']
+        oldest = datetime.fromtimestamp(db_stats['oldest_timestamp']).strftime('%Y-%m-%d %H:%M:%S')
+        newest = datetime.fromtimestamp(db_stats['newest_timestamp']).strftime('%Y-%m-%d %H:%M:%S')
+        message += f"\nDatabase now has {total} total entries"
+        message += f"\nTime range: {oldest} to {newest}"
+    logging.info(message)
+    return message
 
 def launch_unified_gui(console_instance):
     """
@@ -1455,6 +1982,14 @@ def create_dashboard_tab(parent_frame, console_instance):
     Shows device metadata, current sensor readings, and system status on the left.
     Shows real-time graphs on the right.
     """
+    # matplotlib is only needed once a dashboard opens; importing it here keeps
+    # console mode and the device selector from paying for it at startup
+    import matplotlib
+    matplotlib.use('TkAgg')  # Use TkAgg backend for embedding in tkinter
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    from matplotlib.figure import Figure
+    import matplotlib.dates as mdates
+    
     # Get device name
     device_name = console_instance.selected_device
     
@@ -1463,13 +1998,18 @@ def create_dashboard_tab(parent_frame, console_instance):
     
     # Sync historical data from device to local database
     logging.info(f"Syncing historical data for {device_name}...")
-    success, new_entries, sync_message = sync_historical_data(console_instance, database)
+    success, stored, sync_message = sync_historical_data(console_instance, database)
     
-    if success:
+    def report_initial_sync(new_entries):
         if new_entries > 0:
+            sync_summary(database, new_entries)
             logging.info(f"[OK] Sync successful: {new_entries} new entries")
         else:
             logging.info("[OK] Database already up to date")
+    
+    if success:
+        # Reported once the writer thread has committed the readings
+        when_done(parent_frame, [stored], report_initial_sync)
     else:
         logging.warning(f"[WARN] Sync failed: {sync_message}")
     
@@ -1530,11 +2070,8 @@ def create_dashboard_tab(parent_frame, console_instance):
     
     plant_info_labels = {}
     
-    def refresh_plant_info():
+    def apply_plant_info(result):
         try:
-            scrollable_frame.log_message("Refreshing plant information...", "info")
-            result = console_instance._get_plant_info()
-            
             if result and result.get('exists'):
                 plant_info_labels['name'].config(text=result.get('plant_name', 'Unknown'))
                 plant_info_labels['date'].config(text=result.get('start_date', 'Unknown'))
@@ -1562,19 +2099,39 @@ def create_dashboard_tab(parent_frame, console_instance):
         plant_info_labels[key] = tk.Label(row_frame, text="Loading...", font=("Arial", 10), fg="#2c3e50", anchor="w")
         plant_info_labels[key].pack(side="left", padx=10)
     
+    # Show the last plant info this console saw for the device straight away;
+    # the first refresh replaces it once the device answers
+    stored_plant_info = [database.get_metadata('plant_info')]
+    if stored_plant_info[0]:
+        try:
+            apply_plant_info(json.loads(stored_plant_info[0]))
+        except ValueError:
+            stored_plant_info[0] = None
+    
     # Current Sensor Readings Section
     sensor_frame = tk.LabelFrame(scrollable_frame, text="Current Sensor Readings", padx=20, pady=15, font=("Arial", 11, "bold"))
     sensor_frame.pack(fill="x", padx=20, pady=10)
     
     sensor_labels = {}
+    last_label_text = {}  # Last text shown per sensor label, to skip redundant repaints
     
-    def refresh_sensors():
+    def set_sensor_label(key, text):
+        """Update a sensor label only if its displayed text changed"""
+        if last_label_text.get(key) != text:
+            sensor_labels[key].config(text=text)
+            last_label_text[key] = text
+    
+    def fetch_sensors():
+        """Runs on the I/O pool; returns (response, error) so failures reach the Tk thread"""
         try:
-            scrollable_frame.log_message("Refreshing sensor data...", "info")
-            device = devices[console_instance.selected_device]
-            url = f"https://{device['address']}:{device['port']}/api/unit-metrics"
-            response = console_instance.session.get(url, timeout=5)
-            
+            return device_get(console_instance, "/api/unit-metrics", timeout=5), None
+        except Exception as e:
+            return None, e
+    
+    def apply_sensors(response, error):
+        try:
+            if error is not None:
+                raise error
             if response.status_code == 200:
                 data = response.json()
                 
@@ -1583,13 +2140,13 @@ def create_dashboard_tab(parent_frame, console_instance):
                     devices[console_instance.selected_device]['mac'] = data['mac_address']
                 
                 # Power metrics
-                sensor_labels['total_current'].config(text=f"{data.get('current_mA', 0):.2f} mA")
-                sensor_labels['total_voltage'].config(text=f"{data.get('voltage_mV', 0):.2f} mV")
-                sensor_labels['total_power'].config(text=f"{data.get('power_consumption_mW', 0):.2f} mW")
+                set_sensor_label('total_current', f"{data.get('current_mA', 0):.2f} mA")
+                set_sensor_label('total_voltage', f"{data.get('voltage_mV', 0):.2f} mV")
+                set_sensor_label('total_power', f"{data.get('power_consumption_mW', 0):.2f} mW")
                 
                 # Water metrics with volume calculation
                 water_level_mm = data.get('water_level_mm', -1)
-                sensor_labels['water_level'].config(text=f"{water_level_mm} mm" if water_level_mm >= 0 else "N/A")
+                set_sensor_label('water_level', f"{water_level_mm} mm" if water_level_mm >= 0 else "N/A")
                 
                 # Calculate volume from water level
                 # 4" PVC tube inner diameter ≈ 97.6mm, radius = 48.8mm
@@ -1598,43 +2155,43 @@ def create_dashboard_tab(parent_frame, console_instance):
                 if water_level_mm >= 0:
                     TUBE_RADIUS_MM = 48.8  # 4" PVC inner radius
                     volume_ml = 3.14159 * (TUBE_RADIUS_MM ** 2) * water_level_mm / 1000
-                    sensor_labels['water_volume'].config(text=f"{volume_ml:.1f} ml")
+                    set_sensor_label('water_volume', f"{volume_ml:.1f} ml")
                     
                     # Calculate percentage (assuming 80mm max height = ~600ml capacity)
                     MAX_HEIGHT_MM = 80
                     max_volume_ml = 3.14159 * (TUBE_RADIUS_MM ** 2) * MAX_HEIGHT_MM / 1000
                     percentage = (volume_ml / max_volume_ml) * 100
-                    sensor_labels['water_percentage'].config(text=f"{percentage:.1f}%")
+                    set_sensor_label('water_percentage', f"{percentage:.1f}%")
                 else:
-                    sensor_labels['water_volume'].config(text="N/A")
-                    sensor_labels['water_percentage'].config(text="N/A")
+                    set_sensor_label('water_volume', "N/A")
+                    set_sensor_label('water_percentage', "N/A")
                 
                 # Environment sensors
                 temp_c = data.get('temperature_c', -999)
                 humidity = data.get('humidity_rh', -999)
                 if temp_c != -999:
                     temp_f = (temp_c * 9/5) + 32
-                    sensor_labels['temperature'].config(text=f"{temp_c:.1f}°C ({temp_f:.1f}°F)")
+                    set_sensor_label('temperature', f"{temp_c:.1f}°C ({temp_f:.1f}°F)")
                 else:
-                    sensor_labels['temperature'].config(text="N/A")
+                    set_sensor_label('temperature', "N/A")
                 
                 if humidity != -999:
-                    sensor_labels['humidity'].config(text=f"{humidity:.1f}%")
+                    set_sensor_label('humidity', f"{humidity:.1f}%")
                 else:
-                    sensor_labels['humidity'].config(text="N/A")
+                    set_sensor_label('humidity', "N/A")
                 
                 # Light sensor
                 lux = data.get('light_lux', -999)
                 visible = data.get('light_visible', 0)
                 infrared = data.get('light_infrared', 0)
                 if lux != -999:
-                    sensor_labels['light_lux'].config(text=f"{lux:.1f} lux")
-                    sensor_labels['light_visible'].config(text=f"{visible}")
-                    sensor_labels['light_infrared'].config(text=f"{infrared}")
+                    set_sensor_label('light_lux', f"{lux:.1f} lux")
+                    set_sensor_label('light_visible', f"{visible}")
+                    set_sensor_label('light_infrared', f"{infrared}")
                 else:
-                    sensor_labels['light_lux'].config(text="N/A")
-                    sensor_labels['light_visible'].config(text="N/A")
-                    sensor_labels['light_infrared'].config(text="N/A")
+                    set_sensor_label('light_lux', "N/A")
+                    set_sensor_label('light_visible', "N/A")
+                    set_sensor_label('light_infrared', "N/A")
                 
                 # Update graphs with current time range selection
                 update_graphs(current_hours_selection[0])
@@ -1782,14 +2339,41 @@ def create_dashboard_tab(parent_frame, console_instance):
     action_frame = tk.Frame(scrollable_frame)
     action_frame.pack(pady=20)
     
-    def refresh_all():
-        refresh_plant_info()
-        refresh_sensors()
+    refresh_in_flight = [False]
+    
+    def refresh_all(max_age=PLANT_INFO_TTL):
+        """Fetch plant info and sensor metrics in parallel on the I/O pool, then update the labels"""
+        if refresh_in_flight[0]:
+            return  # The previous refresh hasn't landed yet
+        refresh_in_flight[0] = True
+        scrollable_frame.log_message("Refreshing plant information and sensor data...", "info")
+        futures = [
+            io_pool.submit(fetch_plant_info_cached, console_instance, max_age),
+            io_pool.submit(fetch_sensors),
+        ]
+        when_done(scrollable_frame, futures, apply_refresh, on_error=refresh_failed)
+    
+    def refresh_failed(error):
+        refresh_in_flight[0] = False  # Let the next refresh go out
+        scrollable_frame.log_message(f"Refresh failed: {error}", "error")
+    
+    def apply_refresh(plant_info, sensor_result):
+        refresh_in_flight[0] = False
+        apply_plant_info(plant_info)
+        apply_sensors(*sensor_result)
+        # Compare the labels just written with the previous cycle's to pick the next interval
+        update_refresh_interval()
+        if plant_info:
+            # Keep the last answer for the next launch; written only when it changes
+            encoded = json.dumps(plant_info, sort_keys=True)
+            if encoded != stored_plant_info[0]:
+                database.set_metadata('plant_info', encoded)
+                stored_plant_info[0] = encoded
     
     tk.Button(
         action_frame,
         text="🔄 Refresh All Data",
-        command=refresh_all,
+        command=lambda: refresh_all(max_age=0),  # Explicit refresh goes to the device
         font=("Arial", 12, "bold"),
         bg="#3498db",
         fg="white",
@@ -1842,7 +2426,7 @@ def create_dashboard_tab(parent_frame, console_instance):
             variable=selected_time_range,
             value=value,
             command=lambda h=hours: set_time_range(h),
-            font=("Arial", 9),
+            font=FONT_SMALL,
             bg="#ecf0f1",
             activebackground="#ecf0f1",
             selectcolor="#3498db",
@@ -2020,6 +2604,24 @@ def create_dashboard_tab(parent_frame, console_instance):
     line_water, = ax_water.plot([], [], 'cyan', label='Water Level (mm)', linewidth=2, marker='o', markersize=3)
     ax_water.legend(loc='upper left', fontsize=8)
     
+    # Coalesce canvas redraws: apply_sensors and periodic_sync can both update the
+    # graphs back-to-back, so at most one draw is performed per Tk idle cycle
+    draw_pending = [False]  # Use list to allow modification in nested functions
+    
+    def do_draw():
+        """Perform the pending canvas redraw"""
+        draw_pending[0] = False
+        try:
+            canvas_graph.draw()
+        except tk.TclError:
+            pass  # Canvas was destroyed before the idle callback ran
+    
+    def schedule_draw():
+        """Request a canvas redraw on the next idle cycle (no-op if one is already pending)"""
+        if not draw_pending[0]:
+            draw_pending[0] = True
+            right_frame.after_idle(do_draw)
+    
     def update_graphs(hours=24):
         """
         Update all graphs with data from database
@@ -2032,140 +2634,132 @@ def create_dashboard_tab(parent_frame, console_instance):
             current_time = int(time.time())
             start_time = current_time - (hours * 60 * 60)  # hours ago
             
-            readings = database.get_readings(start_timestamp=start_time, end_timestamp=current_time)
+            data = database.get_readings_soa(start_timestamp=start_time, end_timestamp=current_time)
+            timestamps = data['timestamp']
             
-            if not readings:
+            if len(timestamps) == 0:
                 return  # No data yet
             
-            # Convert database readings to lists for plotting
-            timestamps = []
-            temperature = []
-            humidity = []
-            light_lux = []
-            power_mw = []
-            current_ma = []
-            water_level_mm = []
-            
-            for reading in readings:
-                ts = datetime.fromtimestamp(reading['timestamp'])
-                timestamps.append(ts)
-                
-                # Use None for invalid sensor values
-                temperature.append(reading['temperature_c'] if reading['temperature_c'] not in [None, -999] else None)
-                humidity.append(reading['humidity_rh'] if reading['humidity_rh'] not in [None, -999] else None)
-                light_lux.append(reading['light_lux'] if reading['light_lux'] not in [None, -999] else None)
-                power_mw.append(reading['power_mw'] if reading['power_mw'] is not None else None)
-                current_ma.append(reading['current_ma'] if reading['current_ma'] is not None else None)
-                water_level_mm.append(reading['water_level_mm'] if reading['water_level_mm'] not in [None, -1] else None)
-            
-            # Filter out None values for plotting and detect gaps
+            # Mask invalid sensor values (device sentinels) as NaN
+            temperature = np.where(data['temperature_c'] == -999, np.nan, data['temperature_c'])
+            humidity = np.where(data['humidity_rh'] == -999, np.nan, data['humidity_rh'])
+            light_lux = np.where(data['light_lux'] == -999, np.nan, data['light_lux'])
+            power_mw = data['power_mw']
+            current_ma = data['current_ma']
+            water_level_mm = np.where(data['water_level_mm'] == -1, np.nan, data['water_level_mm'])
+            
+            # Convert Unix timestamps straight to matplotlib date numbers (days) in local
+            # time, without building a datetime object per row
+            utc_offset = time.localtime(int(timestamps[0])).tm_gmtoff
+            if utc_offset == time.localtime(int(timestamps[-1])).tm_gmtoff:
+                local_seconds = timestamps + utc_offset
+            else:
+                # DST changed inside the range, resolve the offset per reading
+                local_seconds = timestamps + np.array([time.localtime(t).tm_gmtoff for t in timestamps.tolist()])
+            date_nums = local_seconds / 86400.0 + mdates.date2num(datetime(1970, 1, 1))
+            one_second = 1 / 86400.0
+            
+            # Filter out invalid values for plotting and detect gaps
             def filter_data_with_gaps(times, values, max_gap_seconds=180):
                 """
                 Filter data and insert NaN for gaps to prevent false line connections.
                 
                 Args:
-                    times: List of timestamps
-                    values: List of sensor values
+                    times: Array of matplotlib date numbers
+                    values: Array of sensor values (NaN for invalid)
                     max_gap_seconds: Maximum time gap before inserting NaN (default: 3 minutes)
                 
                 Returns:
                     Tuple of (filtered_times, filtered_values) with NaN gaps inserted
                 """
-                filtered_times = []
-                filtered_values = []
+                valid = ~np.isnan(values)
+                times = times[valid]
+                values = values[valid]
                 
-                for i, (t, v) in enumerate(zip(times, values)):
-                    if v is not None:
-                        # Check for gap since last valid data point
-                        if filtered_times and (t - filtered_times[-1]).total_seconds() > max_gap_seconds:
-                            # Insert NaN to break the line
-                            filtered_times.append(filtered_times[-1] + timedelta(seconds=1))
-                            filtered_values.append(float('nan'))
-                            filtered_times.append(t - timedelta(seconds=1))
-                            filtered_values.append(float('nan'))
-                        
-                        filtered_times.append(t)
-                        filtered_values.append(v)
+                # Break the line with two NaN points around every gap
+                gap_idx = np.flatnonzero(np.diff(times) > max_gap_seconds * one_second) + 1
+                if len(gap_idx):
+                    gap_times = np.column_stack((times[gap_idx - 1] + one_second, times[gap_idx] - one_second)).ravel()
+                    times = np.insert(times, np.repeat(gap_idx, 2), gap_times)
+                    values = np.insert(values, np.repeat(gap_idx, 2), np.nan)
                 
-                return filtered_times, filtered_values
+                return times, values
+            
+            def time_range(*series):
+                """Return (min, max) over all time series, padded if they are equal"""
+                combined = np.concatenate(series)
+                time_min, time_max = combined.min(), combined.max()
+                # Add small padding if min==max to avoid singular transformation
+                if time_min == time_max:
+                    time_min -= 30 * one_second
+                    time_max += 30 * one_second
+                return time_min, time_max
+            
+            def value_range(*series):
+                """Return (min, max) over the non-NaN values of all series, or None"""
+                combined = np.concatenate(series)
+                combined = combined[~np.isnan(combined)]
+                if len(combined) == 0:
+                    return None
+                return combined.min(), combined.max()
             
             # Update temperature & humidity
-            temp_times, temp_values = filter_data_with_gaps(timestamps, temperature)
-            humid_times, humid_values = filter_data_with_gaps(timestamps, humidity)
+            temp_times, temp_values = filter_data_with_gaps(date_nums, temperature)
+            humid_times, humid_values = filter_data_with_gaps(date_nums, humidity)
             
             line_temp.set_data(temp_times, temp_values)
             line_humid.set_data(humid_times, humid_values)
             
-            if temp_times or humid_times:
-                all_times = temp_times + humid_times
-                all_values = [v for v in (temp_values + humid_values) if not math.isnan(v)]
-                # Add small padding if min==max to avoid singular transformation
-                if all_values:
-                    time_min, time_max = min(all_times), max(all_times)
-                    if time_min == time_max:
-                        time_min = time_min - timedelta(seconds=30)
-                        time_max = time_max + timedelta(seconds=30)
-                    ax_temp_humid.set_xlim(time_min, time_max)
-                    ax_temp_humid.set_ylim(min(all_values) - 5, max(all_values) + 5)
+            if len(temp_times) or len(humid_times):
+                values_range = value_range(temp_values, humid_values)
+                if values_range:
+                    ax_temp_humid.set_xlim(*time_range(temp_times, humid_times))
+                    ax_temp_humid.set_ylim(values_range[0] - 5, values_range[1] + 5)
             
             # Update light
-            lux_times, lux_values = filter_data_with_gaps(timestamps, light_lux)
+            lux_times, lux_values = filter_data_with_gaps(date_nums, light_lux)
             line_lux.set_data(lux_times, lux_values)
             
-            if lux_times:
-                lux_values_no_nan = [v for v in lux_values if not math.isnan(v)]
-                if lux_values_no_nan:
-                    time_min, time_max = min(lux_times), max(lux_times)
-                    if time_min == time_max:
-                        time_min = time_min - timedelta(seconds=30)
-                        time_max = time_max + timedelta(seconds=30)
-                    ax_light.set_xlim(time_min, time_max)
-                    ax_light.set_ylim(0, max(lux_values_no_nan) * 1.1)
+            if len(lux_times):
+                values_range = value_range(lux_values)
+                if values_range:
+                    ax_light.set_xlim(*time_range(lux_times))
+                    ax_light.set_ylim(0, values_range[1] * 1.1)
             
             # Update power & current
-            power_times, power_values = filter_data_with_gaps(timestamps, power_mw)
-            current_times, current_values = filter_data_with_gaps(timestamps, current_ma)
+            power_times, power_values = filter_data_with_gaps(date_nums, power_mw)
+            current_times, current_values = filter_data_with_gaps(date_nums, current_ma)
             
             line_power.set_data(power_times, power_values)
             line_current.set_data(current_times, current_values)
             
-            if power_times or current_times:
-                all_times = power_times + current_times
-                all_values = [v for v in (power_values + current_values) if not math.isnan(v)]
-                if all_values:
-                    time_min, time_max = min(all_times), max(all_times)
-                    if time_min == time_max:
-                        time_min = time_min - timedelta(seconds=30)
-                        time_max = time_max + timedelta(seconds=30)
-                    ax_power.set_xlim(time_min, time_max)
-                    ax_power.set_ylim(0, max(all_values) * 1.1)
+            if len(power_times) or len(current_times):
+                values_range = value_range(power_values, current_values)
+                if values_range:
+                    ax_power.set_xlim(*time_range(power_times, current_times))
+                    ax_power.set_ylim(0, values_range[1] * 1.1)
             
             # Update water level
-            water_times, water_values = filter_data_with_gaps(timestamps, water_level_mm)
+            water_times, water_values = filter_data_with_gaps(date_nums, water_level_mm)
             line_water.set_data(water_times, water_values)
             
-            if water_times:
-                water_values_no_nan = [v for v in water_values if not math.isnan(v)]
-                if water_values_no_nan:
-                    time_min, time_max = min(water_times), max(water_times)
-                    if time_min == time_max:
-                        time_min = time_min - timedelta(seconds=30)
-                        time_max = time_max + timedelta(seconds=30)
-                    ax_water.set_xlim(time_min, time_max)
+            if len(water_times):
+                values_range = value_range(water_values)
+                if values_range:
+                    ax_water.set_xlim(*time_range(water_times))
                     
                     # Fix for identical water level values (prevent matplotlib warning)
-                    val_min, val_max = min(water_values_no_nan), max(water_values_no_nan)
+                    val_min, val_max = values_range
                     if val_min == val_max:
                         # All values identical, add padding
                         ax_water.set_ylim(max(0, val_min - 1), val_max + 1)
                     else:
                         ax_water.set_ylim(0, val_max * 1.2)
-                        ax_water.set_ylim(0, val_max * 1.2)
                 else:
                     ax_water.set_ylim(0, 100)
             
-            # Redraw the canvas
-            canvas_graph.draw()
+            # Redraw the canvas (coalesced with any other pending redraw)
+            schedule_draw()
             
         except Exception as e:
             logging.error(f"Failed to update graphs: {e}", exc_info=True)
@@ -2244,9 +2838,9 @@ def create_dashboard_tab(parent_frame, console_instance):
             # Ensure all datetimes are timezone-naive
             xdata_dt = [dt.replace(tzinfo=None) if dt.tzinfo is not None else dt for dt in xdata_dt]
             
-            # Filter out NaN values
-            valid_indices = [i for i, y in enumerate(ydata) if not (isinstance(y, float) and math.isnan(y))]
-            if not valid_indices:
+            # Filter out NaN values (gap markers; the series are float32 arrays)
+            valid_indices = np.flatnonzero(~np.isnan(np.asarray(ydata, dtype=float)))
+            if len(valid_indices) == 0:
                 return None, None
             
             # Find closest point
@@ -2381,18 +2975,35 @@ def create_dashboard_tab(parent_frame, console_instance):
     canvas_graph.mpl_connect('button_release_event', on_mouse_release)
     canvas_graph.mpl_connect('motion_notify_event', on_mouse_move)
     
-    # Auto-refresh mechanism (every 5 seconds)
+    # Auto-refresh mechanism (every 5 seconds, backing off to 30 seconds while readings are stable)
+    AUTO_REFRESH_MIN_MS = 5000
+    AUTO_REFRESH_MAX_MS = 30000
     auto_refresh_id = None
     auto_refresh_enabled = True  # Flag to track if auto-refresh should run
+    auto_refresh_interval_ms = AUTO_REFRESH_MIN_MS
+    stable_count = 0
+    last_snapshot = None
+    
+    def update_refresh_interval():
+        """Back off the refresh interval while displayed sensor values stay identical"""
+        nonlocal auto_refresh_interval_ms, stable_count, last_snapshot
+        snapshot = tuple(sorted(last_label_text.items()))
+        if snapshot == last_snapshot:
+            stable_count += 1
+            auto_refresh_interval_ms = min(AUTO_REFRESH_MAX_MS, AUTO_REFRESH_MIN_MS * (1 << min(stable_count, 3)))
+        else:
+            stable_count = 0
+            auto_refresh_interval_ms = AUTO_REFRESH_MIN_MS
+            last_snapshot = snapshot
     
     def auto_refresh():
-        """Automatically refresh sensor data every 5 seconds"""
+        """Automatically refresh sensor data (5-30 seconds depending on data volatility)"""
         nonlocal auto_refresh_id, auto_refresh_enabled
         if auto_refresh_enabled:
             try:
                 refresh_all()
-                # Schedule next refresh in 5000ms (5 seconds)
-                auto_refresh_id = scrollable_frame.after(5000, auto_refresh)
+                # Schedule next refresh (the interval is updated when each refresh lands)
+                auto_refresh_id = scrollable_frame.after(auto_refresh_interval_ms, auto_refresh)
             except tk.TclError:
                 # Widget was destroyed, stop the refresh
                 auto_refresh_enabled = False
@@ -2408,14 +3019,17 @@ def create_dashboard_tab(parent_frame, console_instance):
     
     def start_auto_refresh():
         """Start or restart the auto-refresh timer"""
-        nonlocal auto_refresh_id, auto_refresh_enabled
+        nonlocal auto_refresh_id, auto_refresh_enabled, auto_refresh_interval_ms, stable_count
         auto_refresh_enabled = True
         # Cancel any existing timer first
         if auto_refresh_id is not None:
             scrollable_frame.after_cancel(auto_refresh_id)
+        # Tab just became visible, go back to the fastest rate
+        auto_refresh_interval_ms = AUTO_REFRESH_MIN_MS
+        stable_count = 0
         # Refresh immediately and schedule next
         refresh_all()
-        auto_refresh_id = scrollable_frame.after(5000, auto_refresh)
+        auto_refresh_id = scrollable_frame.after(auto_refresh_interval_ms, auto_refresh)
     
     # Store functions so they can be called when switching tabs
     parent_frame.stop_auto_refresh = stop_auto_refresh
@@ -2424,9 +3038,28 @@ def create_dashboard_tab(parent_frame, console_instance):
     # Periodic database sync (every 5 minutes to catch new historical data)
     # NOTE: This runs CONTINUOUSLY in the background regardless of which tab is active.
     # It only stops when the window is closed.
+    SYNC_INTERVAL_MS = 300000
+    SYNC_JITTER_MS = 30000
     sync_timer_id = None
     sync_enabled = True
     
+    def next_sync_delay():
+        """5 minutes +/- 30 seconds, so several consoles on the LAN don't hit the device together"""
+        return SYNC_INTERVAL_MS + random.randint(-SYNC_JITTER_MS, SYNC_JITTER_MS)
+    
+    def report_periodic_sync(new_entries):
+        """Runs once the database writer thread has committed the synced readings"""
+        if new_entries > 0:
+            sync_summary(database, new_entries)
+            logging.info(f"[OK] Periodic sync: {new_entries} new entries added")
+            scrollable_frame.log_message(f"Database sync complete: {new_entries} new entries", "success")
+            # Refresh graphs to show new data (preserve current time range selection);
+            # a hidden dashboard refreshes them when the tab is shown again
+            if scrollable_frame.winfo_viewable():
+                scrollable_frame.after_idle(update_graphs, current_hours_selection[0])
+        else:
+            scrollable_frame.log_message("Database sync complete: No new entries", "info")
+    
     def periodic_sync():
         """Sync database with device every 5 minutes (runs continuously in background)"""
         nonlocal sync_timer_id, sync_enabled
@@ -2434,24 +3067,20 @@ def create_dashboard_tab(parent_frame, console_instance):
             try:
                 logging.info("Performing periodic database sync...")
                 scrollable_frame.log_message("Starting periodic database sync...", "info")
-                success, new_entries, sync_message = sync_historical_data(console_instance, database)
-                if success and new_entries > 0:
-                    logging.info(f"[OK] Periodic sync: {new_entries} new entries added")
-                    scrollable_frame.log_message(f"Database sync complete: {new_entries} new entries", "success")
-                    # Refresh graphs to show new data (preserve current time range selection)
-                    update_graphs(current_hours_selection[0])
-                elif success:
-                    scrollable_frame.log_message("Database sync complete: No new entries", "info")
+                success, stored, sync_message = sync_historical_data(console_instance, database)
+                if success:
+                    when_done(scrollable_frame, [stored], report_periodic_sync,
+                              on_error=lambda e: scrollable_frame.log_message(f"Database sync failed: {e}", "warning"))
                 else:
                     scrollable_frame.log_message(f"Database sync failed: {sync_message}", "warning")
-                # Schedule next sync in 5 minutes (300,000 ms)
-                sync_timer_id = scrollable_frame.after(300000, periodic_sync)
+                # Schedule next sync in ~5 minutes
+                sync_timer_id = scrollable_frame.after(next_sync_delay(), periodic_sync)
             except tk.TclError:
                 sync_enabled = False
                 sync_timer_id = None
             except Exception as e:
                 scrollable_frame.log_message(f"Error during periodic sync: {str(e)}", "error")
-                sync_timer_id = scrollable_frame.after(300000, periodic_sync)  # Try again in 5 minutes
+                sync_timer_id = scrollable_frame.after(next_sync_delay(), periodic_sync)  # Try again in ~5 minutes
     
     def stop_periodic_sync():
         """Stop the periodic sync timer"""
@@ -2465,8 +3094,8 @@ def create_dashboard_tab(parent_frame, console_instance):
     parent_frame.stop_periodic_sync = stop_periodic_sync
     parent_frame.database = database
     
-    # Start periodic sync (first one in 5 minutes)
-    sync_timer_id = scrollable_frame.after(300000, periodic_sync)
+    # Start periodic sync (first one in ~5 minutes)
+    sync_timer_id = scrollable_frame.after(next_sync_delay(), periodic_sync)
     
     # Initial load and start auto-refresh
     start_auto_refresh()
@@ -2541,7 +3170,7 @@ def create_manual_control_tab(parent_frame, console_instance):
     def refresh_sensors():
         try:
             device = devices[console_instance.selected_device]
-            url = f"https://{device['address']}:{device['port']}/api/unit-metrics"
+            url = f"{device['base_url']}/api/unit-metrics"
             response = console_instance.session.get(url, timeout=5)
             
             if response.status_code == 200:
@@ -3240,14 +3869,14 @@ def create_manual_control_tab(parent_frame, console_instance):
                         return
                     
                     device = devices[console_instance.selected_device]
-                    url = f"https://{device['address']}:{device['port']}/api/actuators/foodpump"
+                    url = f"{device['base_url']}/api/actuators/foodpump"
                     payload = {
                         'dose': duration_ms,
                         'speed': speed_pct
                     }
                     
                     scrollable_frame.log_message(f"💊 Dosing food pump: {duration_ms}ms at {speed_pct}%...", "info")
-                    response = console_instance.session.post(url, json=payload, timeout=10, verify=False)
+                    response = console_instance.session.post(url, json=payload, timeout=10)
                     
                     if response.status_code == 200:
                         scrollable_frame.log_message(f"✅ Food pump dosing completed successfully", "success")
@@ -3413,7 +4042,7 @@ def create_manual_control_tab(parent_frame, console_instance):
                         return
                     
                     device = devices[console_instance.selected_device]
-                    url = f"https://{device['address']}:{device['port']}/api/actuators/planterpump"
+                    url = f"{device['base_url']}/api/actuators/planterpump"
                     payload = {
                         'sweep': duration_ms,
                         'min_speed': min_speed,
@@ -3422,7 +4051,7 @@ def create_manual_control_tab(parent_frame, console_instance):
                     }
                     
                     scrollable_frame.log_message(f"🌊 Sweeping planter pump: {duration_ms}ms, {min_speed}-{max_speed}%, period {period_ms}ms...", "info")
-                    response = console_instance.session.post(url, json=payload, timeout=max(10, duration_ms//1000 + 2), verify=False)
+                    response = console_instance.session.post(url, json=payload, timeout=max(10, duration_ms//1000 + 2))
                     
                     if response.status_code == 200:
                         scrollable_frame.log_message(f"✅ Planter pump sweep completed successfully", "success")
@@ -3543,7 +4172,7 @@ def create_manual_control_tab(parent_frame, console_instance):
         # Send commands
         results = []
         device = devices[console_instance.selected_device]
-        base_url = f"https://{device['address']}:{device['port']}"
+        base_url = device['base_url']
         
         for command_info in commands_to_send:
             actuator_key = command_info[0]
@@ -3562,7 +4191,7 @@ def create_manual_control_tab(parent_frame, console_instance):
                     # Normal actuator control
                     payload = {'value': value}
                 
-                response = console_instance.session.post(url, json=payload, timeout=5, verify=False)
+                response = console_instance.session.post(url, json=payload, timeout=5)
                 
                 if response.status_code == 200:
                     if action == 'off':
@@ -3593,7 +4222,7 @@ def create_manual_control_tab(parent_frame, console_instance):
     def emergency_stop():
         """Set all actuators to 0% (including all LED channels)"""
         device = devices[console_instance.selected_device]
-        base_url = f"https://{device['address']}:{device['port']}"
+        base_url = device['base_url']
         
         results = []
         for key, state in actuator_states.items():
@@ -3606,7 +4235,7 @@ def create_manual_control_tab(parent_frame, console_instance):
                     for channel in range(1, 5):
                         try:
                             payload = {'channel': channel, 'value': 0}
-                            response = console_instance.session.post(url, json=payload, timeout=5, verify=False)
+                            response = console_instance.session.post(url, json=payload, timeout=5)
                             if response.status_code == 200:
                                 results.append(f"✅ LED CH{channel}: Stopped")
                         except:
@@ -3614,7 +4243,7 @@ def create_manual_control_tab(parent_frame, console_instance):
                     
                     # Also send all-channels-off command
                     payload = {'value': 0}
-                    response = console_instance.session.post(url, json=payload, timeout=5, verify=False)
+                    response = console_instance.session.post(url, json=payload, timeout=5)
                     
                     # Update UI - main slider and all channel sliders
                     state['scale'].set(0)
@@ -3624,7 +4253,7 @@ def create_manual_control_tab(parent_frame, console_instance):
                 else:
                     # Normal actuator - just turn off
                     payload = {'value': 0}
-                    response = console_instance.session.post(url, json=payload, timeout=5, verify=False)
+                    response = console_instance.session.post(url, json=payload, timeout=5)
                     
                     if response.status_code == 200:
                         results.append(f"✅ {key}: Stopped")
@@ -3724,6 +4353,42 @@ def create_manual_control_tab(parent_frame, console_instance):
     start_auto_refresh()
 
 
+# Shared font specs for the schedule, food and calendar tabs and the device selector
+FONT_HEADER = ("Arial", 16, "bold")
+FONT_TITLE = ("Arial", 14, "bold")
+FONT_BUTTON = ("Arial", 11)
+FONT_BUTTON_BOLD = ("Arial", 11, "bold")
+FONT_LABEL = ("Arial", 10)
+FONT_BOLD = ("Arial", 10, "bold")
+FONT_SMALL = ("Arial", 9)
+FONT_SMALL_BOLD = ("Arial", 9, "bold")
+FONT_TINY = ("Arial", 8)
+FONT_TINY_BOLD = ("Arial", 8, "bold")
+
+# Food Schedule tab preview text, filled with % so the layout is built once at import
+FOOD_PREVIEW_HEADER = (
+    "Configuration Summary\n"
+    + "=" * 60 + "\n\n"
+    "Total Daily Dose:     %d ms\n"
+    "Number of Feedings:   %d\n"
+    "Dose per Feeding:     %d ms\n"
+    "Pump Speed:           %d%%\n\n"
+    "Feeding Times\n"
+    + "-" * 60 + "\n\n"
+)
+FOOD_PREVIEW_LINE = "Feeding %2d:  %02d:%02d  (%d ms @ %d%%)\n"
+
+
+def feeding_times(intervals):
+    """
+    Start times of `intervals` feedings evenly spaced over 24 hours.
+    Pure integer minute arithmetic, so no float rounding drift.
+    
+    Returns:
+        List of (hour, minute) tuples
+    """
+    return [divmod(i * 24 * 60 // intervals, 60) for i in range(intervals)]
+
 def create_schedules_tab(parent_frame, console_instance):
     """
     Create the schedules management tab.
@@ -3733,16 +4398,31 @@ def create_schedules_tab(parent_frame, console_instance):
     instructions = tk.Label(
         parent_frame,
         text="Manage hourly schedules, food dosing, and routine commands",
-        font=("Arial", 10),
+        font=FONT_LABEL,
         fg="#555"
     )
     instructions.pack(pady=10)
     
     # Button to open schedule manager
     def open_schedule_manager():
-        # Fetch current hourly schedules from device
-        light_sched = console_instance._fetch_saved_schedule("light")
-        planter_sched = console_instance._fetch_saved_schedule("planter")
+        # Fetch current hourly schedules from device in the background (both requests overlap)
+        open_btn.config(state="disabled")
+        futures = [
+            io_pool.submit(fetch_saved_schedule_cached, console_instance, "light"),
+            io_pool.submit(fetch_saved_schedule_cached, console_instance, "planter"),
+        ]
+        when_done(parent_frame, futures, show_schedule_manager, on_error=schedule_fetch_failed)
+    
+    def schedule_fetch_failed(error):
+        open_btn.config(state="normal")
+        tk.messagebox.showerror("Error", f"Failed to load schedules from device: {error}")
+    
+    def show_schedule_manager(light_sched, planter_sched):
+        open_btn.config(state="normal")
+        if light_sched is None or planter_sched is None:
+            # Don't open the editor on all-zero placeholders the user might save back
+            tk.messagebox.showerror("Error", "Failed to load schedules from device (see console for details)")
+            return
         
         # Open the existing unified GUI window
         config = prompt_unified_schedule_manager(light_sched, planter_sched, console_instance.schedules)
@@ -3752,57 +4432,56 @@ def create_schedules_tab(parent_frame, console_instance):
         
         # Handle hourly schedules
         if config['light_schedule'] or config['planter_schedule']:
-            # Post light schedule
+            # Post whichever hourly schedules changed in parallel
+            routines = {}
             if config['light_schedule']:
-                console_instance._post_routine("light_schedule", {"schedule": config['light_schedule']})
-                print("✓ Light schedule updated")
-            
-            # Post planter schedule  
+                routines["light_schedule"] = {"schedule": config['light_schedule']}
             if config['planter_schedule']:
-                console_instance._post_routine("planter_pod_schedule", {"schedule": config['planter_schedule']})
+                routines["planter_pod_schedule"] = {"schedule": config['planter_schedule']}
+            
+            results = console_instance._post_routines(routines)
+            if "light_schedule" in results:
+                print("✓ Light schedule updated")
+            if "planter_pod_schedule" in results:
                 print("✓ Planter schedule updated")
         
         # Handle food schedule
         if config['food_config']:
             food = config['food_config']
             
-            # Calculate feeding times (evenly spaced throughout 24 hours)
-            hours_between = 24.0 / food['intervals']
-            
             # Remove any existing food schedules
-            food_schedules = [name for name in console_instance.schedules if name.startswith('food_dose_')]
-            for name in food_schedules:
-                try:
-                    scheduler.remove_job(name)
-                    del console_instance.schedules[name]
-                except Exception:
-                    pass
+            console_instance.remove_food_schedules()
             
-            # Create new food dosing schedules
+            # Create new food dosing schedules (all feedings share everything but the start time)
             device_info = devices[console_instance.selected_device]
             device_name = console_instance.selected_device
             
-            for i in range(food['intervals']):
-                start_hour = int(i * hours_between)
-                start_minute = int((i * hours_between - start_hour) * 60)
-                schedule_name = f"food_dose_{i+1}"
-                
-                console_instance.schedules[schedule_name] = {
-                    'device_name': device_name,
-                    'device_ip': device_info['address'],
-                    'start_time': f"{start_hour:02d}:{start_minute:02d}",
-                    'duration_minutes': 0,
-                    'frequency': 'daily',
-                    'day_of_week': None,
-                    'actions': {
-                        'food_dose': {
-                            'duration_ms': food['dose_per_interval'],
-                            'speed': food['speed']
-                        }
+            base_entry = {
+                'device_name': device_name,
+                'device_ip': device_info['address'],
+                'duration_minutes': 0,
+                'frequency': 'daily',
+                'day_of_week': None,
+                'actions': {
+                    'food_dose': {
+                        'duration_ms': food['dose_per_interval'],
+                        'speed': food['speed']
                     }
                 }
+            }
+            
+            new_jobs = []
+            # Feeding times are evenly spaced throughout 24 hours
+            for i, (start_hour, start_minute) in enumerate(feeding_times(food['intervals'])):
+                schedule_name = f"food_dose_{i+1}"
                 
-                console_instance.schedule_job(schedule_name, console_instance.schedules[schedule_name])
+                entry = copy.deepcopy(base_entry)  # Each entry gets its own actions dict
+                entry['start_time'] = f"{start_hour:02d}:{start_minute:02d}"
+                new_jobs.append((schedule_name, entry))
+            
+            with console_instance._schedules_lock:
+                console_instance.schedules.update(new_jobs)
+            console_instance.schedule_jobs(new_jobs)
             
             console_instance.save_schedules()
             tk.messagebox.showinfo("Success", f"Food dosing schedule created with {food['intervals']} daily feedings")
@@ -3826,7 +4505,7 @@ def create_schedules_tab(parent_frame, console_instance):
             elif command == 'calibrate_pod':
                 actions['routine'] = {'command': 'calibrate_pod'}
             
-            console_instance.schedules[schedule_name] = {
+            entry = {
                 'device_name': device_name,
                 'device_ip': device_info['address'],
                 'start_time': routine['start_time'],
@@ -3835,8 +4514,10 @@ def create_schedules_tab(parent_frame, console_instance):
                 'day_of_week': routine['day_of_week'],
                 'actions': actions
             }
+            with console_instance._schedules_lock:
+                console_instance.schedules[schedule_name] = entry
             
-            console_instance.schedule_job(schedule_name, console_instance.schedules[schedule_name])
+            console_instance.schedule_job(schedule_name, entry)
             console_instance.save_schedules()
             tk.messagebox.showinfo("Success", f"Routine schedule '{schedule_name}' created")
     
@@ -3859,27 +4540,53 @@ def create_schedules_tab(parent_frame, console_instance):
     schedules_list_frame = tk.LabelFrame(parent_frame, text="Active Schedules", padx=10, pady=10)
     schedules_list_frame.pack(fill="both", expand=True, pady=10)
     
-    # Scrollable text widget for schedules
-    schedules_text = tk.Text(schedules_list_frame, height=15, wrap="none", font=("Courier", 9))
-    schedules_text.pack(side="left", fill="both", expand=True)
-    
-    scrollbar = tk.Scrollbar(schedules_list_frame, command=schedules_text.yview)
+    # One row per schedule; refreshes only touch rows that were added, removed or changed
+    schedules_tree = ttk.Treeview(
+        schedules_list_frame,
+        columns=("device", "time", "freq", "actions"),
+        show="tree headings",
+        height=15
+    )
+    schedules_tree.heading("#0", text="Schedule", anchor="w")
+    schedules_tree.heading("device", text="Device", anchor="w")
+    schedules_tree.heading("time", text="Time", anchor="w")
+    schedules_tree.heading("freq", text="Frequency", anchor="w")
+    schedules_tree.heading("actions", text="Actions", anchor="w")
+    schedules_tree.column("#0", width=180)
+    schedules_tree.column("device", width=140)
+    schedules_tree.column("time", width=70)
+    schedules_tree.column("freq", width=80)
+    schedules_tree.column("actions", width=220)
+    schedules_tree.pack(side="left", fill="both", expand=True)
+    
+    scrollbar = tk.Scrollbar(schedules_list_frame, command=schedules_tree.yview)
     scrollbar.pack(side="right", fill="y")
-    schedules_text.config(yscrollcommand=scrollbar.set)
+    schedules_tree.config(yscrollcommand=scrollbar.set)
     
     # Populate schedules
     def refresh_schedules():
-        schedules_text.delete(1.0, tk.END)
-        if not console_instance.schedules:
-            schedules_text.insert(tk.END, "No active schedules.\n")
-        else:
-            for name, details in console_instance.schedules.items():
-                schedules_text.insert(tk.END, f"📌 {name}\n")
-                schedules_text.insert(tk.END, f"   Device: {details['device_name']}\n")
-                schedules_text.insert(tk.END, f"   Time: {details['start_time']}\n")
-                schedules_text.insert(tk.END, f"   Frequency: {details['frequency']}\n")
-                schedules_text.insert(tk.END, f"   Actions: {', '.join(details['actions'].keys())}\n")
-                schedules_text.insert(tk.END, "\n")
+        schedules = console_instance.schedules
+        existing = set(schedules_tree.get_children())
+        wanted = set(schedules)
+        
+        for name in existing - wanted:
+            schedules_tree.delete(name)
+        
+        for name, details in schedules.items():
+            values = (
+                details['device_name'],
+                details['start_time'],
+                details['frequency'],
+                ", ".join(details['actions'].keys()),
+            )
+            if name not in existing:
+                schedules_tree.insert("", "end", iid=name, text=f"📌 {name}", values=values)
+            elif tuple(schedules_tree.item(name, "values")) != values:
+                schedules_tree.item(name, values=values)
+        
+        schedules_list_frame.config(
+            text=f"Active Schedules ({len(schedules)})" if schedules else "Active Schedules (none)"
+        )
     
     refresh_schedules()
     
@@ -3887,7 +4594,7 @@ def create_schedules_tab(parent_frame, console_instance):
         parent_frame,
         text="🔄 Refresh",
         command=refresh_schedules,
-        font=("Arial", 10)
+        font=FONT_LABEL
     )
     refresh_btn.pack(pady=5)
 
@@ -3926,14 +4633,14 @@ def create_light_planter_tab(parent_frame, console_instance):
     title_label = tk.Label(
         scrollable_frame,
         text="24-Hour Light & Planter Schedules",
-        font=("Arial", 14, "bold")
+        font=FONT_TITLE
     )
     title_label.pack(pady=10)
     
     instructions = tk.Label(
         scrollable_frame,
         text="Set hourly PWM values for LED brightness and planter pump operation (scroll to adjust sliders)",
-        font=("Arial", 10),
+        font=FONT_LABEL,
         fg="#555"
     )
     instructions.pack(pady=5)
@@ -3942,180 +4649,137 @@ def create_light_planter_tab(parent_frame, console_instance):
     current_light = [0] * 24
     current_planter = [0] * 24
     
-    def load_current_schedules():
-        nonlocal current_light, current_planter
-        light_sched = console_instance._fetch_saved_schedule("light")
-        planter_sched = console_instance._fetch_saved_schedule("planter")
+    def load_current_schedules(on_loaded=None, max_age=SAVED_SCHEDULE_TTL):
+        """Fetch both schedules in the background and apply them on the Tk thread"""
+        futures = [
+            io_pool.submit(fetch_saved_schedule_cached, console_instance, "light", max_age),
+            io_pool.submit(fetch_saved_schedule_cached, console_instance, "planter", max_age),
+        ]
         
-        if light_sched:
-            current_light = light_sched
-        if planter_sched:
-            current_planter = planter_sched
+        def apply_schedules(light_sched, planter_sched):
+            nonlocal current_light, current_planter
+            if light_sched:
+                current_light = light_sched
+            if planter_sched:
+                current_planter = planter_sched
+            
+            update_displays()
+            if light_sched is None or planter_sched is None:
+                if on_loaded:  # Explicit load: say why the sliders didn't change
+                    tk.messagebox.showerror("Error", "Failed to load schedules from device (see console for details)")
+            elif on_loaded:
+                on_loaded()
         
-        update_displays()
-    
-    # Side-by-side container for LED and Planter
-    schedules_container = tk.Frame(scrollable_frame)
-    schedules_container.pack(fill="both", expand=True, padx=20, pady=10)
+        when_done(scrollable_frame, futures, apply_schedules)
     
-    # LED Schedule Section (LEFT SIDE)
-    led_frame = tk.LabelFrame(schedules_container, text="💡 LED Light Schedule", padx=15, pady=15)
-    led_frame.pack(side="left", fill="both", expand=True, padx=(0, 10))
+    # Single mouse wheel handler shared by all 48 sliders (dispatched through a bindtag);
+    # each tagged widget carries the IntVar it controls as `wheel_var`
+    SLIDER_WHEEL_TAG = "ScheduleSliderWheel"
     
-    led_values_frame = tk.Frame(led_frame)
-    led_values_frame.pack(fill="both", expand=True)
+    def on_slider_wheel(event):
+        # Scroll up = increase value, scroll down = decrease value
+        slider_var = event.widget.wheel_var
+        delta = 5 if event.delta > 0 else -5
+        slider_var.set(max(0, min(100, slider_var.get() + delta)))
+        return "break"  # Stop event propagation to prevent canvas scrolling
     
-    led_scales = []
-    led_value_labels = []
+    scrollable_frame.bind_class(SLIDER_WHEEL_TAG, "<MouseWheel>", on_slider_wheel)
     
-    # Create compact grid of sliders (4 rows of 6)
-    for row in range(4):
-        row_frame = tk.Frame(led_values_frame)
-        row_frame.pack(fill="x", pady=2)
+    def build_slider_grid(values_frame, initial_values):
+        """
+        Lay out 24 hourly sliders as a 4x6 grid directly inside values_frame.
+        Each hour uses three grid rows: hour label, slider, value label.
         
-        for col in range(6):
-            hour = row * 6 + col
+        Returns:
+            List of 24 IntVars, one per hour
+        """
+        hour_vars = []
+        for hour in range(24):
+            row, col = divmod(hour, 6)
             
-            hour_container = tk.Frame(row_frame)
-            hour_container.pack(side="left", padx=5)
+            hour_label = tk.Label(values_frame, text=f"{hour:02d}h", font=FONT_TINY_BOLD)
+            hour_label.grid(row=row * 3, column=col, padx=5, pady=(2, 0))
             
-            hour_label = tk.Label(hour_container, text=f"{hour:02d}h", font=("Arial", 8, "bold"))
-            hour_label.pack()
+            var = tk.IntVar(value=initial_values[hour])
+            hour_vars.append(var)
             
             scale = tk.Scale(
-                hour_container,
+                values_frame,
                 from_=100,
                 to=0,
                 orient=tk.VERTICAL,
                 length=100,
                 width=18,
-                showvalue=0
+                showvalue=0,
+                variable=var
             )
-            scale.set(current_light[hour])
-            scale.pack()
-            led_scales.append(scale)
-            
-            value_label = tk.Label(hour_container, text=f"{current_light[hour]}%", font=("Arial", 8))
-            value_label.pack()
-            led_value_labels.append(value_label)
-            
-            # Update label when slider moves
-            scale.config(command=lambda val, h=hour: led_value_labels[h].config(text=f"{int(float(val))}%"))
-            
-            # Add mouse wheel scrolling for this slider
-            def make_scroll_handler(slider, hour_idx):
-                def on_scroll(event):
-                    current_val = slider.get()
-                    # Scroll up = increase value, scroll down = decrease value
-                    delta = 5 if event.delta > 0 else -5
-                    new_val = max(0, min(100, current_val + delta))
-                    slider.set(new_val)
-                    led_value_labels[hour_idx].config(text=f"{int(new_val)}%")
-                    return "break"  # Stop event propagation to prevent canvas scrolling
-                return on_scroll
-            
-            scale.bind("<MouseWheel>", make_scroll_handler(scale, hour))
-            # Also bind to the container for easier targeting
-            hour_container.bind("<MouseWheel>", make_scroll_handler(scale, hour))
-            # Bind to label too
-            hour_label.bind("<MouseWheel>", make_scroll_handler(scale, hour))
-            value_label.bind("<MouseWheel>", make_scroll_handler(scale, hour))
+            scale.grid(row=row * 3 + 1, column=col, padx=5)
+            
+            # Value label follows the slider through the shared IntVar
+            value_frame = tk.Frame(values_frame)
+            value_frame.grid(row=row * 3 + 2, column=col, padx=5, pady=(0, 2))
+            value_label = tk.Label(value_frame, textvariable=var, font=FONT_TINY)
+            value_label.pack(side="left")
+            percent_label = tk.Label(value_frame, text="%", font=FONT_TINY)
+            percent_label.pack(side="left")
+            
+            # Mouse wheel anywhere in this hour's cell adjusts it. The handler is bound
+            # once per class (SLIDER_WHEEL_TAG); widgets only get the tag prepended.
+            for widget in (scale, hour_label, value_frame, value_label, percent_label):
+                widget.wheel_var = var
+                widget.bindtags((SLIDER_WHEEL_TAG,) + widget.bindtags())
+        
+        return hour_vars
     
-    # Planter Schedule Section (RIGHT SIDE)
-    planter_frame = tk.LabelFrame(schedules_container, text="💧 Planter Pump Schedule", padx=15, pady=15)
-    planter_frame.pack(side="left", fill="both", expand=True, padx=(10, 0))
+    # Side-by-side container for LED and Planter
+    schedules_container = tk.Frame(scrollable_frame)
+    schedules_container.pack(fill="both", expand=True, padx=20, pady=10)
+    
+    # LED Schedule Section (LEFT SIDE)
+    led_frame = tk.LabelFrame(schedules_container, text="💡 LED Light Schedule", padx=15, pady=15)
+    led_frame.pack(side="left", fill="both", expand=True, padx=(0, 10))
+    
+    led_values_frame = tk.Frame(led_frame)
+    led_values_frame.pack(fill="both", expand=True)
+    
+    led_vars = []  # One IntVar per hour; Tk keeps slider and label in sync without Python callbacks
+    
+    # Create compact grid of sliders (4 rows of 6)
+    led_vars.extend(build_slider_grid(led_values_frame, current_light))
+    
+    # Planter Schedule Section (RIGHT SIDE)
+    planter_frame = tk.LabelFrame(schedules_container, text="💧 Planter Pump Schedule", padx=15, pady=15)
+    planter_frame.pack(side="left", fill="both", expand=True, padx=(10, 0))
     
     planter_values_frame = tk.Frame(planter_frame)
     planter_values_frame.pack(fill="both", expand=True)
     
-    planter_scales = []
-    planter_value_labels = []
+    planter_vars = []  # One IntVar per hour; Tk keeps slider and label in sync without Python callbacks
     
     # Create compact grid of sliders (4 rows of 6)
-    for row in range(4):
-        row_frame = tk.Frame(planter_values_frame)
-        row_frame.pack(fill="x", pady=2)
-        
-        for col in range(6):
-            hour = row * 6 + col
-            
-            hour_container = tk.Frame(row_frame)
-            hour_container.pack(side="left", padx=5)
-            
-            hour_label = tk.Label(hour_container, text=f"{hour:02d}h", font=("Arial", 8, "bold"))
-            hour_label.pack()
-            
-            scale = tk.Scale(
-                hour_container,
-                from_=100,
-                to=0,
-                orient=tk.VERTICAL,
-                length=100,
-                width=18,
-                showvalue=0
-            )
-            scale.set(current_planter[hour])
-            scale.pack()
-            planter_scales.append(scale)
-            
-            value_label = tk.Label(hour_container, text=f"{current_planter[hour]}%", font=("Arial", 8))
-            value_label.pack()
-            planter_value_labels.append(value_label)
-            
-            scale.config(command=lambda val, h=hour: planter_value_labels[h].config(text=f"{int(float(val))}%"))
-            
-            # Add mouse wheel scrolling for this slider
-            def make_scroll_handler(slider, hour_idx):
-                def on_scroll(event):
-                    current_val = slider.get()
-                    # Scroll up = increase value, scroll down = decrease value
-                    delta = 5 if event.delta > 0 else -5
-                    new_val = max(0, min(100, current_val + delta))
-                    slider.set(new_val)
-                    planter_value_labels[hour_idx].config(text=f"{int(new_val)}%")
-                    return "break"  # Stop event propagation to prevent canvas scrolling
-                return on_scroll
-            
-            scale.bind("<MouseWheel>", make_scroll_handler(scale, hour))
-            # Also bind to the container for easier targeting
-            hour_container.bind("<MouseWheel>", make_scroll_handler(scale, hour))
-            # Bind to label too
-            hour_label.bind("<MouseWheel>", make_scroll_handler(scale, hour))
-            value_label.bind("<MouseWheel>", make_scroll_handler(scale, hour))
+    planter_vars.extend(build_slider_grid(planter_values_frame, current_planter))
     
     def update_displays():
-        for i in range(24):
-            led_scales[i].set(current_light[i])
-            led_value_labels[i].config(text=f"{current_light[i]}%")
-            planter_scales[i].set(current_planter[i])
-            planter_value_labels[i].config(text=f"{current_planter[i]}%")
+        # Only write sliders whose on-screen value differs; an identical reload touches nothing
+        for var, value in zip(led_vars, current_light):
+            if var.get() != value:
+                var.set(value)
+        for var, value in zip(planter_vars, current_planter):
+            if var.get() != value:
+                var.set(value)
     
     # Preset buttons
     preset_frame = tk.Frame(scrollable_frame)
     preset_frame.pack(pady=15)
     
     def apply_preset_light(preset_type):
-        if preset_type == "off":
-            for i in range(24):
-                led_scales[i].set(0)
-        elif preset_type == "full":
-            for i in range(24):
-                led_scales[i].set(100)
-        elif preset_type == "day_night":
-            # Sunrise 6am, sunset 8pm
-            for i in range(24):
-                if 6 <= i < 20:
-                    led_scales[i].set(100)
-                else:
-                    led_scales[i].set(0)
-        elif preset_type == "gradual":
-            # Gradual sunrise/sunset
-            schedule = [0, 0, 0, 0, 0, 10, 30, 60, 80, 100, 100, 100,
-                       100, 100, 100, 100, 100, 100, 80, 60, 30, 10, 0, 0]
-            for i in range(24):
-                led_scales[i].set(schedule[i])
-    
-    tk.Label(preset_frame, text="LED Presets:", font=("Arial", 10, "bold")).pack(side="left", padx=5)
+        schedule = LIGHT_PRESETS.get(preset_type)
+        if schedule is None:
+            return
+        for var, value in zip(led_vars, schedule):
+            var.set(value)
+    
+    tk.Label(preset_frame, text="LED Presets:", font=FONT_BOLD).pack(side="left", padx=5)
     tk.Button(preset_frame, text="All Off", command=lambda: apply_preset_light("off"), padx=10, pady=5).pack(side="left", padx=2)
     tk.Button(preset_frame, text="All On", command=lambda: apply_preset_light("full"), padx=10, pady=5).pack(side="left", padx=2)
     tk.Button(preset_frame, text="Day/Night", command=lambda: apply_preset_light("day_night"), padx=10, pady=5).pack(side="left", padx=2)
@@ -4126,24 +4790,35 @@ def create_light_planter_tab(parent_frame, console_instance):
     action_frame.pack(pady=20)
     
     def load_schedules():
-        load_current_schedules()
-        tk.messagebox.showinfo("Success", "Schedules loaded from device")
+        # Explicit reload always goes to the device
+        load_current_schedules(
+            on_loaded=lambda: tk.messagebox.showinfo("Success", "Schedules loaded from device"),
+            max_age=0
+        )
     
     def save_schedules():
-        light_schedule = [led_scales[i].get() for i in range(24)]
-        planter_schedule = [planter_scales[i].get() for i in range(24)]
-        
-        # Post to device
-        console_instance._post_routine("light_schedule", {"schedule": light_schedule})
-        console_instance._post_routine("planter_pod_schedule", {"schedule": planter_schedule})
+        light_schedule = [var.get() for var in led_vars]
+        planter_schedule = [var.get() for var in planter_vars]
+        
+        # Post both schedules to the device in parallel, off the Tk thread
+        futures = list(console_instance._submit_routines({
+            "light_schedule": {"schedule": light_schedule},
+            "planter_pod_schedule": {"schedule": planter_schedule},
+        }).values())
+        
+        def on_saved(light_id, planter_id):
+            if light_id is None or planter_id is None:
+                tk.messagebox.showerror("Error", "Failed to save schedules to device (see console for details)")
+            else:
+                tk.messagebox.showinfo("Success", "Schedules saved to device!")
         
-        tk.messagebox.showinfo("Success", "Schedules saved to device!")
+        when_done(scrollable_frame, futures, on_saved)
     
     tk.Button(
         action_frame,
         text="🔄 Load from Device",
         command=load_schedules,
-        font=("Arial", 11),
+        font=FONT_BUTTON,
         padx=15,
         pady=8
     ).pack(side="left", padx=5)
@@ -4152,15 +4827,15 @@ def create_light_planter_tab(parent_frame, console_instance):
         action_frame,
         text="💾 Save to Device",
         command=save_schedules,
-        font=("Arial", 11, "bold"),
+        font=FONT_BUTTON_BOLD,
         bg="#27ae60",
         fg="white",
         padx=15,
         pady=8
     ).pack(side="left", padx=5)
     
-    # Initial load
-    load_current_schedules()
+    # Initial load once the tab has painted (sliders start at 0 until the device answers)
+    scrollable_frame.after_idle(load_current_schedules)
 
 
 def create_food_schedule_tab(parent_frame, console_instance):
@@ -4176,14 +4851,14 @@ def create_food_schedule_tab(parent_frame, console_instance):
     title_label = tk.Label(
         container,
         text="🍽️ Automated Food Dosing Schedule",
-        font=("Arial", 14, "bold")
+        font=FONT_TITLE
     )
     title_label.pack(pady=10)
     
     instructions = tk.Label(
         container,
         text="Configure automated nutrient dosing throughout the day",
-        font=("Arial", 10),
+        font=FONT_LABEL,
         fg="#555"
     )
     instructions.pack(pady=5)
@@ -4193,24 +4868,23 @@ def create_food_schedule_tab(parent_frame, console_instance):
     config_frame.pack(fill="x", pady=20)
     
     # Total daily amount
-    tk.Label(config_frame, text="Total Daily Amount (ms):", font=("Arial", 10, "bold")).grid(row=0, column=0, sticky="w", padx=5, pady=10)
-    total_entry = tk.Entry(config_frame, font=("Arial", 11), width=15)
-    total_entry.insert(0, "5000")
+    tk.Label(config_frame, text="Total Daily Amount (ms):", font=FONT_BOLD).grid(row=0, column=0, sticky="w", padx=5, pady=10)
+    total_var = tk.StringVar(value="5000")
+    total_entry = tk.Entry(config_frame, textvariable=total_var, font=FONT_BUTTON, width=15)
     total_entry.grid(row=0, column=1, sticky="w", padx=5, pady=10)
-    tk.Label(config_frame, text="Total pump run time per day", font=("Arial", 9), fg="#666").grid(row=0, column=2, sticky="w", padx=5)
+    tk.Label(config_frame, text="Total pump run time per day", font=FONT_SMALL, fg="#666").grid(row=0, column=2, sticky="w", padx=5)
     
     # Number of intervals
-    tk.Label(config_frame, text="Number of Feedings:", font=("Arial", 10, "bold")).grid(row=1, column=0, sticky="w", padx=5, pady=10)
-    intervals_spinbox = tk.Spinbox(config_frame, from_=1, to=24, font=("Arial", 11), width=13)
-    intervals_spinbox.delete(0, tk.END)
-    intervals_spinbox.insert(0, "4")
+    tk.Label(config_frame, text="Number of Feedings:", font=FONT_BOLD).grid(row=1, column=0, sticky="w", padx=5, pady=10)
+    intervals_var = tk.StringVar(value="4")
+    intervals_spinbox = tk.Spinbox(config_frame, from_=1, to=24, textvariable=intervals_var, font=FONT_BUTTON, width=13)
     intervals_spinbox.grid(row=1, column=1, sticky="w", padx=5, pady=10)
-    tk.Label(config_frame, text="Evenly distributed throughout day", font=("Arial", 9), fg="#666").grid(row=1, column=2, sticky="w", padx=5)
+    tk.Label(config_frame, text="Evenly distributed throughout day", font=FONT_SMALL, fg="#666").grid(row=1, column=2, sticky="w", padx=5)
     
     # Pump speed
-    tk.Label(config_frame, text="Pump Speed (%):", font=("Arial", 10, "bold")).grid(row=2, column=0, sticky="w", padx=5, pady=10)
-    speed_scale = tk.Scale(config_frame, from_=0, to=100, orient=tk.HORIZONTAL, length=200)
-    speed_scale.set(100)
+    tk.Label(config_frame, text="Pump Speed (%):", font=FONT_BOLD).grid(row=2, column=0, sticky="w", padx=5, pady=10)
+    speed_var = tk.IntVar(value=100)
+    speed_scale = tk.Scale(config_frame, from_=0, to=100, orient=tk.HORIZONTAL, length=200, variable=speed_var)
     speed_scale.grid(row=2, column=1, columnspan=2, sticky="w", padx=5, pady=10)
     
     # Preview frame
@@ -4224,39 +4898,45 @@ def create_food_schedule_tab(parent_frame, console_instance):
     preview_scrollbar.pack(side="right", fill="y")
     preview_text.config(yscrollcommand=preview_scrollbar.set)
     
+    last_preview_key = [None]  # Inputs of the preview currently shown
+    
     def update_preview():
         try:
             total_ms = int(total_entry.get())
             intervals = int(intervals_spinbox.get())
             speed = speed_scale.get()
             
+            # Skip the redraw when the parsed inputs match what is on screen
+            key = (total_ms, intervals, speed)
+            if key == last_preview_key[0]:
+                return
+            last_preview_key[0] = key
+            
             dose_per_interval = total_ms // intervals
-            hours_between = 24.0 / intervals
-            
-            preview_text.delete(1.0, tk.END)
-            preview_text.insert(tk.END, f"Configuration Summary\n")
-            preview_text.insert(tk.END, f"=" * 60 + "\n\n")
-            preview_text.insert(tk.END, f"Total Daily Dose:     {total_ms} ms\n")
-            preview_text.insert(tk.END, f"Number of Feedings:   {intervals}\n")
-            preview_text.insert(tk.END, f"Dose per Feeding:     {dose_per_interval} ms\n")
-            preview_text.insert(tk.END, f"Pump Speed:           {speed}%\n\n")
-            preview_text.insert(tk.END, f"Feeding Times\n")
-            preview_text.insert(tk.END, f"-" * 60 + "\n\n")
-            
-            for i in range(intervals):
-                start_hour = int(i * hours_between)
-                start_minute = int((i * hours_between - start_hour) * 60)
-                preview_text.insert(tk.END, f"Feeding {i+1:2d}:  {start_hour:02d}:{start_minute:02d}  ({dose_per_interval} ms @ {speed}%)\n")
+            
+            # Build the full preview from the prebuilt templates and write it in one insert
+            lines = [FOOD_PREVIEW_HEADER % (total_ms, intervals, dose_per_interval, speed)]
+            lines.extend(
+                FOOD_PREVIEW_LINE % (i + 1, start_hour, start_minute, dose_per_interval, speed)
+                for i, (start_hour, start_minute) in enumerate(feeding_times(intervals))
+            )
+            
+            preview_text.replace("1.0", "end-1c", "".join(lines))
         
         except ValueError:
-            preview_text.delete(1.0, tk.END)
-            preview_text.insert(tk.END, "⚠️ Invalid input. Please enter valid numbers.")
+            if last_preview_key[0] == ("err",):
+                return
+            last_preview_key[0] = ("err",)
+            preview_text.replace("1.0", "end-1c", "⚠️ Invalid input. Please enter valid numbers.")
+    
+    # Update preview when values change, debounced so typing or dragging
+    # only renders once the input settles for 120 ms
+    def schedule_preview():
+        debounce(container, "preview", 120, update_preview)
     
-    # Update preview when values change
-    total_entry.bind("<KeyRelease>", lambda e: update_preview())
-    intervals_spinbox.bind("<ButtonRelease-1>", lambda e: update_preview())
-    intervals_spinbox.bind("<KeyRelease>", lambda e: update_preview())
-    speed_scale.config(command=lambda v: update_preview())
+    # One write trace per input variable covers typing, pasting, spinning and dragging
+    for var in (total_var, intervals_var, speed_var):
+        var.trace_add("write", lambda *args: schedule_preview())
     
     # Action buttons
     action_frame = tk.Frame(container)
@@ -4273,40 +4953,38 @@ def create_food_schedule_tab(parent_frame, console_instance):
                 return
             
             # Remove existing food schedules
-            food_schedules = [name for name in console_instance.schedules if name.startswith('food_dose_')]
-            for name in food_schedules:
-                try:
-                    scheduler.remove_job(name)
-                    del console_instance.schedules[name]
-                except Exception:
-                    pass
+            console_instance.remove_food_schedules()
             
             # Create new schedules
             dose_per_interval = total_ms // intervals
-            hours_between = 24.0 / intervals
             device_info = devices[console_instance.selected_device]
             
-            for i in range(intervals):
-                start_hour = int(i * hours_between)
-                start_minute = int((i * hours_between - start_hour) * 60)
-                schedule_name = f"food_dose_{i+1}"
-                
-                console_instance.schedules[schedule_name] = {
-                    'device_name': console_instance.selected_device,
-                    'device_ip': device_info['address'],
-                    'start_time': f"{start_hour:02d}:{start_minute:02d}",
-                    'duration_minutes': 0,
-                    'frequency': 'daily',
-                    'day_of_week': None,
-                    'actions': {
-                        'food_dose': {
-                            'duration_ms': dose_per_interval,
-                            'speed': speed
-                        }
+            # All feedings share everything but the start time
+            base_entry = {
+                'device_name': console_instance.selected_device,
+                'device_ip': device_info['address'],
+                'duration_minutes': 0,
+                'frequency': 'daily',
+                'day_of_week': None,
+                'actions': {
+                    'food_dose': {
+                        'duration_ms': dose_per_interval,
+                        'speed': speed
                     }
                 }
+            }
+            
+            new_jobs = []
+            for i, (start_hour, start_minute) in enumerate(feeding_times(intervals)):
+                schedule_name = f"food_dose_{i+1}"
                 
-                console_instance.schedule_job(schedule_name, console_instance.schedules[schedule_name])
+                entry = copy.deepcopy(base_entry)  # Each entry gets its own actions dict
+                entry['start_time'] = f"{start_hour:02d}:{start_minute:02d}"
+                new_jobs.append((schedule_name, entry))
+            
+            with console_instance._schedules_lock:
+                console_instance.schedules.update(new_jobs)
+            console_instance.schedule_jobs(new_jobs)
             
             console_instance.save_schedules()
             tk.messagebox.showinfo("Success", f"Food schedule created with {intervals} daily feedings!")
@@ -4318,7 +4996,7 @@ def create_food_schedule_tab(parent_frame, console_instance):
         action_frame,
         text="🔄 Update Preview",
         command=update_preview,
-        font=("Arial", 11),
+        font=FONT_BUTTON,
         padx=15,
         pady=8
     ).pack(side="left", padx=5)
@@ -4327,7 +5005,7 @@ def create_food_schedule_tab(parent_frame, console_instance):
         action_frame,
         text="✅ Apply Schedule",
         command=apply_schedule,
-        font=("Arial", 11, "bold"),
+        font=FONT_BUTTON_BOLD,
         bg="#27ae60",
         fg="white",
         padx=15,
@@ -4338,6 +5016,38 @@ def create_food_schedule_tab(parent_frame, console_instance):
     update_preview()
 
 
+# Event Calendar dialog choices: (label, value) pairs plus the card colour per event type
+CALENDAR_EVENT_TYPES = (
+    ('💊 Dosing', 'dosing'),
+    ('💧 Water Change', 'water_change'),
+    ('🔧 Maintenance', 'maintenance'),
+    ('🌱 Milestone', 'milestone'),
+    ('📌 Custom', 'custom'),
+)
+CALENDAR_EVENT_ICONS = {
+    'dosing': '💊',
+    'water_change': '💧',
+    'maintenance': '🔧',
+    'milestone': '🌱',
+    'custom': '📌',
+}
+CALENDAR_EVENT_COLORS = {
+    'dosing': '#9b59b6',
+    'water_change': '#3498db',
+    'maintenance': '#e67e22',
+    'milestone': '#27ae60',
+    'custom': '#95a5a6',
+}
+CALENDAR_COMMANDS = (
+    ('💊 Dose Food Pump', 'dose_food'),
+    ('💧 Drain & Fill', 'drain_fill'),
+    ('🚿 Drain Only', 'drain'),
+    ('💦 Fill Only', 'fill'),
+    ('🔧 Custom API', 'custom_api'),
+    ('📝 Note Only (no action)', 'none'),
+)
+
+
 def create_routine_calendar_tab(parent_frame, console_instance):
     """
     Create the Event Calendar tab with Google Calendar-style interface.
@@ -4367,7 +5077,7 @@ def create_routine_calendar_tab(parent_frame, console_instance):
     subtitle_label = tk.Label(
         header_frame,
         text=f"Device: {console_instance.selected_device}",
-        font=("Arial", 11),
+        font=FONT_BUTTON,
         bg="#2c3e50",
         fg="#ecf0f1"
     )
@@ -4407,7 +5117,7 @@ def create_routine_calendar_tab(parent_frame, console_instance):
         weekendforeground="black",
         othermonthbackground="#dfe6e9",
         othermonthforeground="#95a5a6",
-        font=("Arial", 10),
+        font=FONT_LABEL,
         borderwidth=0
     )
     cal.pack(padx=10, pady=10)
@@ -4419,7 +5129,7 @@ def create_routine_calendar_tab(parent_frame, console_instance):
     tk.Label(
         quick_action_frame,
         text="Quick Actions:",
-        font=("Arial", 9, "bold"),
+        font=FONT_SMALL_BOLD,
         bg="white"
     ).pack(anchor="w", pady=(0, 5))
     
@@ -4450,7 +5160,7 @@ def create_routine_calendar_tab(parent_frame, console_instance):
         toolbar_frame,
         text="➕ Add Event",
         command=add_event_clicked,
-        font=("Arial", 10, "bold"),
+        font=FONT_BOLD,
         bg="#27ae60",
         fg="white",
         padx=15,
@@ -4465,7 +5175,7 @@ def create_routine_calendar_tab(parent_frame, console_instance):
     tk.Label(
         event_list_frame,
         text="Events for Selected Date",
-        font=("Arial", 11, "bold"),
+        font=FONT_BUTTON_BOLD,
         bg="white"
     ).pack(anchor="w", pady=(0, 10))
     
@@ -4512,7 +5222,7 @@ def create_routine_calendar_tab(parent_frame, console_instance):
             no_events_label = tk.Label(
                 event_cards_frame,
                 text="No events scheduled for this date.\nClick '➕ Add Event' to create one.",
-                font=("Arial", 10),
+                font=FONT_LABEL,
                 fg="#95a5a6",
                 bg="white",
                 pady=50
@@ -4544,25 +5254,18 @@ def create_routine_calendar_tab(parent_frame, console_instance):
         tk.Label(
             title_frame,
             text=time_str,
-            font=("Arial", 9, "bold"),
+            font=FONT_SMALL_BOLD,
             bg="white",
             fg=event.color
         ).pack(side="left")
         
         # Event type icon
-        type_icons = {
-            'dosing': '💊',
-            'water_change': '💧',
-            'maintenance': '🔧',
-            'milestone': '🌱',
-            'custom': '📌'
-        }
-        icon = type_icons.get(event.event_type, '📌')
+        icon = CALENDAR_EVENT_ICONS.get(event.event_type, '📌')
         
         tk.Label(
             title_frame,
             text=f"{icon} {event.title}",
-            font=("Arial", 10, "bold"),
+            font=FONT_BOLD,
             bg="white"
         ).pack(side="left", padx=10)
         
@@ -4571,7 +5274,7 @@ def create_routine_calendar_tab(parent_frame, console_instance):
             tk.Label(
                 content,
                 text=event.description,
-                font=("Arial", 9),
+                font=FONT_SMALL,
                 bg="white",
                 fg="#7f8c8d",
                 wraplength=400,
@@ -4598,7 +5301,7 @@ def create_routine_calendar_tab(parent_frame, console_instance):
             button_frame,
             text="✏️ Edit",
             command=edit_event,
-            font=("Arial", 8),
+            font=FONT_TINY,
             bg="#3498db",
             fg="white",
             padx=8,
@@ -4609,7 +5312,7 @@ def create_routine_calendar_tab(parent_frame, console_instance):
             button_frame,
             text="🗑️ Delete",
             command=delete_event,
-            font=("Arial", 8),
+            font=FONT_TINY,
             bg="#e74c3c",
             fg="white",
             padx=8,
@@ -4621,7 +5324,7 @@ def create_routine_calendar_tab(parent_frame, console_instance):
                 button_frame,
                 text="▶️ Run Now",
                 command=execute_event,
-                font=("Arial", 8),
+                font=FONT_TINY,
                 bg="#27ae60",
                 fg="white",
                 padx=8,
@@ -4634,7 +5337,7 @@ def create_routine_calendar_tab(parent_frame, console_instance):
         tk.Label(
             button_frame,
             text=enabled_text,
-            font=("Arial", 8, "bold"),
+            font=FONT_TINY_BOLD,
             bg="white",
             fg=enabled_color
         ).pack(side="right", padx=10)
@@ -4659,7 +5362,7 @@ def create_routine_calendar_tab(parent_frame, console_instance):
         tk.Label(
             dialog_frame,
             text="📝 Event Details" if event else "📝 Create New Event",
-            font=("Arial", 14, "bold")
+            font=FONT_TITLE
         ).pack(pady=(0, 20))
         
         # Form fields
@@ -4667,39 +5370,30 @@ def create_routine_calendar_tab(parent_frame, console_instance):
         form.pack(fill="both", expand=True)
         
         # Event type
-        tk.Label(form, text="Event Type:", font=("Arial", 10, "bold")).grid(row=0, column=0, sticky="w", pady=5)
+        tk.Label(form, text="Event Type:", font=FONT_BOLD).grid(row=0, column=0, sticky="w", pady=5)
         event_type_var = tk.StringVar(value=event.event_type if event else 'dosing')
         type_frame = tk.Frame(form)
         type_frame.grid(row=0, column=1, sticky="w", pady=5)
         
-        event_types = [
-            ('💊 Dosing', 'dosing', '#9b59b6'),
-            ('💧 Water Change', 'water_change', '#3498db'),
-            ('🔧 Maintenance', 'maintenance', '#e67e22'),
-            ('🌱 Milestone', 'milestone', '#27ae60'),
-            ('📌 Custom', 'custom', '#95a5a6')
-        ]
-        
-        for label, value, color in event_types:
-            rb = tk.Radiobutton(type_frame, text=label, variable=event_type_var, value=value)
-            rb.pack(anchor="w")
+        for label, value in CALENDAR_EVENT_TYPES:
+            tk.Radiobutton(type_frame, text=label, variable=event_type_var, value=value).pack(anchor="w")
         
         # Title
-        tk.Label(form, text="Title:", font=("Arial", 10, "bold")).grid(row=1, column=0, sticky="w", pady=5)
+        tk.Label(form, text="Title:", font=FONT_BOLD).grid(row=1, column=0, sticky="w", pady=5)
         title_var = tk.StringVar(value=event.title if event else '')
-        title_entry = tk.Entry(form, textvariable=title_var, font=("Arial", 10), width=40)
+        title_entry = tk.Entry(form, textvariable=title_var, font=FONT_LABEL, width=40)
         title_entry.grid(row=1, column=1, sticky="w", pady=5)
         
         # Description
-        tk.Label(form, text="Description:", font=("Arial", 10, "bold")).grid(row=2, column=0, sticky="nw", pady=5)
-        desc_text = tk.Text(form, font=("Arial", 10), width=40, height=4)
+        tk.Label(form, text="Description:", font=FONT_BOLD).grid(row=2, column=0, sticky="nw", pady=5)
+        desc_text = tk.Text(form, font=FONT_LABEL, width=40, height=4)
         desc_text.grid(row=2, column=1, sticky="w", pady=5)
         if event:
             desc_text.insert("1.0", event.description)
         
         # Date
-        tk.Label(form, text="Date:", font=("Arial", 10, "bold")).grid(row=3, column=0, sticky="w", pady=5)
-        date_entry = DateEntry(form, font=("Arial", 10), width=20)
+        tk.Label(form, text="Date:", font=FONT_BOLD).grid(row=3, column=0, sticky="w", pady=5)
+        date_entry = DateEntry(form, font=FONT_LABEL, width=20)
         if event:
             date_entry.set_date(event.scheduled_time)
         else:
@@ -4707,32 +5401,22 @@ def create_routine_calendar_tab(parent_frame, console_instance):
         date_entry.grid(row=3, column=1, sticky="w", pady=5)
         
         # Time
-        tk.Label(form, text="Time (HH:MM):", font=("Arial", 10, "bold")).grid(row=4, column=0, sticky="w", pady=5)
+        tk.Label(form, text="Time (HH:MM):", font=FONT_BOLD).grid(row=4, column=0, sticky="w", pady=5)
         time_var = tk.StringVar(value=event.scheduled_time.strftime("%H:%M") if event else "09:00")
-        time_entry = tk.Entry(form, textvariable=time_var, font=("Arial", 10), width=10)
+        time_entry = tk.Entry(form, textvariable=time_var, font=FONT_LABEL, width=10)
         time_entry.grid(row=4, column=1, sticky="w", pady=5)
         
         # Command type (for executable events)
-        tk.Label(form, text="Command:", font=("Arial", 10, "bold")).grid(row=5, column=0, sticky="w", pady=5)
+        tk.Label(form, text="Command:", font=FONT_BOLD).grid(row=5, column=0, sticky="w", pady=5)
         command_type_var = tk.StringVar(value=event.command_type if event else 'dose_food')
         command_frame = tk.Frame(form)
         command_frame.grid(row=5, column=1, sticky="w", pady=5)
         
-        commands = [
-            ('💊 Dose Food Pump', 'dose_food'),
-            ('💧 Drain & Fill', 'drain_fill'),
-            ('🚿 Drain Only', 'drain'),
-            ('💦 Fill Only', 'fill'),
-            ('🔧 Custom API', 'custom_api'),
-            ('📝 Note Only (no action)', 'none')
-        ]
-        
-        for label, value in commands:
-            rb = tk.Radiobutton(command_frame, text=label, variable=command_type_var, value=value)
-            rb.pack(anchor="w")
+        for label, value in CALENDAR_COMMANDS:
+            tk.Radiobutton(command_frame, text=label, variable=command_type_var, value=value).pack(anchor="w")
         
         # Command parameters (conditional)
-        tk.Label(form, text="Parameters:", font=("Arial", 10, "bold")).grid(row=6, column=0, sticky="nw", pady=5)
+        tk.Label(form, text="Parameters:", font=FONT_BOLD).grid(row=6, column=0, sticky="nw", pady=5)
         params_frame = tk.Frame(form)
         params_frame.grid(row=6, column=1, sticky="w", pady=5)
         
@@ -4751,7 +5435,7 @@ def create_routine_calendar_tab(parent_frame, console_instance):
         tk.Entry(dose_speed_frame, textvariable=dose_speed_var, width=10).pack(side="left", padx=5)
         
         # Recurrence
-        tk.Label(form, text="Recurrence:", font=("Arial", 10, "bold")).grid(row=7, column=0, sticky="w", pady=5)
+        tk.Label(form, text="Recurrence:", font=FONT_BOLD).grid(row=7, column=0, sticky="w", pady=5)
         recurrence_var = tk.StringVar(value=event.recurrence if event else 'none')
         recurrence_dropdown = ttk.Combobox(
             form,
@@ -4768,7 +5452,7 @@ def create_routine_calendar_tab(parent_frame, console_instance):
             form,
             text="Event Enabled",
             variable=enabled_var,
-            font=("Arial", 10, "bold")
+            font=FONT_BOLD
         ).grid(row=8, column=1, sticky="w", pady=10)
         
         # Save button
@@ -4780,18 +5464,18 @@ def create_routine_calendar_tab(parent_frame, console_instance):
                     messagebox.showerror("Error", "Title is required")
                     return
                 
-                time_str = time_var.get().strip()
-                try:
-                    time_obj = datetime.strptime(time_str, "%H:%M").time()
-                except ValueError:
+                time_match = HHMM_RE.fullmatch(time_var.get().strip())
+                if not time_match:
                     messagebox.showerror("Error", "Invalid time format. Use HH:MM")
                     return
                 
                 selected_date_obj = date_entry.get_date()
-                scheduled_datetime = datetime.combine(selected_date_obj, time_obj)
+                scheduled_datetime = datetime.combine(selected_date_obj, datetime.min.time()).replace(
+                    hour=int(time_match.group(1)), minute=int(time_match.group(2))
+                )
                 
                 # Get event type color
-                event_color = next((c for l, v, c in event_types if v == event_type_var.get()), '#3498db')
+                event_color = CALENDAR_EVENT_COLORS.get(event_type_var.get(), '#3498db')
                 
                 # Build command parameters
                 command_params = {}
@@ -4847,7 +5531,7 @@ def create_routine_calendar_tab(parent_frame, console_instance):
             button_frame,
             text="💾 Save Event",
             command=save_event,
-            font=("Arial", 11, "bold"),
+            font=FONT_BUTTON_BOLD,
             bg="#27ae60",
             fg="white",
             padx=20,
@@ -4858,7 +5542,7 @@ def create_routine_calendar_tab(parent_frame, console_instance):
             button_frame,
             text="❌ Cancel",
             command=dialog.destroy,
-            font=("Arial", 11),
+            font=FONT_BUTTON,
             bg="#95a5a6",
             fg="white",
             padx=20,
@@ -4870,12 +5554,12 @@ def create_routine_calendar_tab(parent_frame, console_instance):
         try:
             if event.command_type == 'dose_food':
                 device = devices[console_instance.selected_device]
-                url = f"https://{device['address']}:{device['port']}/api/actuators/foodpump"
+                url = f"{device['base_url']}/api/actuators/foodpump"
                 payload = {
                     'dose': event.command_params.get('dose', 750),
                     'speed': event.command_params.get('speed', 100)
                 }
-                response = console_instance.session.post(url, json=payload, timeout=10, verify=False)
+                response = console_instance.session.post(url, json=payload, timeout=10)
                 
                 if response.status_code == 200:
                     calendar_scheduler.log_execution(event.event_id, True, response_data=response.text)
@@ -4952,14 +5636,13 @@ def create_routine_calendar_tab(parent_frame, console_instance):
         tk.Label(
             selection_dialog,
             text="Select a plant profile to import feeding schedule:",
-            font=("Arial", 11, "bold")
+            font=FONT_BUTTON_BOLD
         ).pack(pady=10)
         
-        listbox = tk.Listbox(selection_dialog, font=("Arial", 10))
+        listbox = tk.Listbox(selection_dialog, font=FONT_LABEL)
         listbox.pack(fill="both", expand=True, padx=20, pady=10)
         
-        for profile in profiles:
-            listbox.insert(tk.END, profile)
+        listbox.insert(tk.END, *profiles)
         
         def import_selected():
             selection = listbox.curselection()
@@ -4999,7 +5682,7 @@ def create_routine_calendar_tab(parent_frame, console_instance):
             selection_dialog,
             text="Import Schedule",
             command=import_selected,
-            font=("Arial", 10, "bold"),
+            font=FONT_BOLD,
             bg="#27ae60",
             fg="white",
             padx=20,
@@ -5010,7 +5693,7 @@ def create_routine_calendar_tab(parent_frame, console_instance):
         quick_action_frame,
         text="🌿 Import from Plant Profile",
         command=import_from_profile,
-        font=("Arial", 9),
+        font=FONT_SMALL,
         bg="#9b59b6",
         fg="white",
         padx=10,
@@ -5021,7 +5704,7 @@ def create_routine_calendar_tab(parent_frame, console_instance):
         quick_action_frame,
         text="📋 View All Events",
         command=lambda: messagebox.showinfo("Coming Soon", "View all events list coming soon!"),
-        font=("Arial", 9),
+        font=FONT_SMALL,
         bg="#3498db",
         fg="white",
         padx=10,
@@ -5052,42 +5735,90 @@ def create_filesystem_tab(parent_frame, console_instance):
     btn_frame.pack(fill="x", pady=5)
     
     current_path = tk.StringVar(value="/lfs")
+    shown_items = []  # Mirrors the rows currently in file_list
+    shown_entries = []  # Parallel to shown_items: {'kind', 'name', 'size'} per row
+    
+    listing_seq = [0]  # Bumped per request so only the latest listing is applied
+    expanded_path = [None]  # Directory the user asked to list in full
+    
+    def row_label(entry):
+        kind = entry['kind']
+        if kind == 'file':
+            return f"📄 {entry['name']} ({entry['size']} bytes)"
+        if kind == 'dir':
+            return f"📁 {entry['name']}"
+        if kind == 'parent':
+            return "📁 .."
+        return f"… {entry['size']} more entries (double-click to show all)"
     
     def refresh_listing():
-        result = console_instance._get_filesystem_listing(current_path.get())
+        """Fetch the listing for current_path on the I/O pool and apply it on the Tk thread"""
+        # Read the Tcl variable once; each StringVar.get() is a round trip into Tcl
+        path = current_path.get()
+        listing_seq[0] += 1
+        seq = listing_seq[0]
+        set_label(status_label, text=f"Loading {path}...")
+        future = io_pool.submit(fetch_filesystem_listing_cached, console_instance, path)
+        # A failed request is shown like an empty answer: "Failed to list"
+        when_done(file_list, [future], lambda result: apply_listing(seq, path, result),
+                  on_error=lambda error: apply_listing(seq, path, None))
+    
+    def apply_listing(seq, path, result):
+        if seq != listing_seq[0]:
+            return  # A newer navigation superseded this one
         if not result:
-            tk.messagebox.showerror("Error", f"Failed to list directory: {current_path.get()}")
+            set_label(status_label, text=f"✗ Failed to list {path}")
+            tk.messagebox.showerror("Error", f"Failed to list directory: {path}")
             return
         
-        # Clear list
-        file_list.delete(0, tk.END)
+        entries = []
+        add_entry = entries.append
         
         # Add parent directory option if not at root
-        if current_path.get() != "/lfs":
-            file_list.insert(tk.END, "📁 ..")
+        if path != "/lfs":
+            add_entry({'kind': 'parent', 'name': '..', 'size': None})
         
         # Add directories
         for dir_name in result.get('directories', []):
-            file_list.insert(tk.END, f"📁 {dir_name}")
+            add_entry({'kind': 'dir', 'name': dir_name, 'size': None})
         
         # Add files
         for file_info in result.get('files', []):
-            file_list.insert(tk.END, f"📄 {file_info['name']} ({file_info['size']} bytes)")
+            add_entry({'kind': 'file', 'name': file_info['name'], 'size': file_info['size']})
         
-        path_label.config(text=f"Path: {current_path.get()}")
-        status_label.config(text=f"✓ Listed {result['total_dirs']} directories, {result['total_files']} files")
+        # Huge directories show the first FILE_LIST_MAX_ROWS rows plus a marker row
+        # that expands the rest on double-click
+        if expanded_path[0] != path and len(entries) > FILE_LIST_MAX_ROWS:
+            hidden = len(entries) - FILE_LIST_MAX_ROWS
+            entries = entries[:FILE_LIST_MAX_ROWS]
+            entries.append({'kind': 'more', 'name': None, 'size': hidden})
+        
+        # Only rows that changed since the last listing are deleted/inserted
+        sync_listbox(file_list, shown_items, [row_label(entry) for entry in entries])
+        shown_entries[:] = entries
+        
+        set_label(path_label, text=f"Path: {path}")
+        set_label(status_label, text=f"✓ Listed {result['total_dirs']} directories, {result['total_files']} files")
     
     def on_item_double_click(event):
         selection = file_list.curselection()
         if not selection:
             return
         
-        item = file_list.get(selection[0])
+        entry = shown_entries[selection[0]]
+        kind = entry['kind']
+        path = current_path.get()
+        
+        # Expand a truncated listing
+        if kind == 'more':
+            expanded_path[0] = path
+            refresh_listing()
+            return
         
         # Handle parent directory
-        if item == "📁 ..":
+        if kind == 'parent':
             # Go up one level
-            parts = current_path.get().rstrip('/').split('/')
+            parts = path.rstrip('/').split('/')
             if len(parts) > 2:  # Don't go above /lfs
                 current_path.set('/'.join(parts[:-1]))
             else:
@@ -5096,40 +5827,59 @@ def create_filesystem_tab(parent_frame, console_instance):
             return
         
         # Handle directory
-        if item.startswith("📁"):
-            dir_name = item.split(" ", 1)[1]
-            new_path = f"{current_path.get()}/{dir_name}".replace("//", "/")
-            current_path.set(new_path)
+        if kind == 'dir':
+            current_path.set(posixpath.join(path, entry['name']))
             refresh_listing()
             return
         
         # Handle file
-        if item.startswith("📄"):
-            file_name = item.split(" ", 1)[1].split(" (")[0]
-            file_path = f"{current_path.get()}/{file_name}".replace("//", "/")
+        if kind == 'file':
+            file_name = entry['name']
+            file_path = posixpath.join(path, file_name)
             
             # Read file content
-            result = console_instance._read_file_content(file_path)
+            result = read_file_content_cached(console_instance, file_path, entry['size'])
             if not result:
                 tk.messagebox.showerror("Error", f"Failed to read file: {file_path}")
                 return
             
-            # Display in right panel
-            content_text.delete(1.0, tk.END)
+            # Display in right panel (JSON files pretty-printed)
             content = result.get('content', '')
-            
-            # Try to pretty-print JSON
-            try:
-                parsed = json.loads(content)
-                content = json.dumps(parsed, indent=2)
-            except:
-                pass
-            
-            content_text.insert(tk.END, content)
-            content_path_label.config(text=f"File: {file_path} ({result['size']} bytes)")
-            status_label.config(text=f"✓ Loaded file: {file_name}")
-    
-    refresh_btn = tk.Button(btn_frame, text="🔄 Refresh", command=refresh_listing, width=10)
+            show_content(format_file_content(file_path, content))
+            raw_note = " (large file: raw view)" if is_raw_json_view(file_path, content) else ""
+            set_label(content_path_label, text=f"File: {file_path} ({result['size']} bytes){raw_note}")
+            set_label(status_label, text=f"✓ Loaded file: {file_name}")
+    
+    insert_after_id = [None]  # Pending chunk insert, cancelled when another file is opened
+    
+    def show_content(content):
+        """Fill the viewer in CONTENT_CHUNK_SIZE pieces, letting Tk repaint between them"""
+        if insert_after_id[0] is not None:
+            content_text.after_cancel(insert_after_id[0])
+            insert_after_id[0] = None
+        
+        def insert_chunk(offset):
+            insert_after_id[0] = None
+            content_text.config(state='normal')
+            content_text.insert(tk.END, content[offset:offset + CONTENT_CHUNK_SIZE])
+            schedule_next(offset + CONTENT_CHUNK_SIZE)
+        
+        def schedule_next(next_offset):
+            if next_offset < len(content):
+                content_text.config(state='disabled')
+                insert_after_id[0] = content_text.after_idle(insert_chunk, next_offset)
+        
+        # The first chunk replaces the old file in a single Text call
+        content_text.config(state='normal')
+        content_text.replace("1.0", "end-1c", content[:CONTENT_CHUNK_SIZE])
+        schedule_next(CONTENT_CHUNK_SIZE)
+    
+    def force_refresh():
+        # Explicit refresh always goes to the device
+        fs_listing_cache.pop((console_instance.selected_device, current_path.get()), None)
+        refresh_listing()
+    
+    refresh_btn = tk.Button(btn_frame, text="🔄 Refresh", command=force_refresh, width=10)
     refresh_btn.pack(side="left", padx=2)
     
     root_btn = tk.Button(btn_frame, text="🏠 Root", command=lambda: [current_path.set("/lfs"), refresh_listing()], width=10)
@@ -5198,21 +5948,30 @@ def create_plant_info_tab(parent_frame, console_instance):
     
     info_labels = {}
     
-    def refresh_plant_info():
-        result = console_instance._get_plant_info()
+    def refresh_plant_info(max_age=PLANT_INFO_TTL):
+        """Fetch plant info on the I/O pool; the Refresh button stays disabled until it lands"""
+        if str(refresh_btn.cget("state")) == "disabled":
+            return  # A fetch is already in flight
+        refresh_btn.config(state="disabled")
+        future = io_pool.submit(fetch_plant_info_cached, console_instance, max_age)
+        # On errors apply_plant_info(None) re-enables Refresh and shows the failure
+        when_done(container, [future], apply_plant_info, on_error=lambda error: apply_plant_info(None))
+    
+    def apply_plant_info(result):
+        refresh_btn.config(state="normal")
         
         if not result or not result.get('exists'):
             for key in info_labels:
-                info_labels[key].config(text="(not set)")
-            status_label.config(text="ℹ️ No plant information found", fg="#e67e22")
+                set_label(info_labels[key], text="(not set)")
+            set_label(status_label, text="ℹ️ No plant information found", fg="#e67e22")
             return
         
-        info_labels['name'].config(text=result.get('plant_name', 'Unknown'))
-        info_labels['date'].config(text=result.get('start_date', 'Unknown'))
-        info_labels['timestamp'].config(text=str(result.get('start_timestamp', 'Unknown')))
-        info_labels['days'].config(text=str(result.get('days_growing', 0)))
+        set_label(info_labels['name'], text=result.get('plant_name', 'Unknown'))
+        set_label(info_labels['date'], text=result.get('start_date', 'Unknown'))
+        set_label(info_labels['timestamp'], text=str(result.get('start_timestamp', 'Unknown')))
+        set_label(info_labels['days'], text=str(result.get('days_growing', 0)))
         
-        status_label.config(text="✅ Plant information loaded", fg="#27ae60")
+        set_label(status_label, text="✅ Plant information loaded", fg="#27ae60")
     
     # Info display grid
     fields = [
@@ -5243,14 +6002,15 @@ def create_plant_info_tab(parent_frame, console_instance):
     preset_frame = tk.Frame(edit_frame)
     preset_frame.grid(row=1, column=2, padx=5)
     
-    def set_today():
+    def set_date_preset(days):
         date_entry.delete(0, tk.END)
-        date_entry.insert(0, datetime.now().strftime("%Y-%m-%d"))
+        date_entry.insert(0, date_days_ago(days))
+    
+    def set_today():
+        set_date_preset(0)
     
     def set_week_ago():
-        date_entry.delete(0, tk.END)
-        week_ago = datetime.now() - timedelta(days=7)
-        date_entry.insert(0, week_ago.strftime("%Y-%m-%d"))
+        set_date_preset(7)
     
     tk.Button(preset_frame, text="Today", command=set_today, width=8).pack(side="left", padx=2)
     tk.Button(preset_frame, text="1 Week Ago", command=set_week_ago, width=12).pack(side="left", padx=2)
@@ -5269,22 +6029,25 @@ def create_plant_info_tab(parent_frame, console_instance):
             return
         
         # Validate date format
-        try:
-            datetime.strptime(date, "%Y-%m-%d")
-        except ValueError:
+        if not is_valid_date(date):
             tk.messagebox.showerror("Error", "Invalid date format. Use YYYY-MM-DD")
             return
         
-        # Save to device
-        result = console_instance._set_plant_info(name, date)
+        # Save to device in the background
+        save_btn.config(state="disabled")
+        future = io_pool.submit(console_instance._set_plant_info, name, date)
         
-        if result:
-            status_label.config(text="✅ Plant information saved successfully!", fg="#27ae60")
-            refresh_plant_info()
-            tk.messagebox.showinfo("Success", "Plant information saved!")
-        else:
-            status_label.config(text="❌ Failed to save plant information", fg="#e74c3c")
-            tk.messagebox.showerror("Error", "Failed to save plant information")
+        def on_saved(result):
+            save_btn.config(state="normal")
+            if result:
+                set_label(status_label, text="✅ Plant information saved successfully!", fg="#27ae60")
+                refresh_plant_info()
+                tk.messagebox.showinfo("Success", "Plant information saved!")
+            else:
+                set_label(status_label, text="❌ Failed to save plant information", fg="#e74c3c")
+                tk.messagebox.showerror("Error", "Failed to save plant information")
+        
+        when_done(container, [future], on_saved, on_error=lambda error: on_saved(None))
     
     save_btn = tk.Button(
         edit_frame,
@@ -5305,7 +6068,7 @@ def create_plant_info_tab(parent_frame, console_instance):
     refresh_btn = tk.Button(
         action_frame,
         text="🔄 Refresh",
-        command=refresh_plant_info,
+        command=lambda: refresh_plant_info(max_age=0),  # Explicit refresh goes to the device
         font=("Arial", 10),
         padx=15,
         pady=5
@@ -5474,17 +6237,19 @@ def create_plant_profiles_tab(parent_frame, console_instance):
                                      "Add JSON profile files to the plant_profiles directory.")
             return
         
-        # Load and display profiles
+        # Load and display profiles (inserted into the listbox in one call)
+        items = []
         for filename in sorted(profile_files):
             filepath = os.path.join(profiles_dir, filename)
             try:
                 with open(filepath, 'r') as f:
                     profile_data = json.load(f)
                     plant_name = profile_data.get('plant_info', {}).get('name', filename)
-                    profiles_listbox.insert(tk.END, f"🌱 {plant_name}")
+                    items.append(f"🌱 {plant_name}")
             except Exception as e:
-                profiles_listbox.insert(tk.END, f"⚠️ {filename} (error)")
+                items.append(f"⚠️ {filename} (error)")
                 logging.error(f"Failed to load profile {filename}: {e}")
+        profiles_listbox.insert(tk.END, *items)
         
         status_label.config(text=f"✅ Found {len(profile_files)} profile(s)", fg="#27ae60")
     
@@ -5519,8 +6284,7 @@ def create_plant_profiles_tab(parent_frame, console_instance):
                     continue
         
         if not profile_file or not current_profile[0]:
-            details_text.delete(1.0, tk.END)
-            details_text.insert(1.0, "Error loading profile")
+            details_text.replace("1.0", "end-1c", "Error loading profile")
             apply_btn.config(state="disabled")
             return
         
@@ -5763,39 +6527,109 @@ def test_filesystem_browser_gui(console_instance):
     button_frame = tk.Frame(main_frame)
     button_frame.pack(pady=(10, 0))
     
-    def load_directory(path):
-        """Load and display directory contents"""
+    request_seq = [0]  # Bumped per request so a slow reply can't overwrite a newer one
+    expanded_path = [None]  # Directory the user asked to list in full
+    listing_futures = OrderedDict()  # path -> (monotonic time, Future), least recently used first
+    prefetch_futures = []  # Speculative fetches queued by the last prefetch_neighbours()
+    row_meta = []  # (kind, name[, size]) for each listbox row
+    
+    def listing_future(path, max_age=FS_PREFETCH_TTL, pool=io_pool):
+        """Return a Future for the listing of path, reusing a recent or in-flight fetch"""
+        cached = listing_futures.get(path)
+        if cached and time.monotonic() - cached[0] < max_age:
+            future = cached[1]
+            # A finished fetch that failed (None) is retried
+            if not future.done() or future.result():
+                listing_futures.move_to_end(path)
+                return future
+        
+        future = pool.submit(console_instance._get_filesystem_listing, path)
+        listing_futures[path] = (time.monotonic(), future)
+        listing_futures.move_to_end(path)
+        while len(listing_futures) > FS_PREFETCH_CACHE_SIZE:
+            listing_futures.popitem(last=False)
+        return future
+    
+    def prefetch_neighbours(path, dirs):
+        """Start fetching likely next stops while the user reads the current listing"""
+        targets = [posixpath.join(path, dir_name) for dir_name in dirs[:FS_PREFETCH_DIRS]]
+        if path != "/lfs":
+            targets.append(posixpath.dirname(path.rstrip('/')) or "/lfs")
+        prefetch_futures[:] = [listing_future(target, pool=prefetch_pool) for target in targets]
+    
+    def cancel_prefetch():
+        """Drop queued prefetches so a navigation doesn't wait behind (or refetch) them"""
+        for future in prefetch_futures:
+            if future.cancel():
+                for cached_path, (_, cached) in list(listing_futures.items()):
+                    if cached is future:
+                        del listing_futures[cached_path]
+        prefetch_futures.clear()
+    
+    def load_directory(path, max_age=FS_PREFETCH_TTL):
+        """Load and display directory contents (the request runs on the I/O pool)"""
         current_path.set(path)
         status_var.set(f"Loading {path}...")
         items_listbox.delete(0, tk.END)
         content_text.delete(1.0, tk.END)
         
-        # Get listing from device
-        data = console_instance._get_filesystem_listing(path)
+        row_meta.clear()
+        
+        request_seq[0] += 1
+        seq = request_seq[0]
+        cancel_prefetch()
+        future = listing_future(path, max_age)
+        when_done(root, [future], lambda data: show_directory(seq, path, data))
+    
+    def show_directory(seq, path, data):
+        if seq != request_seq[0]:
+            return
         
         if not data:
             status_var.set("Error: Failed to load directory")
             items_listbox.insert(tk.END, "✗ Failed to load directory")
+            row_meta[:] = [('error', None)]
             return
         
+        items = []
+        meta = []  # (kind, name[, size]) per row, parallel to items
+        
         # Add parent directory option if not at root
         if path != "/lfs":
-            items_listbox.insert(tk.END, "📁 .. (parent)")
+            items.append("📁 .. (parent)")
+            meta.append(('parent', None))
+        
+        dirs = sorted(data.get('directories', ()))
+        files = sorted(data.get('files', ()), key=itemgetter('name'))
+        
+        # Only format the first FILE_LIST_MAX_ROWS rows unless this directory was expanded
+        total_items = len(dirs) + len(files)
+        room = total_items if expanded_path[0] == path else FILE_LIST_MAX_ROWS
+        shown_dirs = dirs[:room]
+        shown_files = files[:room - len(shown_dirs)]
         
         # Add directories
-        dirs = sorted(data.get('directories', []))
-        for dir_name in dirs:
-            items_listbox.insert(tk.END, f"📁 {dir_name}/")
+        items.extend(f"📁 {dir_name}/" for dir_name in shown_dirs)
+        meta.extend(('dir', dir_name) for dir_name in shown_dirs)
         
         # Add files
-        files = sorted(data.get('files', []), key=lambda x: x['name'])
-        for file in files:
+        for file in shown_files:
             size_kb = file['size'] / 1024.0
             size_str = f"{size_kb:.1f}KB" if size_kb >= 1 else f"{file['size']}B"
-            items_listbox.insert(tk.END, f"📄 {file['name']} ({size_str})")
+            items.append(f"📄 {file['name']} ({size_str})")
+            meta.append(('file', file['name'], file['size']))
+        
+        hidden = total_items - len(shown_dirs) - len(shown_files)
+        if hidden > 0:
+            items.append(f"… {hidden} more (double-click to show all)")
+            meta.append(('more', None))
+        
+        # One Tcl call for the whole listing
+        items_listbox.insert(tk.END, *items)
+        row_meta[:] = meta
         
-        total_items = len(dirs) + len(files)
         status_var.set(f"Loaded {total_items} items from {path}")
+        prefetch_neighbours(path, dirs)
     
     def on_item_double_click(event):
         """Handle double-click on listbox item"""
@@ -5803,10 +6637,16 @@ def test_filesystem_browser_gui(console_instance):
         if not selection:
             return
         
-        item = items_listbox.get(selection[0])
+        kind, name, *rest = row_meta[selection[0]]
+        
+        # Expand a truncated listing
+        if kind == 'more':
+            expanded_path[0] = current_path.get()
+            load_directory(expanded_path[0])
+            return
         
         # Handle parent directory
-        if item.startswith("📁 .. (parent)"):
+        if kind == 'parent':
             parent_path = "/".join(current_path.get().rstrip('/').split('/')[:-1])
             if not parent_path:
                 parent_path = "/lfs"
@@ -5814,52 +6654,52 @@ def test_filesystem_browser_gui(console_instance):
             return
         
         # Handle directory navigation
-        if item.startswith("📁"):
-            dir_name = item.split(" ", 1)[1].rstrip('/')
-            new_path = f"{current_path.get().rstrip('/')}/{dir_name}"
-            load_directory(new_path)
+        if kind == 'dir':
+            load_directory(posixpath.join(current_path.get(), name))
             return
         
         # Handle file viewing
-        if item.startswith("📄"):
-            file_name = item.split(" ", 1)[1].split(" (")[0]
-            file_path = f"{current_path.get().rstrip('/')}/{file_name}"
+        if kind == 'file':
+            file_name = name
+            file_path = posixpath.join(current_path.get(), file_name)
             
             status_var.set(f"Loading {file_name}...")
             content_text.delete(1.0, tk.END)
             
-            # Read file content
-            data = console_instance._read_file_content(file_path)
-            
-            if not data:
-                status_var.set(f"Error: Failed to read {file_name}")
-                content_text.insert(1.0, f"✗ Failed to read file: {file_path}")
-                return
-            
-            content = data.get('content', '')
-            
-            # Try to pretty-print JSON
-            try:
-                json_content = json.loads(content)
-                formatted_content = json.dumps(json_content, indent=2)
-                content_text.insert(1.0, formatted_content)
-            except:
-                # Not JSON, display as-is
-                content_text.insert(1.0, content)
-            
-            status_var.set(f"Viewing: {file_name} ({data.get('size', 0)} bytes)")
+            # Read file content in the background
+            request_seq[0] += 1
+            seq = request_seq[0]
+            future = io_pool.submit(console_instance._read_file_content, file_path)
+            when_done(root, [future], lambda data: show_file(seq, file_name, file_path, data))
     
+    def show_file(seq, file_name, file_path, data):
+        if seq != request_seq[0]:
+            return
+        
+        if not data:
+            status_var.set(f"Error: Failed to read {file_name}")
+            content_text.insert(1.0, f"✗ Failed to read file: {file_path}")
+            return
+        
+        # Try to pretty-print JSON files
+        content = data.get('content', '')
+        content_text.replace("1.0", "end-1c", format_file_content(file_path, content))
+        
+        raw_note = " (large file: raw view)" if is_raw_json_view(file_path, content) else ""
+        status_var.set(f"Viewing: {file_name} ({data.get('size', 0)} bytes){raw_note}")
+    
+    # Nav buttons share one debounce key: a burst of clicks loads only the last target
     def refresh():
         """Refresh current directory"""
-        load_directory(current_path.get())
+        debounce(root, "nav", 250, lambda: load_directory(current_path.get(), max_age=0))
     
     def go_to_root():
         """Navigate to root directory"""
-        load_directory("/lfs")
+        debounce(root, "nav", 250, lambda: load_directory("/lfs"))
     
     def go_to_config():
         """Navigate to config directory"""
-        load_directory("/lfs/config")
+        debounce(root, "nav", 250, lambda: load_directory("/lfs/config"))
     
     # Bind double-click event
     items_listbox.bind("<Double-Button-1>", on_item_double_click)
@@ -5946,15 +6786,15 @@ def test_plant_info_gui(console_instance):
     preset_frame = tk.Frame(edit_frame)
     preset_frame.grid(row=2, column=1, sticky="w", pady=5, padx=(10, 0))
     
-    def set_today():
-        today = datetime.now().strftime('%Y-%m-%d')
+    def set_date_preset(days):
         start_date_entry.delete(0, tk.END)
-        start_date_entry.insert(0, today)
+        start_date_entry.insert(0, date_days_ago(days))
+    
+    def set_today():
+        set_date_preset(0)
     
     def set_week_ago():
-        week_ago = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
-        start_date_entry.delete(0, tk.END)
-        start_date_entry.insert(0, week_ago)
+        set_date_preset(7)
     
     tk.Button(preset_frame, text="Today", command=set_today, width=10).pack(side="left", padx=(0, 5))
     tk.Button(preset_frame, text="1 Week Ago", command=set_week_ago, width=12).pack(side="left")
@@ -5965,11 +6805,19 @@ def test_plant_info_gui(console_instance):
                            font=("Arial", 9), wraplength=500, justify="left")
     status_label.pack(pady=(0, 10))
     
-    def load_plant_info():
-        """Load current plant info from device"""
+    def load_plant_info(max_age=PLANT_INFO_TTL):
+        """Fetch current plant info on the I/O pool; Refresh stays disabled until it lands"""
+        if str(refresh_btn.cget("state")) == "disabled":
+            return  # A fetch is already in flight
+        refresh_btn.config(state="disabled")
         status_var.set("Loading plant information...")
-        
-        data = console_instance._get_plant_info()
+        future = io_pool.submit(fetch_plant_info_cached, console_instance, max_age)
+        # On errors apply_plant_info(None) re-enables Refresh and shows the failure
+        when_done(root, [future], apply_plant_info, on_error=lambda error: apply_plant_info(None))
+    
+    def apply_plant_info(data):
+        """Fill the labels and edit fields in one Tk callback, so the frame redraws once"""
+        refresh_btn.config(state="normal")
         
         if not data:
             status_var.set("❌ Error: Failed to load plant information")
@@ -6009,30 +6857,34 @@ def test_plant_info_gui(console_instance):
             return
         
         # Validate date format
-        try:
-            datetime.strptime(start_date, '%Y-%m-%d')
-        except ValueError:
+        if not is_valid_date(start_date):
             status_var.set("❌ Error: Invalid date format. Use YYYY-MM-DD")
             return
         
         status_var.set("Saving plant information...")
+        save_btn.config(state="disabled")
+        future = io_pool.submit(console_instance._set_plant_info, plant_name, start_date)
+        
+        def on_saved(success):
+            save_btn.config(state="normal")
+            if success:
+                status_var.set("✅ Plant information saved successfully!")
+                load_plant_info()  # Reload to show updated info
+            else:
+                status_var.set("❌ Error: Failed to save plant information")
         
-        success = console_instance._set_plant_info(plant_name, start_date)
-        
-        if success:
-            status_var.set("✅ Plant information saved successfully!")
-            load_plant_info()  # Reload to show updated info
-        else:
-            status_var.set("❌ Error: Failed to save plant information")
+        when_done(root, [future], on_saved, on_error=lambda error: on_saved(False))
     
     # Button frame
     button_frame = tk.Frame(main_frame)
     button_frame.pack(pady=(10, 0))
     
-    tk.Button(button_frame, text="🔄 Refresh", command=load_plant_info, 
-             width=15, bg="#4CAF50", fg="white", font=("Arial", 10, "bold")).pack(side="left", padx=5)
-    tk.Button(button_frame, text="💾 Save", command=save_plant_info, 
-             width=15, bg="#2196F3", fg="white", font=("Arial", 10, "bold")).pack(side="left", padx=5)
+    refresh_btn = tk.Button(button_frame, text="🔄 Refresh", command=lambda: load_plant_info(max_age=0), 
+                            width=15, bg="#4CAF50", fg="white", font=("Arial", 10, "bold"))
+    refresh_btn.pack(side="left", padx=5)
+    save_btn = tk.Button(button_frame, text="💾 Save", command=save_plant_info, 
+                         width=15, bg="#2196F3", fg="white", font=("Arial", 10, "bold"))
+    save_btn.pack(side="left", padx=5)
     tk.Button(button_frame, text="Close", command=root.destroy, 
              width=15, font=("Arial", 10)).pack(side="left", padx=5)
     
@@ -6042,28 +6894,70 @@ def test_plant_info_gui(console_instance):
     root.mainloop()
 
 
+class DeviceHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose connection pools all share one prebuilt SSLContext.
+    Sockets also get SO_KEEPALIVE so idle pooled connections to a device that went
+    away are noticed by the OS instead of failing the next request.
+    """
+    socket_options = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+
+    def __init__(self, ssl_context, **kwargs):
+        self.ssl_context = ssl_context  # Needed before HTTPAdapter.__init__ builds the pool manager
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = self.ssl_context
+        kwargs['socket_options'] = self.socket_options
+        return super().init_poolmanager(*args, **kwargs)
+
 class HydroponicsServiceListener:
     def __init__(self, console):
         self.console = console
+        # zeroconf calls us on its own thread; resolving the service and rescheduling jobs
+        # happen on this single worker instead, so mDNS processing never waits on them
+        # and add/remove events are still handled in the order they arrived
+        self._discovery_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="growpod-discovery")
+        # Set once the first device has been resolved, so startup can stop waiting early
+        self.first_seen = threading.Event()
 
     def add_service(self, zeroconf, type, name):
+        self._discovery_executor.submit(self._handle_added, zeroconf, type, name)
+
+    def remove_service(self, zeroconf, type, name):
+        self._discovery_executor.submit(self._handle_removed, zeroconf, type, name)
+
+    def _handle_added(self, zeroconf, type, name):
         info = zeroconf.get_service_info(type, name)
         if info:
             address = socket.inet_ntoa(info.addresses[0])
             device_name = info.server.replace('.local.', '')
-            devices[device_name] = {
-                'address': address,
-                'port': info.port,
-            }
+            with devices_lock:
+                if device_name not in devices:
+                    device_order.append(device_name)
+                devices[device_name] = {
+                    'address': address,
+                    'port': info.port,
+                    # Built once here; scheduled commands append their API path to it
+                    'base_url': f"https://{address}:{info.port}",
+                    # Row text for the device selector
+                    'display': f"🌱 {device_name} ({address}:{info.port})",
+                }
+            devices_changed.set()
+            self.first_seen.set()
             print(f"Discovered device: {device_name} at {address}:{info.port}")
             self.console.device_added(device_name)
 
-    def remove_service(self, zeroconf, type, name):
+    def _handle_removed(self, zeroconf, type, name):
         info = zeroconf.get_service_info(type, name)
         if info:
             device_name = info.server.replace('.local.', '')
-            if device_name in devices:
-                del devices[device_name]
+            with devices_lock:
+                removed = devices.pop(device_name, None) is not None
+                if removed:
+                    device_order.remove(device_name)
+            if removed:
+                devices_changed.set()
                 print(f"Device removed: {device_name}")
                 self.console.device_removed(device_name)
 
@@ -6077,6 +6971,9 @@ class HydroponicsConsole(Cmd):
     
     def __init__(self):
         super().__init__()
+        # Set while a device is selected (see the selected_device property)
+        self._device_selected_evt = threading.Event()
+        self._stop_polling = threading.Event()
         self.selected_device = None  # Initialize selected_device to None
 
         # Updated custom commands:
@@ -6122,6 +7019,7 @@ class HydroponicsConsole(Cmd):
             'exit': 'Exit the console.',
             'hostname_suffix': 'Set mDNS suffix: hostname_suffix <suffix>',
             'rescan': 'Re-initialize Zeroconf to discover devices again.',
+            'cache_stats': 'Show hit/miss counts for the device response caches.',
         }
 
         # Initialize flow status tracking
@@ -6131,10 +7029,13 @@ class HydroponicsConsole(Cmd):
             'overflow': False
         }
         self.polling_interval = 1  # Poll every 1 second
+        self._help_text = None  # Grouped command listing, built on first 'help'
+        self.max_polling_interval = 10  # Backed off to while the readings don't change
 
         # Track previous system status
         self.previous_system_status = None
 
+        # The background poller is disabled; poll_sensors only runs if this is re-enabled
         # # Start the background polling thread
         # self.polling_thread = threading.Thread(target=self.poll_sensors)
         # self.polling_thread.daemon = True
@@ -6143,27 +7044,72 @@ class HydroponicsConsole(Cmd):
         # HTTP session config
         self.session = requests.Session()
         self.session.verify = False  # In production, use a proper CA bundle
-
-        # If mutual TLS is enabled, set client cert and key
+        # One TLS context for every device connection, built once instead of per socket
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+        # If mutual TLS is enabled, load the client cert and key into it
         if os.path.exists(client_cert) and os.path.exists(client_key):
-            self.session.cert = (client_cert, client_key)
+            ssl_context.load_cert_chain(client_cert, client_key)
+        # Small blocking pool so GUI sync, polling and schedule commands share a few
+        # keep-alive sockets (the ESP32 server only has a handful to give).  Connect
+        # failures (nothing was sent yet) and gateway errors on GETs are retried with a
+        # short backoff; POSTs such as actuator commands are never re-sent.  When the
+        # retries run out the last response is returned, so callers still see its status.
+        self.session.mount('https://', DeviceHTTPAdapter(
+            ssl_context,
+            pool_maxsize=HTTP_POOL_SIZE, pool_block=True,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504),
+                              allowed_methods=frozenset({'GET', 'HEAD'}), raise_on_status=False)))
         
         # Dictionary to store schedules
         self.schedules = {}
+        # Names of the generated food_dose_* schedules, so they can be replaced without scanning
+        self._food_schedule_names = set()
+        # st_mtime_ns of schedules_file as last loaded or saved, so an unchanged file isn't re-parsed
+        self._schedules_mtime = None
+        # save_schedules() only marks the schedules dirty; a writer thread coalesces the
+        # edits into one atomic rewrite of schedules_file.  Every change to self.schedules
+        # (from the cmd thread, Tk or discovery) holds _schedules_lock, so the writer can
+        # serialise a consistent dict; _schedules_write_lock orders the file writes
+        self._schedules_dirty = threading.Event()
+        self._schedules_lock = threading.RLock()
+        self._schedules_write_lock = threading.Lock()
+        threading.Thread(target=self._schedules_writer_loop, name="schedules-writer", daemon=True).start()
         
         # Load existing schedules from JSON
         self.load_schedules()
 
+    @property
+    def selected_device(self):
+        return self._selected_device
+
+    @selected_device.setter
+    def selected_device(self, device_name):
+        self._selected_device = device_name
+        if device_name:
+            self._device_selected_evt.set()
+        else:
+            self._device_selected_evt.clear()
+
+    def shutdown(self):
+        'Stop background polling and write out pending schedule changes'
+        self._stop_polling.set()
+        self.flush_schedules()
+
     def device_added(self, device_name):
         print(f"Handling schedules for newly added device: {device_name}")
         # Re-schedule any relevant tasks
-        for name, details in self.schedules.items():
-            if details['device_name'] == device_name:
-                self.schedule_job(name, details)
+        with self._schedules_lock:
+            matching = [(name, details) for name, details in self.schedules.items()
+                        if details['device_name'] == device_name]
+        self.schedule_jobs(matching)
 
     def device_removed(self, device_name):
         print(f"Handling schedules for removed device: {device_name}")
-        for name, details in self.schedules.items():
+        with self._schedules_lock:
+            items = tuple(self.schedules.items())
+        for name, details in items:
             if details['device_name'] == device_name:
                 try:
                     scheduler.remove_job(name)
@@ -6173,25 +7119,57 @@ class HydroponicsConsole(Cmd):
 
     def load_schedules(self):
         'Load schedules from the JSON file and add them to the scheduler'
-        if not os.path.exists(schedules_file):
-            return
+        try:
+            mtime = os.stat(schedules_file).st_mtime_ns
+        except OSError:
+            return  # No schedules saved yet
+        if mtime == self._schedules_mtime:
+            return  # Unchanged since we last loaded or wrote it
         
         try:
-            with open(schedules_file, 'r') as f:
-                self.schedules = json.load(f)
+            with open(schedules_file, 'rb') as f:
+                loaded = json.loads(f.read())
+            self._schedules_mtime = mtime
         except Exception as e:
             print(f"Error loading schedules: {e}")
-            self.schedules = {}
+            with self._schedules_lock:
+                self.schedules = {}
             return
+        with self._schedules_lock:
+            self.schedules = loaded
+        
+        self._food_schedule_names = {name for name in loaded if name.startswith('food_dose_')}
         
-        for name, details in self.schedules.items():
+        ready_jobs = []
+        for name, details in loaded.items():
             device_name = details.get('device_name')
             if device_name in devices:
-                self.schedule_job(name, details)
+                ready_jobs.append((name, details))
             else:
                 print(f"Device '{device_name}' not found for schedule '{name}'. Will schedule when device is available.")
+        self.schedule_jobs(ready_jobs)
+
+    def schedule_jobs(self, jobs):
+        'Schedule several (name, details) jobs'
+        for name, details in jobs:
+            self.schedule_job(name, details)
+
+    def remove_food_schedules(self):
+        'Unschedule and forget every food_dose_* schedule, returning the removed names'
+        removed = sorted(self._food_schedule_names)
+        with self._schedules_lock:
+            for name in removed:
+                try:
+                    scheduler.remove_job(name)
+                except JobLookupError:
+                    pass  # Never scheduled (device offline) or already removed by device_removed
+                self.schedules.pop(name, None)
+        self._food_schedule_names.clear()
+        return removed
 
     def schedule_job(self, name, details):
+        if name.startswith('food_dose_'):
+            self._food_schedule_names.add(name)
         device_name = details.get('device_name')
         actions = details.get('actions', {})
         duration = details.get('duration_minutes', 0)
@@ -6199,23 +7177,13 @@ class HydroponicsConsole(Cmd):
         start_time_str = details.get('start_time', '00:00')
         day_of_week = details.get('day_of_week', None)
         
-        try:
-            start_time = datetime.strptime(start_time_str, "%H:%M").time()
-        except ValueError:
+        start_time = parse_hhmm(start_time_str)
+        if start_time is None:
             print(f"Invalid start time format for schedule '{name}'. Skipping.")
             return
         
         if frequency == 'weekly':
-            days_map = {
-                'monday': 'mon',
-                'tuesday': 'tue',
-                'wednesday': 'wed',
-                'thursday': 'thu',
-                'friday': 'fri',
-                'saturday': 'sat',
-                'sunday': 'sun'
-            }
-            day_short = days_map.get(day_of_week.lower(), None)
+            day_short = DAY_ABBREVIATIONS.get(day_of_week.lower(), None)
             if not day_short:
                 print(f"Invalid day of week for schedule '{name}'. Skipping.")
                 return
@@ -6255,35 +7223,35 @@ class HydroponicsConsole(Cmd):
     def execute_schedule(self, name, device_name, actions, duration):
         if device_name not in devices:
             print(f"Device '{device_name}' not found for schedule '{name}'. Retrying in 10 seconds.")
-            threading.Timer(10, self.execute_schedule, args=[name, device_name, actions, duration]).start()
+            scheduler.add_job(
+                self.execute_schedule,
+                'date',
+                run_date=datetime.now() + timedelta(seconds=10),
+                args=[name, device_name, actions, duration]
+            )
             return
 
         print(f"\nExecuting schedule '{name}' for device '{device_name}' at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         device_info = devices[device_name]
 
-        # Send commands to actuators
-        for actuator, command in actions.items():
+        # Send commands to actuators.  They are independent, so fan them out and
+        # wait for the slowest instead of the sum of the round trips.
+        if len(actions) > 1:
+            with ThreadPoolExecutor(max_workers=min(HTTP_POOL_SIZE, len(actions))) as pool:
+                futures = {
+                    pool.submit(self._send_schedule_action, device_info, actuator, command): actuator
+                    for actuator, command in actions.items()
+                }
+                results = [(futures[future], future.result) for future in as_completed(futures)]
+        else:
+            results = [
+                (actuator, lambda a=actuator, c=command: self._send_schedule_action(device_info, a, c))
+                for actuator, command in actions.items()
+            ]
+
+        for actuator, result in results:
             try:
-                # Handle routine commands specially
-                if actuator == 'routine' and 'command' in command:
-                    # Post to /api/routines/<command_name>
-                    routine_cmd = command['command']
-                    url = f"https://{device_info['address']}:{device_info['port']}/api/routines/{routine_cmd}"
-                    response = self.session.post(url, json={}, timeout=10, verify=False)
-                    print(f"Routine '{routine_cmd}' started: {response.text}")
-                elif actuator == 'food_dose':
-                    # Handle food dosing (timed pump operation)
-                    duration_ms = command.get('duration_ms', 1000)
-                    speed = command.get('speed', 100)
-                    url = f"https://{device_info['address']}:{device_info['port']}/api/actuators/foodpump"
-                    payload = {'dose': duration_ms, 'speed': speed}
-                    response = self.session.post(url, json=payload, timeout=10, verify=False)
-                    print(f"Food pump dosed: {response.text}")
-                else:
-                    # Regular actuator command
-                    url = f"https://{device_info['address']}:{device_info['port']}/api/actuators/{actuator}"
-                    response = self.session.post(url, json=command, timeout=5, verify=False)
-                    print(f"Actuator '{actuator}' responded with: {response.text}")
+                print(result())
             except Exception as e:
                 print(f"Error sending command to '{actuator}' for device '{device_name}': {e}")
 
@@ -6297,15 +7265,39 @@ class HydroponicsConsole(Cmd):
 
         # Schedule turning off actuators after 'duration' minutes
         if duration > 0:
-            threading.Timer(duration * 60, turn_off_actuators).start()
+            scheduler.add_job(
+                turn_off_actuators,
+                'date',
+                run_date=datetime.now() + timedelta(minutes=duration)
+            )
+
+    def _send_schedule_action(self, device_info, actuator, command):
+        """POST one scheduled action to the device; returns the line to print."""
+        base = device_info['base_url']
+        # Handle routine commands specially
+        if actuator == 'routine' and 'command' in command:
+            # Post to /api/routines/<command_name>
+            routine_cmd = command['command']
+            response = self.session.post(f"{base}/api/routines/{routine_cmd}", json={}, timeout=10)
+            return f"Routine '{routine_cmd}' started: {response.text}"
+        if actuator == 'food_dose':
+            # Handle food dosing (timed pump operation)
+            payload = {'dose': command.get('duration_ms', 1000), 'speed': command.get('speed', 100)}
+            response = self.session.post(f"{base}/api/actuators/foodpump", json=payload, timeout=10)
+            return f"Food pump dosed: {response.text}"
+        # Regular actuator command
+        response = self.session.post(f"{base}/api/actuators/{actuator}", json=command, timeout=5)
+        return f"Actuator '{actuator}' responded with: {response.text}"
 
     # --------------------------------------------------------------------------
     # Basic device listing/selection
     # --------------------------------------------------------------------------
     def do_list(self, arg):
         'List all discovered devices.'
-        if devices:
-            for idx, (name, info) in enumerate(devices.items(), start=1):
+        with devices_lock:
+            listed = [(name, devices[name]) for name in device_order]
+        if listed:
+            for idx, (name, info) in enumerate(listed, start=1):
                 selected = '*' if self.selected_device == name else ' '
                 print(f"[{selected}] {idx}. {name} at {info['address']}:{info['port']}")
         else:
@@ -6315,10 +7307,11 @@ class HydroponicsConsole(Cmd):
         'Select a device to interact with: select <device_number>'
         try:
             idx = int(arg.strip()) - 1
-            if idx < 0 or idx >= len(devices):
-                print("Invalid device number.")
-                return
-            device_name = list(devices.keys())[idx]
+            with devices_lock:
+                if idx < 0 or idx >= len(device_order):
+                    print("Invalid device number.")
+                    return
+                device_name = device_order[idx]
             self.selected_device = device_name
             print(f"Selected device: {device_name}")
         except ValueError:
@@ -6352,12 +7345,13 @@ class HydroponicsConsole(Cmd):
         - light_schedule
         - planter_pod_schedule
         - air_pump_schedule
+        - all_schedules [wait]
         If a schedule routine, fetch the current schedule from device, show GUI, post updated.
-        Then poll routine status.
+        Then poll routine status (all_schedules only polls when given 'wait').
         """
         if not self._check_device_selected():
             return
-        name = arg.strip().lower()
+        name, _, option = arg.strip().lower().partition(' ')
         if not name:
             print("Usage: routine <name>")
             return
@@ -6395,9 +7389,13 @@ class HydroponicsConsole(Cmd):
                 print("Schedule editing cancelled.")
                 return
 
-            # 4) Post each updated schedule
-            self._post_routine("light_schedule", {"schedule": updated_light})
-            self._post_routine("planter_pod_schedule", {"schedule": updated_planter})
+            # 4) Post both updated schedules; with 'wait', follow the store routines together
+            started = self._post_routines({
+                "light_schedule": {"schedule": updated_light},
+                "planter_pod_schedule": {"schedule": updated_planter},
+            })
+            if started and option.strip() == "wait":
+                self._poll_routine_status(*started.values())
             return
 
         # Post the routine
@@ -6409,17 +7407,19 @@ class HydroponicsConsole(Cmd):
         print(f"Routine '{name}' started with ID {routine_id}. Polling for status...")
         self._poll_routine_status(routine_id)
 
-    def _fetch_saved_schedule(self, schedule_type):
+    def _fetch_saved_schedule(self, schedule_type, fallback=True):
         """
         Attempts to GET /api/routines/saved?type=<schedule_type>
-        Returns a list of 24 ints or a default [0..0].
+        Returns a list of 24 ints. If the device can't be read, returns a default
+        [0..0], or None when fallback is False.
         """
-        if not self.selected_device:
-            return [0]*24
-        devinfo = devices[self.selected_device]
-        url = f"https://{devinfo['address']}:{devinfo['port']}/api/routines/saved?type={schedule_type}"
+        default = [0]*24 if fallback else None
+        devinfo = devices.get(self.selected_device)
+        if devinfo is None:
+            return default
+        url = f"{devinfo['base_url']}/api/routines/saved"
         try:
-            resp = self.session.get(url, timeout=5)
+            resp = self.session.get(url, params={'type': schedule_type}, timeout=5)
             if resp.status_code==200:
                 data = resp.json()
                 sched = data.get("schedule",[0]*24)
@@ -6430,13 +7430,14 @@ class HydroponicsConsole(Cmd):
                 print(f"Cannot fetch saved schedule: {resp.status_code} {resp.text}")
         except requests.RequestException as e:
             print(f"Error fetching saved schedule: {e}")
-        return [0]*24
+        return default
 
     def do_routine_status(self, arg):
         """
         routine_status <routine_id>
         """
-        if not self._check_selected():
+        dev = self._check_selected()
+        if dev is None:
             return
         try:
             rid = int(arg.strip())
@@ -6444,10 +7445,9 @@ class HydroponicsConsole(Cmd):
             print("Usage: routine_status <id>")
             return
 
-        dev = devices[self.selected_device]
-        url = f"https://{dev['address']}:{dev['port']}/api/routines/status?id={rid}"
+        url = f"{dev['base_url']}/api/routines/status"
         try:
-            r = self.session.get(url, timeout=5)
+            r = self.session.get(url, params={'id': rid}, timeout=5)
             if r.status_code == 200:
                 data = r.json()
                 print(json.dumps(data, indent=2))
@@ -6457,21 +7457,25 @@ class HydroponicsConsole(Cmd):
             print(f"Error: {e}")
 
     def _check_selected(self):
+        'Return the selected device\'s info dict, or None (after saying why) if there is none'
         if not self.selected_device:
             print("No device selected. 'list' then 'select <num>'.")
-            return False
-        if self.selected_device not in devices:
+            return None
+        device = devices.get(self.selected_device)
+        if device is None:
             print("Selected device not available.")
             self.selected_device = None
-            return False
-        return True
+        return device
 
     def _post_routine(self, routine_name, json_body):
         dev = devices[self.selected_device]
-        url = f"https://{dev['address']}:{dev['port']}/api/routines/{routine_name}"
+        url = f"{dev['base_url']}/api/routines/{routine_name}"
         try:
             resp = self.session.post(url, json=json_body, timeout=50)
             if resp.status_code == 200:
+                # Saved schedule changed on the device, drop any cached copy
+                if routine_name in SCHEDULE_ROUTINE_TYPES:
+                    saved_schedule_cache.pop((self.selected_device, SCHEDULE_ROUTINE_TYPES[routine_name]), None)
                 data = resp.json()
                 rid = data.get("routine_id")
                 msg = data.get("message", "")
@@ -6483,39 +7487,87 @@ class HydroponicsConsole(Cmd):
             print(f"Error sending routine: {e}")
         return None
 
-    def _poll_routine_status(self, routine_id, timeout=60, interval=2):
+    def _submit_routines(self, routines):
+        """
+        Start one routine POST per entry on the shared I/O pool.
+        
+        The firmware has no bulk routines endpoint, so the requests are
+        overlapped instead of merged into one body.
+        
+        Args:
+            routines: dict of routine name -> JSON body
+        
+        Returns:
+            dict of routine name -> Future resolving to the routine id (or None)
+        """
+        return {
+            routine_name: io_pool.submit(self._post_routine, routine_name, json_body)
+            for routine_name, json_body in routines.items()
+        }
+
+    def _post_routines(self, routines):
+        'Post several routines in parallel and return {name: routine_id} for the ones that succeeded'
+        futures = self._submit_routines(routines)
+        results = {}
+        for routine_name, future in futures.items():
+            rid = future.result()
+            if rid is not None:
+                results[routine_name] = rid
+        return results
+
+    def _poll_routine_status(self, *routine_ids, timeout=60, interval=2):
+        'Poll until each routine leaves RUNNING; the delay starts short and backs off to `interval` seconds'
+        if len(routine_ids) > 1:
+            # Independent loops, one per routine, so a slow one doesn't hold up the others
+            with ThreadPoolExecutor(max_workers=min(HTTP_POOL_SIZE, len(routine_ids))) as pool:
+                futures = [
+                    pool.submit(self._poll_routine_status, routine_id, timeout=timeout, interval=interval)
+                    for routine_id in routine_ids
+                ]
+                for future in as_completed(futures):
+                    future.result()
+            return
+        
+        routine_id = routine_ids[0]
         dev = devices[self.selected_device]
-        url = f"https://{dev['address']}:{dev['port']}/api/routines/status?id={routine_id}"
-        start_time = time.time()
+        url = f"{dev['base_url']}/api/routines/status"
+        params = {'id': routine_id}
+        start_time = time.monotonic()
+        delay = 0.25
+        last_status = None
         while True:
             try:
-                r = self.session.get(url, timeout=5)
+                r = self.session.get(url, params=params, timeout=5)
                 if r.status_code == 200:
                     data = r.json()
                     status = data.get("status", "")
-                    print(f"Routine {routine_id} status: {status}")
+                    logger.debug("Routine %s status=%s", routine_id, status)
+                    if status != last_status:
+                        print(f"Routine {routine_id} status: {status}")
+                        last_status = status
                     if status != "RUNNING":
-                        print("Final routine status:")
-                        print(json.dumps(data, indent=2))
+                        sys.stdout.write(f"Final status of routine {routine_id}:\n{json.dumps(data, indent=2)}\n")
+                        sys.stdout.flush()
                         return
                 else:
-                    print(f"Error polling: {r.status_code}: {r.text}")
+                    print(f"Error polling routine {routine_id}: {r.status_code}: {r.text}")
             except requests.RequestException as e:
-                print(f"Error polling: {e}")
-            if time.time() - start_time > timeout:
-                print("Polling timed out.")
+                print(f"Error polling routine {routine_id}: {e}")
+            if time.monotonic() - start_time > timeout:
+                print(f"Polling routine {routine_id} timed out.")
                 return
-            time.sleep(interval)
+            time.sleep(delay)
+            delay = min(delay * 1.5, interval)
 
     # --------------------------------------------------------------------------
     # Sensor Status
     # --------------------------------------------------------------------------
     def do_status(self, arg):
         'Get sensor data (unit metrics) from the selected device.'
-        if not self._check_device_selected():
+        device_info = self._check_device_selected()
+        if device_info is None:
             return
-        device_info = devices[self.selected_device]
-        url = f"https://{device_info['address']}:{device_info['port']}/api/unit-metrics"
+        url = f"{device_info['base_url']}/api/unit-metrics"
         try:
             response = self.session.get(url, timeout=5)
             response.raise_for_status()
@@ -6565,19 +7617,19 @@ class HydroponicsConsole(Cmd):
 
     def do_hostname_suffix(self, arg):
         'Set mDNS suffix: hostname_suffix <suffix>'
-        if not self._check_device_selected():
+        device_info = self._check_device_selected()
+        if device_info is None:
             return
-        device_info = devices[self.selected_device]
         suffix = arg.strip()
         if not suffix:
             print("Please provide a valid suffix.")
             return
-        url = f"https://{device_info['address']}:{device_info['port']}/api/hostnameSuffix"
+        url = f"{device_info['base_url']}/api/hostnameSuffix"
         try:
             resp = self.session.post(url, json={"suffix": suffix}, timeout=5)
             if resp.status_code == 200:
                 print("Suffix updated successfully.")
-                reboot_url = f"https://{device_info['address']}:{device_info['port']}/api/restart"
+                reboot_url = f"{device_info['base_url']}/api/restart"
                 try:
                     self.session.post(reboot_url, timeout=5)
                     print("Device is rebooting to apply new hostname.")
@@ -6591,57 +7643,35 @@ class HydroponicsConsole(Cmd):
     # --------------------------------------------------------------------------
     # Actuator Commands
     # --------------------------------------------------------------------------
-    def do_airpump(self, arg):
-        'Set air pump PWM value: airpump <value>'
+    def _set_pump_pwm(self, actuator, arg):
+        'Shared body of the simple pump commands: validate a 0-100 PWM value and post it'
         if not self._check_device_selected():
             return
         try:
             value = int(arg.strip())
-            if value < 0 or value > 100:
-                print("Value must be between 0 and 100.")
-                return
-            self._post_actuator_command('airpump', {'value': value}, self.selected_device)
         except ValueError:
             print("Please provide a valid integer value.")
+            return
+        if value < 0 or value > 100:
+            print("Value must be between 0 and 100.")
+            return
+        self._post_actuator_command(actuator, {'value': value}, self.selected_device)
+
+    def do_airpump(self, arg):
+        'Set air pump PWM value: airpump <value>'
+        self._set_pump_pwm('airpump', arg)
 
     def do_sourcepump(self, arg):
         'Set source pump PWM value: sourcepump <value>'
-        if not self._check_device_selected():
-            return
-        try:
-            value = int(arg.strip())
-            if value < 0 or value > 100:
-                print("Value must be between 0 and 100.")
-                return
-            self._post_actuator_command('sourcepump', {'value': value}, self.selected_device)
-        except ValueError:
-            print("Please provide a valid integer value.")
+        self._set_pump_pwm('sourcepump', arg)
 
     def do_planterpump(self, arg):
         'Set planter pump PWM value: planterpump <value>'
-        if not self._check_device_selected():
-            return
-        try:
-            value = int(arg.strip())
-            if value < 0 or value > 100:
-                print("Value must be between 0 and 100.")
-                return
-            self._post_actuator_command('planterpump', {'value': value}, self.selected_device)
-        except ValueError:
-            print("Please provide a valid integer value.")
+        self._set_pump_pwm('planterpump', arg)
 
     def do_drainpump(self, arg):
         'Set drain pump PWM value: drainpump <value>'
-        if not self._check_device_selected():
-            return
-        try:
-            value = int(arg.strip())
-            if value < 0 or value > 100:
-                print("Value must be between 0 and 100.")
-                return
-            self._post_actuator_command('drainpump', {'value': value}, self.selected_device)
-        except ValueError:
-            print("Please provide a valid integer value.")
+        self._set_pump_pwm('drainpump', arg)
 
     def do_foodpump(self, arg):
         '''Control food pump: foodpump <value> | dose <duration_ms> [speed]
@@ -6704,14 +7734,14 @@ class HydroponicsConsole(Cmd):
             test_fs_list           - List files in /lfs
             test_fs_list /lfs/config - List files in /lfs/config
         '''
-        if not self._check_device_selected():
+        device = self._check_device_selected()
+        if device is None:
             return
         
         path = arg.strip() if arg.strip() else '/lfs'
         
         try:
-            device = devices[self.selected_device]
-            url = f"https://{device['address']}/api/filesystem/list"
+            url = f"{device['base_url']}/api/filesystem/list"
             params = {'path': path}
             
             print(f"\n--- Testing Filesystem List API ---")
@@ -6753,7 +7783,8 @@ class HydroponicsConsole(Cmd):
             test_fs_read /lfs/config/plant.json
             test_fs_read /lfs/test.txt
         '''
-        if not self._check_device_selected():
+        device = self._check_device_selected()
+        if device is None:
             return
         
         if not arg.strip():
@@ -6764,8 +7795,7 @@ class HydroponicsConsole(Cmd):
         path = arg.strip()
         
         try:
-            device = devices[self.selected_device]
-            url = f"https://{device['address']}/api/filesystem/read"
+            url = f"{device['base_url']}/api/filesystem/read"
             params = {'path': path}
             
             print(f"\n--- Testing Filesystem Read API ---")
@@ -6782,13 +7812,8 @@ class HydroponicsConsole(Cmd):
             print(f"  Size: {data.get('size', 0)} bytes")
             print(f"\n  Content:")
             print("  " + "-" * 60)
-            content = data.get('content', '')
-            # Pretty print JSON if possible
-            try:
-                json_content = json.loads(content)
-                print(json.dumps(json_content, indent=4))
-            except:
-                print(content)
+            # .json files are pretty-printed (shared rules and cache), anything else as-is
+            print(format_file_content(data.get('path', path), data.get('content', '')))
             print("  " + "-" * 60)
             
             print(f"\n✓ Test passed!")
@@ -6804,12 +7829,12 @@ class HydroponicsConsole(Cmd):
         '''Test plant info GET API: test_plant_get
         Retrieves current plant information from the device.
         '''
-        if not self._check_device_selected():
+        device = self._check_device_selected()
+        if device is None:
             return
         
         try:
-            device = devices[self.selected_device]
-            url = f"https://{device['address']}/api/plant/info"
+            url = f"{device['base_url']}/api/plant/info"
             
             print(f"\n--- Testing Plant Info GET API ---")
             print(f"URL: {url}")
@@ -6839,17 +7864,39 @@ class HydroponicsConsole(Cmd):
         except Exception as e:
             print(f"✗ Error: {e}")
     
+    def _parse_plant_args(self, arg):
+        """
+        Split '<plant_name> <start_date>' for plant_set/test_plant_set.
+        The date is the last word; everything before it (quotes optional) is the name.
+        A lone apostrophe (Tom's Basil) is taken literally rather than as an open quote.
+        Returns (plant_name, start_date), or None if either is missing.
+        """
+        try:
+            parts = shlex.split(arg)
+        except ValueError:
+            # Unbalanced quote: split off the date by hand and keep the name as typed
+            parts = arg.rsplit(None, 1)
+            if len(parts) == 2:
+                name = parts[0].strip()
+                if len(name) >= 2 and name[0] == name[-1] and name[0] in '"\'':
+                    name = name[1:-1]
+                parts = [name, parts[1]]
+        if len(parts) < 2 or not parts[0]:
+            return None
+        return ' '.join(parts[:-1]), parts[-1]
+    
     def do_test_plant_set(self, arg):
         '''Test plant info POST API: test_plant_set <plant_name> <start_date>
         Examples:
             test_plant_set "Micro Tom" 2025-12-16
             test_plant_set Basil 2025-12-01
         '''
-        if not self._check_device_selected():
+        device = self._check_device_selected()
+        if device is None:
             return
         
-        args = arg.strip().split(maxsplit=1)
-        if len(args) < 2:
+        parsed = self._parse_plant_args(arg)
+        if parsed is None:
             print("Usage: test_plant_set <plant_name> <start_date>")
             print("  plant_name: Name of the plant (use quotes if it contains spaces)")
             print("  start_date: Start date in YYYY-MM-DD format")
@@ -6858,28 +7905,16 @@ class HydroponicsConsole(Cmd):
             print('  test_plant_set Basil 2025-12-01')
             return
         
-        # Parse plant_name and start_date
-        plant_name = args[0].strip('"').strip("'")
-        start_date = args[1].strip() if len(args) > 1 else args[0].split()[1] if len(args[0].split()) > 1 else None
-        
-        # Handle case where name has spaces and is quoted
-        if not start_date or len(start_date) != 10:
-            parts = arg.strip().split()
-            if len(parts) >= 2:
-                start_date = parts[-1]
-                plant_name = ' '.join(parts[:-1]).strip('"').strip("'")
+        plant_name, start_date = parsed
         
         # Validate date format
-        try:
-            datetime.strptime(start_date, '%Y-%m-%d')
-        except ValueError:
+        if not is_valid_date(start_date):
             print(f"✗ Invalid date format: {start_date}")
             print("  Date must be in YYYY-MM-DD format")
             return
         
         try:
-            device = devices[self.selected_device]
-            url = f"https://{device['address']}/api/plant/info"
+            url = f"{device['base_url']}/api/plant/info"
             
             payload = {
                 'plant_name': plant_name,
@@ -6921,12 +7956,12 @@ class HydroponicsConsole(Cmd):
         Returns dict with 'directories', 'files', 'total_dirs', 'total_files', 'path'
         Returns None on error.
         """
-        if not self._check_device_selected():
+        device = self._check_device_selected()
+        if device is None:
             return None
         
         try:
-            device = devices[self.selected_device]
-            url = f"https://{device['address']}/api/filesystem/list"
+            url = f"{device['base_url']}/api/filesystem/list"
             params = {'path': path}
             
             response = self.session.get(url, params=params, timeout=10)
@@ -6943,12 +7978,12 @@ class HydroponicsConsole(Cmd):
         Returns dict with 'path', 'size', 'content'
         Returns None on error.
         """
-        if not self._check_device_selected():
+        device = self._check_device_selected()
+        if device is None:
             return None
         
         try:
-            device = devices[self.selected_device]
-            url = f"https://{device['address']}/api/filesystem/read"
+            url = f"{device['base_url']}/api/filesystem/read"
             params = {'path': path}
             
             response = self.session.get(url, params=params, timeout=10)
@@ -6965,12 +8000,12 @@ class HydroponicsConsole(Cmd):
         Returns dict with plant info if exists, or {'exists': False} if not configured.
         Returns None on error.
         """
-        if not self._check_device_selected():
+        device = self._check_device_selected()
+        if device is None:
             return None
         
         try:
-            device = devices[self.selected_device]
-            url = f"https://{device['address']}/api/plant/info"
+            url = f"{device['base_url']}/api/plant/info"
             
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
@@ -6985,19 +8020,17 @@ class HydroponicsConsole(Cmd):
         Helper function to set plant information on device.
         Returns True on success, False on error.
         """
-        if not self._check_device_selected():
+        device = self._check_device_selected()
+        if device is None:
             return False
         
         # Validate date format
-        try:
-            datetime.strptime(start_date, '%Y-%m-%d')
-        except ValueError:
+        if not is_valid_date(start_date):
             print(f"Invalid date format: {start_date}. Use YYYY-MM-DD")
             return False
         
         try:
-            device = devices[self.selected_device]
-            url = f"https://{device['address']}/api/plant/info"
+            url = f"{device['base_url']}/api/plant/info"
             
             payload = {
                 'plant_name': plant_name,
@@ -7008,7 +8041,11 @@ class HydroponicsConsole(Cmd):
             response.raise_for_status()
             
             data = response.json()
-            return data.get('success', False)
+            if data.get('success', False):
+                # Plant info changed on the device, drop any cached copy
+                plant_info_cache.pop(self.selected_device, None)
+                return True
+            return False
         except Exception as e:
             print(f"Error setting plant info: {e}")
             return False
@@ -7040,19 +8077,18 @@ class HydroponicsConsole(Cmd):
         # Display directories
         if data.get('directories'):
             print(f"\n📁 Directories ({data.get('total_dirs', 0)}):")
-            for dir_name in sorted(data['directories']):
-                print(f"   {dir_name}/")
+            # One write per section rather than one per entry
+            print("\n".join(f"   {dir_name}/" for dir_name in sorted(data['directories'])))
         
         # Display files
         if data.get('files'):
             print(f"\n📄 Files ({data.get('total_files', 0)}):")
-            for file in sorted(data['files'], key=lambda x: x['name']):
-                size_kb = file['size'] / 1024.0
-                if size_kb < 1:
-                    size_str = f"{file['size']} B"
-                else:
-                    size_str = f"{size_kb:.2f} KB"
-                print(f"   {file['name']:<40} {size_str:>12}")
+            lines = []
+            for file in sorted(data['files'], key=itemgetter('name')):
+                size = file['size']
+                size_str = f"{size} B" if size < 1024 else f"{size / 1024.0:.2f} KB"
+                lines.append(f"   {file['name']:<40} {size_str:>12}")
+            print("\n".join(lines))
         
         if not data.get('directories') and not data.get('files'):
             print("\n  (empty directory)")
@@ -7087,15 +8123,9 @@ class HydroponicsConsole(Cmd):
         print(f"  Size: {data.get('size', 0)} bytes")
         print(f"{'='*70}")
         
-        content = data.get('content', '')
-        
-        # Try to pretty-print JSON
-        try:
-            json_content = json.loads(content)
-            print(json.dumps(json_content, indent=2))
-        except:
-            # Not JSON, print as-is
-            print(content)
+        # .json files are pretty-printed (same rules and cache as the GUI viewers);
+        # anything else is printed as-is without a trial parse
+        print(format_file_content(data.get('path', path), data.get('content', '')))
         
         print(f"{'='*70}\n")
     
@@ -7145,8 +8175,8 @@ class HydroponicsConsole(Cmd):
         if not self._check_device_selected():
             return
         
-        args = arg.strip().split(maxsplit=1)
-        if len(args) < 2:
+        parsed = self._parse_plant_args(arg)
+        if parsed is None:
             print("Usage: plant_set <plant_name> <start_date>")
             print("  plant_name: Name of the plant (use quotes if it contains spaces)")
             print("  start_date: Start date in YYYY-MM-DD format")
@@ -7155,16 +8185,7 @@ class HydroponicsConsole(Cmd):
             print('  plant_set Basil 2025-12-01')
             return
         
-        # Parse plant_name and start_date
-        plant_name = args[0].strip('"').strip("'")
-        start_date = args[1].strip() if len(args) > 1 else args[0].split()[1] if len(args[0].split()) > 1 else None
-        
-        # Handle case where name has spaces and is quoted
-        if not start_date or len(start_date) != 10:
-            parts = arg.strip().split()
-            if len(parts) >= 2:
-                start_date = parts[-1]
-                plant_name = ' '.join(parts[:-1]).strip('"').strip("'")
+        plant_name, start_date = parsed
         
         print(f"\n{'='*70}")
         print(f"  Setting Plant Information")
@@ -7242,14 +8263,9 @@ class HydroponicsConsole(Cmd):
         if not self._check_device_selected():
             return
         
-        args = arg.strip().split()
-        if len(args) == 0:
-            print("Usage: led <value> [channel]")
-            print("  value: 0-100 (PWM percentage)")
-            print("  channel: 1-4 (optional, sets specific channel)")
-            print("Examples:")
-            print("  led 100       - Set all LEDs to 100%")
-            print("  led 50 2      - Set channel 2 to 50%")
+        args = arg.split()
+        if not args:
+            print(LED_USAGE)
             return
         
         try:
@@ -7278,7 +8294,8 @@ class HydroponicsConsole(Cmd):
     # --------------------------------------------------------------------------
     def do_schedule_actuators(self, arg):
         'Set actuator schedule: schedule_actuators'
-        if not self._check_device_selected():
+        device_info = self._check_device_selected()
+        if device_info is None:
             return
         
         print("\n--- Opening Actuator Schedule Setup Window ---")
@@ -7298,12 +8315,11 @@ class HydroponicsConsole(Cmd):
             return
         
         # Get device info
-        device_info = devices[self.selected_device]
         device_name = self.selected_device
         device_ip = device_info['address']
         
         # Store the schedule
-        self.schedules[schedule_name] = {
+        entry = {
             'device_name': device_name,
             'device_ip': device_ip,
             'start_time': config['start_time'],
@@ -7312,9 +8328,11 @@ class HydroponicsConsole(Cmd):
             'day_of_week': config['day_of_week'],
             'actions': config['actions']
         }
+        with self._schedules_lock:
+            self.schedules[schedule_name] = entry
         
         # Schedule the job if device is available
-        self.schedule_job(schedule_name, self.schedules[schedule_name])
+        self.schedule_job(schedule_name, entry)
         
         # Save schedules to JSON
         self.save_schedules()
@@ -7333,7 +8351,8 @@ class HydroponicsConsole(Cmd):
         - Hourly schedules (Light curve + Planter intervals)  
         - Routine commands (Fill/Empty/Maintenance tasks)
         '''
-        if not self._check_device_selected():
+        device_info = self._check_device_selected()
+        if device_info is None:
             return
         
         print("\n--- Opening Unified Schedule Manager ---")
@@ -7353,72 +8372,68 @@ class HydroponicsConsole(Cmd):
         if config['light_schedule'] or config['planter_schedule']:
             print("\n--- Updating Hourly Schedules ---")
             
-            # Post light schedule
+            # Post whichever hourly schedules changed in parallel
+            routines = {}
             if config['light_schedule']:
-                self._post_routine("light_schedule", {"schedule": config['light_schedule']})
-                print("✓ Light schedule updated")
-            
-            # Post planter schedule  
+                routines["light_schedule"] = {"schedule": config['light_schedule']}
             if config['planter_schedule']:
-                self._post_routine("planter_pod_schedule", {"schedule": config['planter_schedule']})
+                routines["planter_pod_schedule"] = {"schedule": config['planter_schedule']}
+            
+            results = self._post_routines(routines)
+            if "light_schedule" in results:
+                print("✓ Light schedule updated")
+            if "planter_pod_schedule" in results:
                 print("✓ Planter schedule updated")
         
         # Handle food schedule
         if config['food_config']:
             food = config['food_config']
             
-            print("\n--- Setting Up Food Dosing Schedule ---")
-            print(f"  Total daily amount: {food['total_daily_ms']} ms")
-            print(f"  Number of intervals: {food['intervals']}")
-            print(f"  Dose per interval: {food['dose_per_interval']} ms")
-            print(f"  Pump speed: {food['speed']}%")
-            
-            # Calculate feeding times (evenly spaced throughout 24 hours)
-            hours_between = 24.0 / food['intervals']
+            log = [
+                "\n--- Setting Up Food Dosing Schedule ---",
+                f"  Total daily amount: {food['total_daily_ms']} ms",
+                f"  Number of intervals: {food['intervals']}",
+                f"  Dose per interval: {food['dose_per_interval']} ms",
+                f"  Pump speed: {food['speed']}%",
+            ]
             
             # Remove any existing food schedules
-            food_schedules = [name for name in self.schedules if name.startswith('food_dose_')]
-            for name in food_schedules:
-                try:
-                    scheduler.remove_job(name)
-                    del self.schedules[name]
-                    print(f"  Removed old schedule: {name}")
-                except Exception as e:
-                    print(f"  Warning: Could not remove old schedule {name}: {e}")
+            removed = self.remove_food_schedules()
+            if removed:
+                log.append(f"  Removed old schedules: {', '.join(removed)}")
             
             # Create new food dosing schedules
-            device_info = devices[self.selected_device]
-            device_name = self.selected_device
-            
-            for i in range(food['intervals']):
-                # Calculate start hour for this interval
-                start_hour = int(i * hours_between)
-                start_minute = int((i * hours_between - start_hour) * 60)
-                schedule_name = f"food_dose_{i+1}"
-                
-                # Store the food dosing schedule
-                self.schedules[schedule_name] = {
-                    'device_name': device_name,
-                    'device_ip': device_info['address'],
-                    'start_time': f"{start_hour:02d}:{start_minute:02d}",
-                    'duration_minutes': 0,  # Instant dose
-                    'frequency': 'daily',
-                    'day_of_week': None,
-                    'actions': {
-                        'food_dose': {
-                            'duration_ms': food['dose_per_interval'],
-                            'speed': food['speed']
-                        }
+            base_entry = {
+                'device_name': self.selected_device,
+                'device_ip': device_info['address'],
+                'duration_minutes': 0,  # Instant dose
+                'frequency': 'daily',
+                'day_of_week': None,
+                'actions': {
+                    'food_dose': {
+                        'duration_ms': food['dose_per_interval'],
+                        'speed': food['speed']
                     }
                 }
-                
-                # Schedule the job
-                self.schedule_job(schedule_name, self.schedules[schedule_name])
-                print(f"  ✓ Scheduled feeding {i+1} at {start_hour:02d}:{start_minute:02d} ({food['dose_per_interval']} ms)")
+            }
+            
+            # Feeding times are evenly spaced throughout 24 hours
+            new_jobs = []
+            for i, (start_hour, start_minute) in enumerate(feeding_times(food['intervals'])):
+                entry = copy.deepcopy(base_entry)  # Each entry gets its own actions dict
+                entry['start_time'] = f"{start_hour:02d}:{start_minute:02d}"
+                new_jobs.append((f"food_dose_{i+1}", entry))
+            
+            with self._schedules_lock:
+                self.schedules.update(new_jobs)
+            # Header first: schedule_job prints its own line per job
+            print("\n".join(log))
+            self.schedule_jobs(new_jobs)
             
             # Save schedules to JSON
             self.save_schedules()
-            print(f"\n✓ Food dosing schedule created with {food['intervals']} daily feedings")
+            print(f"  ✓ Feedings at {', '.join(entry['start_time'] for _, entry in new_jobs)} ({food['dose_per_interval']} ms each)\n"
+                  f"\n✓ Food dosing schedule created with {food['intervals']} daily feedings")
         
         # Handle routine command schedule
         if config['routine_config']:
@@ -7430,7 +8445,6 @@ class HydroponicsConsole(Cmd):
                 print(f"Warning: Schedule '{schedule_name}' already exists. Overwriting...")
             
             # Get device info
-            device_info = devices[self.selected_device]
             device_name = self.selected_device
             device_ip = device_info['address']
             
@@ -7448,7 +8462,7 @@ class HydroponicsConsole(Cmd):
                 actions['routine'] = {'command': 'calibrate_pod'}
             
             # Store the routine schedule
-            self.schedules[schedule_name] = {
+            entry = {
                 'device_name': device_name,
                 'device_ip': device_ip,
                 'start_time': routine['start_time'],
@@ -7457,9 +8471,11 @@ class HydroponicsConsole(Cmd):
                 'day_of_week': routine['day_of_week'],
                 'actions': actions
             }
+            with self._schedules_lock:
+                self.schedules[schedule_name] = entry
             
             # Schedule the job
-            self.schedule_job(schedule_name, self.schedules[schedule_name])
+            self.schedule_job(schedule_name, entry)
             
             # Save schedules to JSON
             self.save_schedules()
@@ -7484,49 +8500,33 @@ class HydroponicsConsole(Cmd):
                    "Frequency", "Day of Week", "LED", "Air Pump", "Source Pump", "Planter Pump", "Drain Pump"]
         col_widths = [15, 15, 15, 15, 15, 10, 15, 10, 10, 12, 12, 11]
         
-        # Print header
-        header_row = " | ".join([headers[i].ljust(col_widths[i]) for i in range(len(headers))])
-        separator = "-+-".join(['-' * col_widths[i] for i in range(len(headers))])
-        print("\n" + header_row)
-        print(separator)
-        
-        # Print each schedule
-        for name, details in self.schedules.items():
-            device_name = details['device_name']
-            device_ip = details['device_ip']
-            start_time = details['start_time']
+        # One %-style template for every row instead of a ljust() per cell
+        fmt = " | ".join(f"%-{w}s" for w in col_widths)
+        separator = "-+-".join("-" * w for w in col_widths)
+        lines = ["", fmt % tuple(headers), separator]
+        
+        def action_value(acts, actuator):
+            action = acts.get(actuator)
+            return str(action.get('value', '-')) if action else '-'
+        
+        # Iterate a snapshot: scheduler callbacks and the GUI may edit schedules meanwhile
+        for name, details in tuple(self.schedules.items()):
             duration_minutes = details['duration_minutes']
             frequency = details['frequency']
-            day = details['day_of_week'] if details['frequency'] == 'weekly' else '-'
+            day = details['day_of_week'].capitalize() if frequency == 'weekly' else '-'
             
             # Convert duration back to HH:MM format for display
-            hours = duration_minutes // 60
-            minutes = duration_minutes % 60
-            duration_display = f"{hours}:{minutes:02d}"
+            duration_display = f"{duration_minutes // 60}:{duration_minutes % 60:02d}"
             
             # Retrieve actuator values
-            led = str(details['actions'].get('led', {}).get('value', '-'))
-            airpump = str(details['actions'].get('airpump', {}).get('value', '-'))
-            sourcepump = str(details['actions'].get('sourcepump', {}).get('value', '-'))
-            planterpump = str(details['actions'].get('planterpump', {}).get('value', '-'))
-            drainpump = str(details['actions'].get('drainpump', {}).get('value', '-'))
-            
-            row = [
-                name.ljust(col_widths[0]),
-                device_name.ljust(col_widths[1]),
-                device_ip.ljust(col_widths[2]),
-                start_time.ljust(col_widths[3]),
-                duration_display.ljust(col_widths[4]),
-                frequency.ljust(col_widths[5]),
-                (day.capitalize() if day != '-' else '-').ljust(col_widths[6]),
-                led.ljust(col_widths[7]),
-                airpump.ljust(col_widths[8]),
-                sourcepump.ljust(col_widths[9]),
-                planterpump.ljust(col_widths[10]),
-                drainpump.ljust(col_widths[11])
-            ]
-            print(" | ".join(row))
-        print()
+            acts = details['actions']
+            lines.append(fmt % (
+                name, details['device_name'], details['device_ip'], details['start_time'],
+                duration_display, frequency, day,
+                *(action_value(acts, actuator) for actuator in ('led', 'airpump', 'sourcepump', 'planterpump', 'drainpump'))
+            ))
+        lines.append("")
+        print("\n".join(lines))
 
     def do_delete_schedule(self, arg):
         'Delete a schedule: delete_schedule <schedule_name>'
@@ -7546,7 +8546,9 @@ class HydroponicsConsole(Cmd):
             print(f"Error removing job from scheduler: {e}")
         
         # Remove from schedules dictionary
-        del self.schedules[schedule_name]
+        with self._schedules_lock:
+            self.schedules.pop(schedule_name, None)
+        self._food_schedule_names.discard(schedule_name)
         
         # Save updated schedules to JSON
         self.save_schedules()
@@ -7570,26 +8572,27 @@ class HydroponicsConsole(Cmd):
     # Internal Command Helpers
     # --------------------------------------------------------------------------
     def _post_actuator_command(self, actuator, payload, device_name):
-        if device_name not in devices:
+        device_info = devices.get(device_name)
+        if device_info is None:
             print(f"Device '{device_name}' is not available.")
             return
-        device_info = devices[device_name]
-        url = f"https://{device_info['address']}:{device_info['port']}/api/actuators/{actuator}"
+        url = f"{device_info['base_url']}/api/actuators/{actuator}"
         try:
-            response = self.session.post(url, json=payload, timeout=5, verify=False)
+            response = self.session.post(url, json=payload, timeout=5)
             print(response.text)
         except Exception as e:
             print(f"Error sending command to '{actuator}' on device '{device_name}': {e}")
 
     def _check_device_selected(self):
+        'Return the selected device\'s info dict, or None (after saying why) if there is none'
         if not self.selected_device:
             print("No device selected. Use 'list' to see devices and 'select <number>' to select one.")
-            return False
-        if self.selected_device not in devices:
+            return None
+        device = devices.get(self.selected_device)
+        if device is None:
             print("Selected device is no longer available.")
             self.selected_device = None
-            return False
-        return True
+        return device
 
     def _prompt_input(self, prompt_text):
         'Helper function to prompt user input'
@@ -7616,37 +8619,53 @@ class HydroponicsConsole(Cmd):
             power_str = f"{power:.2f}" if power is not None else "-"
             flow_rate_str = f"{flow_rate:.2f}" if flow_rate is not None else "-"
             
-            row = [
-                actuator_name,
-                current_str,
-                voltage_str,
-                power_str,
-                flow_rate_str
-            ]
-            rows.append(row)
+            rows.append((str(actuator_name), current_str, voltage_str, power_str, flow_rate_str))
         
-        # Determine column widths
-        col_widths = [max(len(str(item)) for item in [header] + [row[idx] for row in rows]) 
-                      for idx, header in enumerate(headers)]
+        # Determine column widths in one pass over the transposed table
+        col_widths = [max(map(len, column)) for column in zip(headers, *rows)]
         
-        # Print header
-        header_row = " | ".join([headers[i].ljust(col_widths[i]) for i in range(len(headers))])
-        separator = "-+-".join(['-' * col_widths[i] for i in range(len(headers))])
-        print("\n" + header_row)
-        print(separator)
-        
-        # Print rows
-        for row in rows:
-            print(" | ".join([str(item).ljust(col_widths[idx]) for idx, item in enumerate(row)]))
-        print()
+        fmt = " | ".join(f"%-{w}s" for w in col_widths)
+        lines = ["", fmt % tuple(headers), "-+-".join("-" * w for w in col_widths)]
+        lines.extend(fmt % row for row in rows)
+        lines.append("")
+        print("\n".join(lines))
 
     def save_schedules(self):
-        'Save schedules to the JSON file'
-        try:
-            with open(schedules_file, 'w') as f:
-                json.dump(self.schedules, f, indent=4)
-        except Exception as e:
-            print(f"Error saving schedules: {e}")
+        'Mark schedules as changed; the writer thread saves them to the JSON file shortly after'
+        self._schedules_dirty.set()
+
+    def _schedules_writer_loop(self):
+        while True:
+            self._schedules_dirty.wait()
+            time.sleep(SCHEDULES_SAVE_DELAY)  # Let a burst of edits settle
+            if not self.flush_schedules():
+                time.sleep(SCHEDULES_RETRY_DELAY)  # Don't spin on a disk that keeps failing
+
+    def flush_schedules(self):
+        'Write pending schedule changes to the JSON file now; returns False if the write failed'
+        with self._schedules_write_lock:
+            with self._schedules_lock:
+                if not self._schedules_dirty.is_set():
+                    return True
+                self._schedules_dirty.clear()
+                try:
+                    data = json.dumps(self.schedules, indent=4)
+                except Exception as e:
+                    print(f"Error saving schedules: {e}")
+                    self._schedules_dirty.set()
+                    return False
+            tmp_file = schedules_file + ".tmp"
+            try:
+                with open(tmp_file, 'w') as f:
+                    f.write(data)
+                # Readers never see a half-written file
+                os.replace(tmp_file, schedules_file)
+                self._schedules_mtime = os.stat(schedules_file).st_mtime_ns
+            except Exception as e:
+                print(f"Error saving schedules: {e}")
+                self._schedules_dirty.set()  # Keep the changes pending so the next flush retries
+                return False
+            return True
 
     # --------------------------------------------------------------------------
     # Additional Start/Stop Commands (Feeding, Emptying, etc.)
@@ -7666,22 +8685,23 @@ class HydroponicsConsole(Cmd):
 
     def _print_help(self):
         'Override the help command to group commands.'
-        print("\nCustom Commands:")
-        for command, description in self.custom_commands.items():
-            print(f"  {command:<20} {description}")
-
-        print("\nDefault Commands (cmd2):")
-        # Fetch all commands and filter out the custom ones
-        all_commands = self.get_all_commands()
-        default_commands = set(all_commands) - set(self.custom_commands.keys())
-        for command in sorted(default_commands):
-            print(f"  {command:<20} {self.get_command_description(command)}")
+        # The command set is fixed once the console exists, so the listing is built once
+        if self._help_text is None:
+            lines = ["", "Custom Commands:"]
+            lines.extend(f"  {command:<20} {description}" for command, description in self.custom_commands.items())
+            
+            lines.extend(["", "Default Commands (cmd2):"])
+            # Fetch all commands and filter out the custom ones
+            default_commands = set(self.get_all_commands()) - self.custom_commands.keys()
+            lines.extend(f"  {command:<20} {self.get_command_description(command)}" for command in sorted(default_commands))
+            self._help_text = "\n".join(lines)
+        print(self._help_text)
 
     def get_command_description(self, command_name):
         'Helper function to return command descriptions for default commands'
         func = getattr(self, f'do_{command_name}', None)
         if func and func.__doc__:
-            return (func.__doc__.splitlines()[0])
+            return func.__doc__.partition('\n')[0]
         return "No documentation available."
 
     # Start/Stop feeding cycle
@@ -7711,11 +8731,11 @@ class HydroponicsConsole(Cmd):
         self._post_control_command('stop_emptying_water')
 
     def _post_control_command(self, command):
-        if self.selected_device not in devices:
+        device_info = devices.get(self.selected_device)
+        if device_info is None:
             print(f"Device '{self.selected_device}' is not available.")
             return
-        device_info = devices[self.selected_device]
-        url = f"https://{device_info['address']}:{device_info['port']}/api/control/{command}"
+        url = f"{device_info['base_url']}/api/control/{command}"
         try:
             response = self.session.post(url, timeout=5)
             response.raise_for_status()
@@ -7723,16 +8743,26 @@ class HydroponicsConsole(Cmd):
         except Exception as e:
             print(f"Error sending control command '{command}' to device '{self.selected_device}': {e}")
 
+    def do_cache_stats(self, arg):
+        'Show hit/miss counts for the device response caches: cache_stats'
+        if not cache_stats:
+            print("No cache lookups yet.")
+            return
+        for name, (hits, misses) in sorted(cache_stats.items()):
+            total = hits + misses
+            print(f"  {name:<16} {hits:>6} hits  {misses:>6} misses  ({100.0 * hits / total:.0f}% hit rate)")
+
     def do_rescan(self, arg):
-        'Re-initialize Zeroconf to discover devices again.'
-        global devices
-        devices.clear()
+        'Restart Zeroconf browsing to discover devices again.'
+        # Keep the Zeroconf instance (and its multicast sockets); only the browser restarts
         try:
-            self.zeroconf.close()
-        except:
+            self.browser.cancel()
+        except Exception:
             pass
-        self.zeroconf = Zeroconf()
-        self.listener = HydroponicsServiceListener(self)
+        with devices_lock:
+            devices.clear()
+            device_order.clear()
+        devices_changed.set()
         self.browser = ServiceBrowser(self.zeroconf, "_hydroponics._tcp.local.", self.listener)
         print("Restarted Zeroconf discovery.")
 
@@ -7740,17 +8770,32 @@ class HydroponicsConsole(Cmd):
     # Background Polling
     # --------------------------------------------------------------------------
     def poll_sensors(self):
-        while True:
-            time.sleep(self.polling_interval)
-            if not self.selected_device:
-                continue
+        # Bound once; these objects live as long as the console
+        session = self.session
+        flow_status = self.flow_status
+        stop_polling = self._stop_polling
+        device_selected = self._device_selected_evt
+        interval = self.polling_interval
+        last_digest = None
+        while not stop_polling.wait(interval):
+            # No requests at all while nothing is selected, but still notice shutdown
+            while not device_selected.wait(1.0):
+                if stop_polling.is_set():
+                    return
             device_info = devices.get(self.selected_device)
             if not device_info:
                 continue
-            url = f"https://{device_info['address']}:{device_info['port']}/api/sensors"
+            url = f"{device_info['base_url']}/api/sensors"
             try:
-                response = self.session.get(url, timeout=5)
+                response = session.get(url, timeout=5)
                 response.raise_for_status()
+                digest = hash(response.content)
+                if digest == last_digest:
+                    # Same readings as last time: back off until something changes
+                    interval = min(interval * 1.5, self.max_polling_interval)
+                    continue
+                last_digest = digest
+                interval = self.polling_interval
                 data = response.json()
 
                 # Extract and display system status
@@ -7763,17 +8808,17 @@ class HydroponicsConsole(Cmd):
                 for sensor_data in data.get('sensors_data', []):
                     flowmeter = sensor_data.get('flowmeter')
                     flow_rate = sensor_data.get('flow_rate_L_min', 0.0)
-                    previous_status = self.flow_status.get(flowmeter, False)
+                    previous_status = flow_status.get(flowmeter, False)
                     current_status = flow_rate > 0.0
 
                     if not previous_status and current_status:
                         # Flow started
-                        self.flow_status[flowmeter] = True
+                        flow_status[flowmeter] = True
                         print(f"\nFlow started on {flowmeter} flowmeter.")
 
                     elif previous_status and not current_status:
                         # Flow stopped
-                        self.flow_status[flowmeter] = False
+                        flow_status[flowmeter] = False
                         print(f"\nFlow stopped on {flowmeter} flowmeter.")
 
             except requests.exceptions.RequestException as e:
@@ -7793,10 +8838,10 @@ class HydroponicsConsole(Cmd):
 
     def do_showschedules(self, arg):
         'Print current LED, planter & air schedules on the selected device'
-        if not self._check_device_selected():
+        info = self._check_device_selected()
+        if info is None:
             return
-        info = devices[self.selected_device]
-        url = f"https://{info['address']}:{info['port']}/api/schedules"
+        url = f"{info['base_url']}/api/schedules"
         try:
             resp = self.session.get(url, timeout=5)
             if resp.status_code == 200:
@@ -7816,47 +8861,91 @@ def create_device_selector_gui():
     Returns the selected device name, or None if cancelled.
     """
     selected_device = None
+    watch_id = None  # Pending watch_devices() callback
+    status_reset_id = None  # Pending show_device_count() after a selection hint
+    
+    def close():
+        nonlocal watch_id, status_reset_id
+        if watch_id is not None:
+            root.after_cancel(watch_id)
+            watch_id = None
+        if status_reset_id is not None:
+            root.after_cancel(status_reset_id)
+            status_reset_id = None
+        root.destroy()
     
     def on_select():
-        nonlocal selected_device
+        nonlocal selected_device, status_reset_id
         selection = device_listbox.curselection()
         if selection:
             index = selection[0]
             selected_device = device_names[index]
-            root.destroy()
+            close()
         else:
-            tk.messagebox.showwarning("No Selection", "Please select a device from the list")
+            # Inline hint instead of a modal box, so the dialog keeps updating
+            status_label.config(text="⚠️ Please select a device from the list", fg="#c0392b")
+            root.bell()
+            if status_reset_id is not None:
+                root.after_cancel(status_reset_id)  # Clicking again restarts the 2s hint
+            status_reset_id = root.after(2000, reset_status)
+    
+    def reset_status():
+        nonlocal status_reset_id
+        status_reset_id = None
+        show_device_count()
     
     def on_cancel():
         nonlocal selected_device
         selected_device = None
-        root.destroy()
+        close()
     
     def refresh_devices():
-        """Refresh the device list"""
-        device_listbox.delete(0, tk.END)
-        device_names.clear()
+        """Refresh the device list, rewriting only the rows that changed"""
+        with devices_lock:
+            listed = [(name, devices[name]) for name in device_order]
+        
+        rows = [info['display'] for _, info in listed]
+        if not rows:
+            rows = ["No devices found. Waiting for discovery..."]
+        if rows == shown_rows:
+            return
+        
+        selection = device_listbox.curselection()
+        selected_name = device_names[selection[0]] if selection and selection[0] < len(device_names) else None
+        device_names[:] = [name for name, _ in listed]
         
-        if not devices:
-            device_listbox.insert(tk.END, "No devices found. Waiting for discovery...")
+        # Rows are in discovery order, so an add or remove only touches a few rows
+        sync_listbox(device_listbox, shown_rows, rows)
+        
+        if selected_name in device_names:
+            device_listbox.selection_set(device_names.index(selected_name))
+        
+        if len(listed) != shown_count[0]:
+            shown_count[0] = len(listed)
+            if status_reset_id is None:  # Otherwise reset_status shows the new count
+                show_device_count()
+    
+    def show_device_count():
+        if not device_names:
             status_label.config(text="🔍 Scanning for devices...", fg="#e67e22")
         else:
-            for name, info in devices.items():
-                device_names.append(name)
-                display_text = f"🌱 {name} ({info['address']}:{info['port']})"
-                device_listbox.insert(tk.END, display_text)
-            status_label.config(text=f"✅ Found {len(devices)} device(s)", fg="#27ae60")
+            status_label.config(text=f"✅ Found {len(device_names)} device(s)", fg="#27ae60")
     
-    def auto_refresh():
-        """Automatically refresh device list every 2 seconds"""
-        refresh_devices()
-        root.after(2000, auto_refresh)
+    def watch_devices():
+        """Redraw when discovery reports a change (the flag is set off the Tk thread)"""
+        nonlocal watch_id
+        if devices_changed.is_set():
+            devices_changed.clear()
+            refresh_devices()
+        watch_id = root.after(250, watch_devices)
     
     # Create main window
     root = tk.Tk()
     root.title("GrowPod Device Selector")
     root.geometry("600x520")
     root.minsize(550, 500)
+    # Closing the window is the same as Cancel
+    root.protocol("WM_DELETE_WINDOW", on_cancel)
     
     # Bring to front
     root.lift()
@@ -7871,7 +8960,7 @@ def create_device_selector_gui():
     title_label = tk.Label(
         header_frame,
         text="🌱 GrowPod Device Selector",
-        font=("Arial", 16, "bold"),
+        font=FONT_HEADER,
         bg="#2c3e50",
         fg="white"
     )
@@ -7880,7 +8969,7 @@ def create_device_selector_gui():
     subtitle_label = tk.Label(
         header_frame,
         text="Select a device to manage",
-        font=("Arial", 10),
+        font=FONT_LABEL,
         bg="#2c3e50",
         fg="#bdc3c7"
     )
@@ -7894,7 +8983,7 @@ def create_device_selector_gui():
     instructions = tk.Label(
         content_frame,
         text="Scanning for GrowPod devices on the local network...",
-        font=("Arial", 10),
+        font=FONT_LABEL,
         fg="#555"
     )
     instructions.pack(pady=(0, 10))
@@ -7909,7 +8998,7 @@ def create_device_selector_gui():
     
     device_listbox = tk.Listbox(
         list_frame,
-        font=("Arial", 11),
+        font=FONT_BUTTON,
         selectmode=tk.SINGLE,
         yscrollcommand=scrollbar.set,
         height=10
@@ -7921,9 +9010,11 @@ def create_device_selector_gui():
     device_listbox.bind('<Double-Button-1>', lambda e: on_select())
     
     device_names = []
+    shown_rows = []  # Listbox rows as last drawn
+    shown_count = [None]  # Device count the status label shows
     
     # Status label
-    status_label = tk.Label(content_frame, text="🔍 Scanning...", font=("Arial", 10))
+    status_label = tk.Label(content_frame, text="🔍 Scanning...", font=FONT_LABEL)
     status_label.pack(pady=10)
     
     # Buttons frame
@@ -7934,7 +9025,7 @@ def create_device_selector_gui():
         button_frame,
         text="🔄 Refresh",
         command=refresh_devices,
-        font=("Arial", 11),
+        font=FONT_BUTTON,
         padx=15,
         pady=8
     )
@@ -7944,7 +9035,7 @@ def create_device_selector_gui():
         button_frame,
         text="✅ Select Device",
         command=on_select,
-        font=("Arial", 11, "bold"),
+        font=FONT_BUTTON_BOLD,
         bg="#27ae60",
         fg="white",
         padx=20,
@@ -7956,7 +9047,7 @@ def create_device_selector_gui():
         button_frame,
         text="❌ Cancel",
         command=on_cancel,
-        font=("Arial", 11),
+        font=FONT_BUTTON,
         padx=15,
         pady=8
     )
@@ -7966,14 +9057,15 @@ def create_device_selector_gui():
     help_text = tk.Label(
         content_frame,
         text="💡 Tip: Double-click a device to select it quickly",
-        font=("Arial", 9),
+        font=FONT_SMALL,
         fg="#999"
     )
     help_text.pack()
     
-    # Initial refresh and start auto-refresh
+    # Initial refresh, then redraw only when discovery changes the device list
+    devices_changed.clear()
     refresh_devices()
-    auto_refresh()
+    watch_devices()
     
     root.mainloop()
     
@@ -7988,6 +9080,17 @@ def start_service_discovery(console):
     console.browser = browser
     return zeroconf
 
+def stop_service_discovery(console, timeout=2.0):
+    """Cancel browsing and close Zeroconf, giving up after `timeout` seconds so a slow
+    multicast socket can't hold up exit"""
+    try:
+        console.browser.cancel()
+    except Exception:
+        pass
+    closer = threading.Thread(target=console.zeroconf.close, name="zeroconf-close", daemon=True)
+    closer.start()
+    closer.join(timeout)
+
 def main():
     """
     Main entry point - launches GUI mode by default.
@@ -8001,8 +9104,8 @@ def main():
     # Create the console instance
     console = HydroponicsConsole()
 
-    # Start mDNS service discovery
-    zeroconf = start_service_discovery(console)
+    # Start mDNS service discovery (one Zeroconf instance for the whole run; rescan reuses it)
+    start_service_discovery(console)
     
     if console_mode:
         # Traditional console mode
@@ -8012,15 +9115,16 @@ def main():
         except KeyboardInterrupt:
             print("\nExiting Hydroponics console.")
         finally:
-            zeroconf.close()
+            console.shutdown()
+            stop_service_discovery(console)
             scheduler.shutdown()
     else:
         # GUI mode (default)
         print("🚀 Starting GrowPod Control GUI...")
         print("🔍 Scanning for devices...")
         
-        # Wait a moment for device discovery to start
-        time.sleep(2)
+        # Give discovery up to 2 s, but open the selector as soon as a device answers
+        console.listener.first_seen.wait(timeout=2.0)
         
         # Show device selector
         selected_device = create_device_selector_gui()
@@ -8039,7 +9143,8 @@ def main():
             print("\n❌ No device selected. Exiting.")
         
         # Cleanup
-        zeroconf.close()
+        console.shutdown()
+        stop_service_discovery(console)
         scheduler.shutdown()
 
 if __name__ == '__main__':